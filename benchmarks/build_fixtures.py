@@ -0,0 +1,419 @@
+"""Build the benchmark fixtures and the mock server's routing manifest.
+
+By default fixtures are generated deterministically from markup modelled on
+what each adapter's selectors target. ``--record QUERY`` replaces the first
+result page of each adapter with a live capture instead.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import random
+import sys
+from typing import Any, Callable, Dict, List
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+FIXTURES_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fixtures")
+
+CARDS = ("Charizard", "Blastoise", "Venusaur", "Pikachu", "Mewtwo", "Umbreon", "Gengar", "Lugia")
+SETS = (
+    ("Base Set", "102"),
+    ("Base Set 2", "130"),
+    ("Jungle", "64"),
+    ("Fossil", "62"),
+    ("Evolving Skies", "203"),
+    ("Celebrations", "25"),
+)
+EXTRAS = ("", "Holo", "1st Edition", "Shadowless", "PSA 9", "PSA 10", "CGC 8.5", "Lightly Played", "Near Mint")
+
+# Inline script/nav noise so pages weigh roughly what the real ones do.
+PAGE_NOISE = (
+    "<script>window.__STATE__ = " + json.dumps({"config": ["x" * 64] * 120}) + ";</script>"
+    + "<nav>" + "".join(f'<a href="/c/{index}">Category {index}</a>' for index in range(80)) + "</nav>"
+)
+
+
+def listing_rows(seed: int, count: int) -> List[Dict[str, Any]]:
+    rng = random.Random(seed)
+    rows = []
+    for index in range(count):
+        card = rng.choice(CARDS)
+        set_name, total = rng.choice(SETS)
+        number = rng.randint(1, int(total))
+        extra = rng.choice(EXTRAS)
+        title = " ".join(part for part in (card, set_name, f"{number}/{total}", extra) if part)
+        price = round(rng.lognormvariate(3.5, 1.1), 2)
+        rows.append({"id": seed * 1000 + index, "title": title, "price": price, "slug": f"{card}-{seed}-{index}".lower()})
+    return rows
+
+
+def page(body: str) -> str:
+    return f"<!doctype html><html><head><title>Search</title></head><body>{PAGE_NOISE}{body}</body></html>"
+
+
+def ebay_page(rows: List[Dict[str, Any]], sold: bool = False) -> str:
+    items = "".join(
+        '<li class="s-item"><div class="s-item__info">'
+        f'<a class="s-item__link" href="https://www.ebay.com/itm/{row["id"]}?hash=item{row["id"]:x}&amp;_trksid=p2">'
+        f'<h3 class="s-item__title">{"Sold " if sold else ""}{row["title"]}</h3></a>'
+        f'<div class="s-item__detail"><span class="s-item__price">${row["price"]:,.2f}</span></div>'
+        '<span class="s-item__shipping">+$4.99 shipping</span></div></li>'
+        for row in rows
+    )
+    return page(f'<div class="srp-results"><ul>{items}</ul></div><div class="s-pagination"></div>')
+
+
+def tcgplayer_page(rows: List[Dict[str, Any]]) -> str:
+    items = "".join(
+        '<div class="search-result">'
+        f'<a href="/product/{row["id"]}/pokemon-{row["slug"]}"><span class="search-result__title">{row["title"]}</span></a>'
+        f'<span class="search-result__market-price--value">${row["price"]:,.2f}</span></div>'
+        for row in rows
+    )
+    return page(f'<section class="search-layout__content">{items}</section>')
+
+
+def tcgplayer_api(rows: List[Dict[str, Any]]) -> str:
+    """Response of the marketplace search API behind tcgplayer.com search."""
+    products = [
+        {
+            "productId": float(row["id"]),
+            "productName": row["title"],
+            "productLineName": "Pokemon",
+            "productLineUrlName": "Pokemon",
+            "productUrlName": row["slug"],
+            "setUrlName": "",
+            "rarityName": "Holo Rare",
+            "marketPrice": row["price"],
+            "lowestPrice": round(row["price"] * 0.92, 2),
+            "lowestPriceWithShipping": round(row["price"] * 0.92 + 1.27, 2),
+            "totalListings": 7,
+            "customAttributes": {},
+        }
+        for row in rows
+    ]
+    block = {"totalResults": len(rows), "resultId": "bench", "algorithm": "sales_synonym_v2", "results": products}
+    return json.dumps({"errors": [], "results": [block]})
+
+
+def euro(price: float) -> str:
+    return f"{price:,.2f}".replace(",", "_").replace(".", ",").replace("_", ".") + " €"
+
+
+def cardmarket_page(rows: List[Dict[str, Any]]) -> str:
+    items = "".join(
+        '<div class="row">'
+        f'<div class="col-product"><a href="/en/Pokemon/Products/Singles/{row["slug"]}">{row["title"]}</a></div>'
+        f'<div class="col-price">{euro(row["price"])}</div></div>'
+        for row in rows
+    )
+    return page(f'<div class="table-body">{items}</div>')
+
+
+def cardmarket_api(rows: List[Dict[str, Any]]) -> str:
+    """MKM API v2.0 ``products/find`` response with price guides."""
+    products = [
+        {
+            "idProduct": row["id"],
+            "enName": row["title"],
+            "locName": row["title"],
+            "expansionName": "",
+            "website": f"/en/Pokemon/Products/Singles/{row['slug']}",
+            "priceGuide": {
+                "SELL": row["price"],
+                "LOW": round(row["price"] * 0.8, 2),
+                "LOWEX+": round(row["price"] * 0.85, 2),
+                "AVG": row["price"],
+                "TREND": round(row["price"] * 1.02, 2),
+            },
+        }
+        for row in rows
+    ]
+    return json.dumps({"product": products})
+
+
+def coolstuffinc_page(rows: List[Dict[str, Any]]) -> str:
+    items = "".join(
+        '<div class="prod_box">'
+        f'<div class="prod_name"><a href="/p/{row["id"]}">{row["title"]}</a></div>'
+        f'<span class="regular_price">${row["price"]:,.2f}</span></div>'
+        for row in rows
+    )
+    return page(items)
+
+
+def toysonfire_page(rows: List[Dict[str, Any]]) -> str:
+    items = "".join(
+        '<div class="product-item">'
+        f'<a class="product-item__title" href="/shop/product/{row["slug"]}">{row["title"]}</a>'
+        f'<span class="product-item__price">C${row["price"]:,.2f}</span></div>'
+        for row in rows
+    )
+    return page(items)
+
+
+def shopify_suggest(rows: List[Dict[str, Any]]) -> str:
+    products = [
+        {
+            "id": row["id"],
+            "title": row["title"],
+            "handle": row["slug"],
+            "url": f"/products/{row['slug']}?_pos=1&_sid=abc&_ss=r",
+            "price": f"{row['price']:.2f}",
+            "price_min": f"{row['price']:.2f}",
+            "available": True,
+        }
+        for row in rows
+    ]
+    return json.dumps({"resources": {"results": {"products": products}}})
+
+
+def shopify_search_page(rows: List[Dict[str, Any]]) -> str:
+    items = "".join(
+        '<li class="grid__item"><div class="card-wrapper">'
+        f'<h3 class="card__heading"><a class="full-unstyled-link" href="/products/{row["slug"]}">{row["title"]}</a></h3>'
+        f'<span class="price-item price-item--regular">Rs. {row["price"] * 80:,.2f}</span></div></li>'
+        for row in rows
+    )
+    return page(f'<ul class="product-grid">{items}</ul>')
+
+
+def shopify_products(rows: List[Dict[str, Any]]) -> str:
+    products = [
+        {
+            "id": row["id"],
+            "title": row["title"],
+            "handle": row["slug"],
+            "variants": [{"id": row["id"] * 10, "price": f"{row['price']:.2f}", "available": True}],
+        }
+        for row in rows
+    ]
+    return json.dumps({"products": products})
+
+
+def woocommerce_products(rows: List[Dict[str, Any]]) -> str:
+    products = [
+        {
+            "id": row["id"],
+            "name": row["title"],
+            "permalink": f"https://beyondgaming.in/product/{row['slug']}/",
+            "prices": {
+                "price": str(int(row["price"] * 8000)),
+                "regular_price": str(int(row["price"] * 8000)),
+                "sale_price": str(int(row["price"] * 8000)),
+                "currency_code": "INR",
+                "currency_minor_unit": 2,
+            },
+        }
+        for row in rows
+    ]
+    return json.dumps(products)
+
+
+def pokevolt_page(rows: List[Dict[str, Any]]) -> str:
+    items = "".join(
+        '<li data-hook="product-list-grid-item"><div>'
+        f'<a href="https://www.pokevolt.shop/product-page/{row["slug"]}" data-hook="product-item-container">'
+        f'<p data-hook="product-item-name">{row["title"]}</p></a>'
+        f'<span data-hook="product-item-price-to-pay">₹{row["price"] * 80:,.2f}</span></div></li>'
+        for row in rows
+    )
+    return page(f'<ul data-hook="product-list-wrapper">{items}</ul>')
+
+
+def json_ld_page(rows: List[Dict[str, Any]]) -> str:
+    """ToysOnFire markup that also carries a schema.org ItemList."""
+    item_list = {
+        "@context": "https://schema.org",
+        "@type": "ItemList",
+        "itemListElement": [
+            {
+                "@type": "ListItem",
+                "position": index + 1,
+                "item": {
+                    "@type": "Product",
+                    "name": row["title"],
+                    "url": f"/shop/product/{row['slug']}",
+                    "offers": {"@type": "Offer", "price": f"{row['price']:.2f}", "priceCurrency": "CAD"},
+                },
+            }
+            for index, row in enumerate(rows)
+        ],
+    }
+    script = f'<script type="application/ld+json">{json.dumps(item_list)}</script>'
+    return toysonfire_page(rows).replace("</body>", f"{script}</body>")
+
+
+def wix_warmup_page(rows: List[Dict[str, Any]]) -> str:
+    """Pokevolt markup with the product catalog in Wix warmup data."""
+    warmup = {
+        "appsWarmupData": {
+            "stores": {
+                "catalog": {
+                    "products": [
+                        {
+                            "id": str(row["id"]),
+                            "name": row["title"],
+                            "urlPart": row["slug"],
+                            "price": round(row["price"] * 80, 2),
+                            "formattedPrice": f"₹{row['price'] * 80:,.2f}",
+                        }
+                        for row in rows
+                    ]
+                }
+            }
+        }
+    }
+    script = f'<script type="application/json" id="wix-warmup-data">{json.dumps(warmup)}</script>'
+    return pokevolt_page(rows).replace("</body>", f"{script}</body>")
+
+
+def js_shell_page(rows: List[Dict[str, Any]]) -> str:
+    """TCGPlayer-style JavaScript shell: the listing markup only exists after the inline script runs."""
+    data = json.dumps([{"id": row["id"], "slug": row["slug"], "title": row["title"], "price": row["price"]} for row in rows])
+    script = (
+        f"const rows = {data};"
+        "document.getElementById('app').innerHTML = rows.map((row) => "
+        "'<div class=\"search-result\"><a href=\"/product/' + row.id + '/pokemon-' + row.slug + '\">' + "
+        "'<span class=\"search-result__title\">' + row.title + '</span></a>' + "
+        "'<img src=\"/images/' + row.id + '.jpg\">' + "
+        "'<span class=\"search-result__market-price--value\">$' + row.price.toFixed(2) + '</span></div>'"
+        ").join('');"
+    )
+    return (
+        "<!doctype html><html><head><title>TCGplayer</title>"
+        '<script async src="https://www.googletagmanager.com/gtag/js?id=G-BENCH"></script></head><body>'
+        "<noscript>We're sorry but TCGplayer doesn't work properly without JavaScript enabled. "
+        "Please enable it to continue.</noscript>"
+        f'<div id="app"></div><script>{script}</script></body></html>'
+    )
+
+
+EMPTY_HTML = page('<div class="srp-results"></div><p>No results found.</p>')
+
+# (path, builder) pairs; every path is relative to FIXTURES_DIR.
+FIXTURES: List[tuple[str, Callable[[], str]]] = [
+    ("ebay/page1.html", lambda: ebay_page(listing_rows(11, 60))),
+    ("ebay/page2.html", lambda: ebay_page(listing_rows(12, 60))),
+    ("ebay/sold1.html", lambda: ebay_page(listing_rows(13, 60), sold=True)),
+    ("tcgplayer/page1.html", lambda: tcgplayer_page(listing_rows(21, 24))),
+    ("tcgplayer/api_search.json", lambda: tcgplayer_api(listing_rows(23, 24))),
+    ("cardmarket/page1.html", lambda: cardmarket_page(listing_rows(31, 30))),
+    ("cardmarket/api_find.json", lambda: cardmarket_api(listing_rows(32, 30))),
+    ("coolstuffinc/page1.html", lambda: coolstuffinc_page(listing_rows(41, 30))),
+    ("toysonfire/page1.html", lambda: toysonfire_page(listing_rows(51, 24))),
+    ("shopify/suggest.json", lambda: shopify_suggest(listing_rows(61, 10))),
+    ("shopify/search1.html", lambda: shopify_search_page(listing_rows(62, 24))),
+    ("shopify/products1.json", lambda: shopify_products(listing_rows(63, 250))),
+    ("shopify/products_empty.json", lambda: shopify_products([])),
+    ("woocommerce/page1.json", lambda: woocommerce_products(listing_rows(71, 40))),
+    ("woocommerce/page2.json", lambda: woocommerce_products(listing_rows(72, 20))),
+    ("pokevolt/shop.html", lambda: pokevolt_page(listing_rows(81, 30))),
+    ("structured/json_ld.html", lambda: json_ld_page(listing_rows(51, 24))),
+    ("structured/wix_warmup.html", lambda: wix_warmup_page(listing_rows(81, 30))),
+    ("js/tcgplayer_shell.html", lambda: js_shell_page(listing_rows(22, 24))),
+    ("empty.html", lambda: EMPTY_HTML),
+]
+
+# Routing for the mock server: first entry whose host, path and ``when``
+# query params match wins. ``pages`` maps the ``page_param`` value
+# (default "1") to a fixture; pages not listed get ``empty``.
+MANIFEST: Dict[str, Any] = {
+    "routes": [
+        {"host": "www.ebay.com", "path": "/sch/i.html", "when": {"LH_Sold": "1"}, "page_param": "_pgn",
+         "pages": {"1": "ebay/sold1.html"}, "empty": "empty.html"},
+        {"host": "www.ebay.com", "path": "/sch/i.html", "page_param": "_pgn",
+         "pages": {"1": "ebay/page1.html", "2": "ebay/page2.html"}, "empty": "empty.html"},
+        {"host": "www.tcgplayer.com", "path": "/search/all/product", "when": {"view": "js"}, "page_param": "page",
+         "pages": {"1": "js/tcgplayer_shell.html"}, "empty": "empty.html"},
+        {"host": "www.tcgplayer.com", "path": "/search/all/product", "page_param": "page",
+         "pages": {"1": "tcgplayer/page1.html"}, "empty": "empty.html"},
+        {"host": "mp-search-api.tcgplayer.com", "path": "/v1/search/request", "pages": {"1": "tcgplayer/api_search.json"},
+         "content_type": "application/json"},
+        {"host": "api.cardmarket.com", "path": "/ws/v2.0/output.json/products/find",
+         "pages": {"1": "cardmarket/api_find.json"}, "content_type": "application/json"},
+        {"host": "www.cardmarket.com", "path": "/en/Pokemon/Products/Search", "page_param": "site",
+         "pages": {"1": "cardmarket/page1.html"}, "empty": "empty.html"},
+        {"host": "www.coolstuffinc.com", "path": "/main_search.php", "page_param": "page",
+         "pages": {"1": "coolstuffinc/page1.html"}, "empty": "empty.html"},
+        {"host": "www.toysonfire.ca", "path": "/shop/search", "pages": {"1": "toysonfire/page1.html"}},
+        {"host": "*", "path": "/search/suggest.json", "pages": {"1": "shopify/suggest.json"},
+         "content_type": "application/json"},
+        {"host": "*", "path": "/products.json", "page_param": "page", "pages": {"1": "shopify/products1.json"},
+         "empty": "shopify/products_empty.json", "content_type": "application/json"},
+        {"host": "*", "path": "/search", "page_param": "page", "pages": {"1": "shopify/search1.html"},
+         "empty": "empty.html"},
+        {"host": "beyondgaming.in", "path": "/wp-json/wc/store/v1/products", "page_param": "page",
+         "pages": {"1": "woocommerce/page1.json", "2": "woocommerce/page2.json"},
+         "content_type": "application/json", "headers": {"X-WP-TotalPages": "2", "X-WP-Total": "60"}},
+        {"host": "www.pokevolt.shop", "path": "/shop", "pages": {"1": "pokevolt/shop.html"}},
+    ]
+}
+
+
+def write(path: str, body: str) -> None:
+    full_path = os.path.join(FIXTURES_DIR, path)
+    os.makedirs(os.path.dirname(full_path), exist_ok=True)
+    with open(full_path, "w", encoding="utf-8") as handle:
+        handle.write(body)
+
+
+def record(query: str) -> None:
+    """Overwrite each adapter's first-page fixture with a live capture."""
+    from collector_scraper.scrapers import (
+        CardmarketScraper,
+        CoolStuffIncScraper,
+        EbayScraper,
+        PokedexScraper,
+        PokevoltScraper,
+        TCGPlayerScraper,
+        ToysOnFireScraper,
+    )
+    from collector_scraper.scrapers.beyondgaming import BeyondGamingScraper
+
+    pokevolt = PokevoltScraper()
+    tcgplayer = TCGPlayerScraper()
+    # (fixture, adapter, url, JSON body to POST or None to GET)
+    targets = [
+        ("ebay/page1.html", EbayScraper(), EbayScraper().build_search_url(query), None),
+        ("ebay/sold1.html", EbayScraper(), EbayScraper().build_sold_url(query, 1), None),
+        ("tcgplayer/page1.html", tcgplayer, tcgplayer.build_search_url(query), None),
+        ("tcgplayer/api_search.json", tcgplayer, tcgplayer.build_api_url(query), tcgplayer.build_api_body(1)),
+        ("cardmarket/page1.html", CardmarketScraper(), CardmarketScraper().build_search_url(query), None),
+        ("coolstuffinc/page1.html", CoolStuffIncScraper(), CoolStuffIncScraper().build_search_url(query), None),
+        ("toysonfire/page1.html", ToysOnFireScraper(), ToysOnFireScraper().build_search_url(query), None),
+        ("shopify/suggest.json", PokedexScraper(), PokedexScraper().build_predictive_url(query), None),
+        ("shopify/search1.html", PokedexScraper(), PokedexScraper().build_page_url(query, 1), None),
+        ("woocommerce/page1.json", BeyondGamingScraper(), BeyondGamingScraper().build_search_url(query), None),
+        ("pokevolt/shop.html", pokevolt, f"{pokevolt.base_url}/shop", None),
+    ]
+    for path, scraper, url, body in targets:
+        try:
+            response = scraper._request(url, json_body=body)
+        except Exception as exc:
+            print(f"  ! {path}: {exc}")
+            continue
+        write(path, response.text)
+        print(f"  recorded {path} ({len(response.content)} bytes)")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--record", metavar="QUERY", help="Capture live first pages for QUERY after generating")
+    args = parser.parse_args()
+
+    for path, build in FIXTURES:
+        write(path, build())
+    with open(os.path.join(FIXTURES_DIR, "manifest.json"), "w", encoding="utf-8") as handle:
+        json.dump(MANIFEST, handle, indent=2)
+    print(f"Wrote {len(FIXTURES)} fixtures to {FIXTURES_DIR}")
+
+    if args.record:
+        record(args.record)
+
+
+if __name__ == "__main__":
+    main()
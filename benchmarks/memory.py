@@ -0,0 +1,138 @@
+"""Memory benchmark: peak RSS of many concurrent HTML searches against the mock server, each in a fresh interpreter."""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import resource
+import subprocess
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+REPO_DIR = os.path.dirname(BENCH_DIR)
+sys.path.insert(0, REPO_DIR)
+
+from benchmarks.mock_server import MockSiteServer, route_to_mock  # noqa: E402
+from benchmarks.run_benchmarks import RESULTS_DIR, baseline_result, git_revision, save_report  # noqa: E402
+
+MEMORY_RESULTS_DIR = os.path.join(RESULTS_DIR, "memory")
+# HTML-heavy sources; TCGPlayer is kept on its HTML path so every search parses a full page.
+SOURCES = ("ebay", "tcgplayer", "cardmarket", "coolstuffinc", "toysonfire", "pokedex")
+
+
+def rss_mb() -> float:
+    # ru_maxrss is in KB on Linux and bytes on macOS.
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return round(peak / (1e6 if sys.platform == "darwin" else 1e3), 1)
+
+
+def probe(target: str, workers: int, searches: int, query: str) -> Dict[str, Any]:
+    """Run in the child: ``workers`` threads, each searching every source ``searches`` times."""
+    from collector_scraper.scrapers import build_scrapers
+
+    def build() -> list:
+        scrapers = build_scrapers(SOURCES)
+        for scraper in scrapers:
+            scraper.api_enabled = False
+            route_to_mock(scraper, target)
+        return scrapers
+
+    for scraper in build():  # imports, regexes and caches, so they aren't counted below
+        scraper.search(query)
+    baseline = rss_mb()
+
+    def work(_: int) -> int:
+        count = 0
+        for scraper in build() * searches:
+            try:
+                count += len(scraper.search(query))
+            except Exception:
+                pass
+        return count
+
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        items = sum(executor.map(work, range(workers)))
+    return {
+        "baseline_rss_mb": baseline,
+        "peak_rss_mb": rss_mb(),
+        "growth_mb": round(rss_mb() - baseline, 1),
+        "wall_s": round(time.perf_counter() - started, 3),
+        "items": items,
+    }
+
+
+def run_probe(target: str, workers: int, searches: int, query: str) -> Dict[str, Any]:
+    completed = subprocess.run(
+        [sys.executable, os.path.abspath(__file__), "--probe", target, "--workers", str(workers),
+         "--searches", str(searches), "--query", query],
+        cwd=REPO_DIR,
+        check=True,
+        capture_output=True,
+        text=True,
+    )
+    return json.loads(completed.stdout.strip().splitlines()[-1])
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--workers", default="1,20", help="Concurrent worker counts to measure (default: 1,20)")
+    parser.add_argument("--searches", type=int, default=1, help="Searches per source per worker (default: 1)")
+    parser.add_argument("--query", default="charizard base set", help="Query every search uses")
+    parser.add_argument("--latency-ms", type=float, default=20.0, help="Mock server latency (default: 20)")
+    parser.add_argument("--page-kb", type=int, default=100, help="Extra markup per HTML page (default: 100)")
+    parser.add_argument("--probe", metavar="URL", help=argparse.SUPPRESS)
+    parser.add_argument("--no-save", action="store_true", help="Print results without storing them")
+    parser.add_argument(
+        "--save-baseline",
+        action="store_true",
+        help="Also store this run as the baseline later runs compare with",
+    )
+    args = parser.parse_args()
+
+    if args.probe:
+        print(json.dumps(probe(args.probe, int(args.workers), args.searches, args.query)))
+        return
+
+    with MockSiteServer(latency_ms=args.latency_ms, pad_kb=args.page_kb) as server:
+        cases = {
+            count: run_probe(server.url, int(count), args.searches, args.query)
+            for count in args.workers.split(",")
+            if count
+        }
+    report = {
+        "meta": {
+            "revision": git_revision(),
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "page_kb": args.page_kb,
+            "searches": args.searches,
+        },
+        "cases": cases,
+    }
+
+    print("Peak RSS (baseline / peak / growth MB, wall s, items):")
+    for count, stats in cases.items():
+        print(
+            f"  {count:>4} workers  {stats['baseline_rss_mb']:>7.1f} {stats['peak_rss_mb']:>7.1f} "
+            f"{stats['growth_mb']:>7.1f}  {stats['wall_s']:>7.3f}  {stats['items']:>6}"
+        )
+
+    baseline_path = baseline_result(MEMORY_RESULTS_DIR)
+    if not args.no_save:
+        save_report(report, MEMORY_RESULTS_DIR, as_baseline=args.save_baseline)
+    if baseline_path:
+        with open(baseline_path, "r", encoding="utf-8") as handle:
+            baseline = json.load(handle)
+        print(f"Compared with {baseline['meta']['revision']}:")
+        for count, stats in cases.items():
+            before = baseline["cases"].get(count)
+            if before:
+                print(f"  {count:>4} workers  growth {before['growth_mb']:>7.1f} -> {stats['growth_mb']:>7.1f} MB")
+
+
+if __name__ == "__main__":
+    main()
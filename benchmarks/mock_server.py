@@ -0,0 +1,176 @@
+"""Local HTTP server that replays benchmark fixtures with injected latency and errors."""
+
+from __future__ import annotations
+
+import json
+import os
+import random
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, Tuple
+from urllib.parse import parse_qs, urlsplit
+
+from requests.adapters import HTTPAdapter
+
+FIXTURES_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fixtures")
+
+
+class MockSiteServer:
+    """Serve ``/<host><path>?<query>`` from the fixture manifest.
+
+    Every response waits ``latency_ms`` plus up to ``jitter_ms``; a share
+    ``error_rate`` of requests gets a 503 instead, which exercises the
+    adapters' urllib3 retry path. ``pad_kb`` adds that much navigation
+    markup to every HTML page, to bring fixtures up to real page weight.
+    """
+
+    def __init__(
+        self,
+        fixtures_dir: str = FIXTURES_DIR,
+        latency_ms: float = 0.0,
+        jitter_ms: float = 0.0,
+        error_rate: float = 0.0,
+        seed: int = 0,
+        host: str = "127.0.0.1",
+        port: int = 0,
+        pad_kb: int = 0,
+    ) -> None:
+        self.fixtures_dir = fixtures_dir
+        self.latency_ms = latency_ms
+        self.jitter_ms = jitter_ms
+        self.error_rate = error_rate
+        self.pad_kb = pad_kb
+        self._random = random.Random(seed)
+        self._random_lock = threading.Lock()
+        with open(os.path.join(fixtures_dir, "manifest.json"), "r", encoding="utf-8") as handle:
+            self.routes = json.load(handle)["routes"]
+        self._bodies: Dict[str, bytes] = {}
+        self.requests_served = 0
+        self.errors_injected = 0
+
+        self._server = ThreadingHTTPServer((host, port), self._handler_class())
+        self._server.daemon_threads = True
+        self._thread: threading.Thread | None = None
+
+    @property
+    def url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self) -> "MockSiteServer":
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+
+    def __enter__(self) -> "MockSiteServer":
+        return self.start()
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.stop()
+
+    def _body(self, path: str) -> bytes:
+        body = self._bodies.get(path)
+        if body is None:
+            with open(os.path.join(self.fixtures_dir, path), "rb") as handle:
+                body = handle.read()
+            if self.pad_kb and path.endswith(".html"):
+                link = b'<li class="menu__item"><a href="/collections/all">All products</a></li>'
+                padding = b"<ul>" + link * (self.pad_kb * 1024 // len(link)) + b"</ul>"
+                body = body.replace(b"</body>", padding + b"</body>", 1)
+            self._bodies[path] = body
+        return body
+
+    def resolve(self, host: str, path: str, query: str) -> Tuple[int, bytes, Dict[str, str]]:
+        params = {name: values[0] for name, values in parse_qs(query).items()}
+        for route in self.routes:
+            if route["host"] not in ("*", host) or route["path"] != path:
+                continue
+            if any(params.get(name) != value for name, value in route.get("when", {}).items()):
+                continue
+            page = params.get(route.get("page_param", ""), "1")
+            fixture = route["pages"].get(page) or route.get("empty")
+            if fixture is None:
+                break
+            headers = {"Content-Type": route.get("content_type", "text/html; charset=utf-8")}
+            headers.update(route.get("headers", {}))
+            return 200, self._body(fixture), headers
+        return 404, b"not found", {"Content-Type": "text/plain"}
+
+    def _delay_and_fault(self) -> Tuple[float, bool]:
+        with self._random_lock:
+            jitter = self._random.uniform(0, self.jitter_ms) if self.jitter_ms > 0 else 0.0
+            fault = self._random.random() < self.error_rate
+        return (self.latency_ms + jitter) / 1000, fault
+
+    def _handler_class(self) -> type:
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def log_message(self, format: str, *args: Any) -> None:  # noqa: A002 - stdlib signature
+                pass
+
+            def do_GET(self) -> None:  # noqa: N802 - stdlib naming
+                delay, fault = server._delay_and_fault()
+                if delay > 0:
+                    time.sleep(delay)
+                parts = urlsplit(self.path)
+                host, _, path = parts.path.lstrip("/").partition("/")
+                if fault:
+                    server.errors_injected += 1
+                    status, body, headers = 503, b"injected error", {"Content-Type": "text/plain"}
+                else:
+                    status, body, headers = server.resolve(host, f"/{path}", parts.query)
+                server.requests_served += 1
+                self.send_response(status)
+                for name, value in headers.items():
+                    self.send_header(name, value)
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def do_POST(self) -> None:  # noqa: N802 - stdlib naming
+                # Search APIs take the query in the body; routes only match on the URL.
+                self.rfile.read(int(self.headers.get("Content-Length") or 0))
+                self.do_GET()
+
+        return Handler
+
+
+def mock_url(target: str, url: str) -> str:
+    """``url`` rewritten to the mock server path that serves it."""
+    parts = urlsplit(url)
+    return f"{target.rstrip('/')}/{parts.netloc}{parts.path}" + (f"?{parts.query}" if parts.query else "")
+
+
+class MockRoutingAdapter(HTTPAdapter):
+    """Transport adapter that sends every request to the mock server instead of the real host."""
+
+    def __init__(self, target: str, **kwargs: Any) -> None:
+        super().__init__(**kwargs)
+        self.target = target.rstrip("/")
+
+    def send(self, request: Any, **kwargs: Any) -> Any:
+        request.url = mock_url(self.target, request.url)
+        return super().send(request, **kwargs)
+
+
+def route_to_mock(scraper: Any, target: str) -> None:
+    """Point ``scraper``'s session at the mock server, keeping its retry policy."""
+    session = scraper._build_session()
+    retries = session.get_adapter("https://").max_retries
+    adapter = MockRoutingAdapter(target, max_retries=retries)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    scraper._session = session
+
+
+def route_browser_to_mock(pool: Any, target: str) -> None:
+    """Serve every page and subresource ``pool`` loads from the mock server."""
+    pool.request_rewriter = lambda url: mock_url(target, url)
@@ -0,0 +1,366 @@
+"""Offline benchmarks: per-adapter parse time and end-to-end orchestrator runs against the mock server."""
+
+from __future__ import annotations
+
+import argparse
+import glob
+import json
+import os
+import platform
+import resource
+import statistics
+import subprocess
+import sys
+import time
+import tracemalloc
+from typing import Any, Callable, Dict, List, Tuple
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.dirname(BENCH_DIR))
+
+from benchmarks.mock_server import (  # noqa: E402
+    FIXTURES_DIR,
+    MockSiteServer,
+    route_browser_to_mock,
+    route_to_mock,
+)
+from collector_scraper.core.browser_pool import BrowserPool  # noqa: E402
+from collector_scraper.core.orchestrator import run_all_scrapers  # noqa: E402
+from collector_scraper.core.shopify_scraper import ShopifyStore, ShopifyStoreEngine  # noqa: E402
+from collector_scraper.scrapers import (  # noqa: E402
+    BeyondGamingScraper,
+    CardmarketScraper,
+    CoolStuffIncScraper,
+    EbayScraper,
+    PokedexScraper,
+    PokevoltScraper,
+    TCGPlayerScraper,
+    ToysOnFireScraper,
+    build_tier1_scrapers,
+)
+
+# Results stay local to the machine that produced them (the directory is git-ignored).
+RESULTS_DIR = os.path.join(BENCH_DIR, "results")
+BASELINE_NAME = "baseline.json"
+
+
+def parse_cases() -> List[Tuple[str, str, Callable[[str], List[Dict[str, Any]]]]]:
+    """``(name, fixture, parse)`` for every adapter family."""
+    shopify = PokedexScraper()
+    woocommerce = BeyondGamingScraper()
+    tcgplayer, cardmarket = TCGPlayerScraper(), CardmarketScraper()
+    return [
+        ("ebay", "ebay/page1.html", EbayScraper()._parse_page),
+        ("ebay:sold", "ebay/sold1.html", EbayScraper().parse_sold),
+        ("tcgplayer", "tcgplayer/page1.html", TCGPlayerScraper()._parse_page),
+        ("tcgplayer:api", "tcgplayer/api_search.json", lambda body: tcgplayer.parse_api_listing(json.loads(body))),
+        ("cardmarket", "cardmarket/page1.html", CardmarketScraper()._parse_page),
+        ("cardmarket:api", "cardmarket/api_find.json", lambda body: cardmarket.parse_api_listing(json.loads(body))),
+        ("coolstuffinc", "coolstuffinc/page1.html", CoolStuffIncScraper()._parse_page),
+        ("toysonfire", "toysonfire/page1.html", ToysOnFireScraper()._parse_page),
+        ("shopify:suggest", "shopify/suggest.json", lambda body: shopify.parse_listing(json.loads(body))),
+        ("shopify:html", "shopify/search1.html", shopify._parse_html_listing),
+        ("shopify:catalog", "shopify/products1.json", lambda body: shopify.parse_catalog(json.loads(body))),
+        ("woocommerce", "woocommerce/page1.json", lambda body: woocommerce.parse_listing(json.loads(body))),
+        ("pokevolt", "pokevolt/shop.html", PokevoltScraper().parse_listing),
+        ("jsonld", "structured/json_ld.html", ToysOnFireScraper()._parse_page),
+        ("wix:warmup", "structured/wix_warmup.html", PokevoltScraper().parse_listing),
+    ]
+
+
+def bench_parse(repeat: int) -> Dict[str, Dict[str, float]]:
+    results: Dict[str, Dict[str, float]] = {}
+    for name, fixture, parse in parse_cases():
+        with open(os.path.join(FIXTURES_DIR, fixture), "r", encoding="utf-8") as handle:
+            body = handle.read()
+        items = parse(body)  # warm-up
+        timings = []
+        for _ in range(repeat):
+            started = time.perf_counter()
+            parse(body)
+            timings.append((time.perf_counter() - started) * 1000)
+        timings.sort()
+        median_ms = statistics.median(timings)
+        results[name] = {
+            "median_ms": round(median_ms, 3),
+            "p90_ms": round(timings[min(len(timings) - 1, int(len(timings) * 0.9))], 3),
+            "items": len(items),
+            "bytes": len(body.encode("utf-8")),
+            "mb_per_s": round(len(body.encode("utf-8")) / 1e6 / (median_ms / 1000), 2) if median_ms else 0.0,
+        }
+    return results
+
+
+def bench_end_to_end(
+    query: str,
+    runs: int,
+    latency_ms: float,
+    jitter_ms: float,
+    error_rate: float,
+) -> Dict[str, Any]:
+    with MockSiteServer(latency_ms=latency_ms, jitter_ms=jitter_ms, error_rate=error_rate) as server:
+        scrapers = build_tier1_scrapers()
+        for scraper in scrapers:
+            route_to_mock(scraper, server.url)
+
+        run_all_scrapers(query, scrapers=scrapers)  # warm sessions and imports
+        walls, items, errors = [], [], []
+        for _ in range(runs):
+            started = time.perf_counter()
+            result = run_all_scrapers(query, scrapers=scrapers)
+            walls.append(time.perf_counter() - started)
+            items.append(len(result.items))
+            errors.append(len(result.errors))
+
+        # Memory is measured on a separate run; tracemalloc slows everything down.
+        tracemalloc.start()
+        run_all_scrapers(query, scrapers=scrapers)
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        requests_served = server.requests_served
+        errors_injected = server.errors_injected
+
+    total = sum(walls)
+    return {
+        "runs": runs,
+        "median_run_s": round(statistics.median(walls), 4),
+        "max_run_s": round(max(walls), 4),
+        "runs_per_s": round(runs / total, 3) if total else 0.0,
+        "items_per_run": round(statistics.mean(items), 1),
+        "errors_per_run": round(statistics.mean(errors), 2),
+        "requests_served": requests_served,
+        "errors_injected": errors_injected,
+        "peak_traced_mb": round(peak / 1e6, 2),
+        "max_rss_mb": round(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024, 1),
+    }
+
+
+def bench_shopify_fanout(
+    query: str,
+    store_counts: List[int],
+    runs: int,
+    latency_ms: float,
+    jitter_ms: float,
+) -> Dict[str, Dict[str, float]]:
+    """Query latency of one ``ShopifyStoreEngine`` as the number of stores grows."""
+    results: Dict[str, Dict[str, float]] = {}
+    with MockSiteServer(latency_ms=latency_ms, jitter_ms=jitter_ms) as server:
+        for count in store_counts:
+            engine = ShopifyStoreEngine(
+                [ShopifyStore(f"store{index}", f"https://store{index}.example") for index in range(count)]
+            )
+            route_to_mock(engine, server.url)
+            engine.search(query)  # warm connections
+            walls, items = [], []
+            for _ in range(runs):
+                started = time.perf_counter()
+                items.append(len(engine.search(query)))
+                walls.append(time.perf_counter() - started)
+            results[str(count)] = {
+                "median_s": round(statistics.median(walls), 4),
+                "items": round(statistics.mean(items), 1),
+            }
+    return results
+
+
+def bench_woocommerce_mirror(query: str, runs: int, latency_ms: float, jitter_ms: float) -> Dict[str, float]:
+    """Live Store API search against the same query answered from a catalog mirror."""
+    with MockSiteServer(latency_ms=latency_ms, jitter_ms=jitter_ms) as server:
+        live, mirrored = BeyondGamingScraper(), BeyondGamingScraper()
+        mirrored.mirror_path = ":memory:"
+        route_to_mock(live, server.url)
+        route_to_mock(mirrored, server.url)
+        started = time.perf_counter()
+        mirrored.refresh_mirror(force_full=True)
+        sync_s = time.perf_counter() - started
+
+        def median_ms(search: Callable[[str], Any]) -> float:
+            timings = []
+            for _ in range(runs):
+                started = time.perf_counter()
+                search(query)
+                timings.append((time.perf_counter() - started) * 1000)
+            return round(statistics.median(timings), 3)
+
+        return {
+            "full_sync_s": round(sync_s, 4),
+            "live_query_ms": median_ms(live.search),
+            "mirror_query_ms": median_ms(mirrored.search),
+        }
+
+
+def bench_render(query: str, runs: int, latency_ms: float, max_pages: int) -> Dict[str, Any]:
+    """TCGPlayer against a JavaScript-shell fixture with ``render_mode="auto"``; needs Playwright."""
+    try:
+        import playwright  # noqa: F401
+    except ImportError:
+        return {"skipped": "playwright is not installed"}
+    with MockSiteServer(latency_ms=latency_ms) as server, BrowserPool(max_pages=max_pages) as pool:
+        route_browser_to_mock(pool, server.url)
+        scraper = TCGPlayerScraper()
+        scraper.search_url_template = "https://www.tcgplayer.com/search/all/product?q={query}&view=js"
+        scraper.page_url_template = scraper.search_url_template + "&page={page}"
+        scraper.fallback_search_url_templates = ()
+        scraper.render_mode = "auto"
+        scraper.browser_pool = pool
+        route_to_mock(scraper, server.url)
+        started = time.perf_counter()
+        items = scraper.parse_listing(scraper._request(scraper.build_search_url(query)).text)
+        cold_ms = (time.perf_counter() - started) * 1000
+        timings = []
+        for _ in range(runs):
+            started = time.perf_counter()
+            scraper._request(scraper.build_search_url(query))
+            timings.append((time.perf_counter() - started) * 1000)
+        return {
+            "items": len(items),
+            "cold_ms": round(cold_ms, 1),
+            "warm_median_ms": round(statistics.median(timings), 1),
+            "requests_blocked": pool.requests_blocked,
+            "contexts_recycled": pool.contexts_recycled,
+            "memory_mb": round(pool.memory_mb() or 0.0, 1),
+        }
+
+
+def git_revision() -> str:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            cwd=BENCH_DIR,
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown"
+
+
+def latest_result(results_dir: str, exclude: str | None = None) -> str | None:
+    paths = sorted(
+        path
+        for path in glob.glob(os.path.join(results_dir, "*.json"))
+        if path != exclude and os.path.basename(path) != BASELINE_NAME
+    )
+    return paths[-1] if paths else None
+
+
+def baseline_result(results_dir: str, exclude: str | None = None) -> str | None:
+    """The run saved with ``--save-baseline`` in ``results_dir``, else the latest stored run."""
+    pinned = os.path.join(results_dir, BASELINE_NAME)
+    return pinned if os.path.exists(pinned) else latest_result(results_dir, exclude=exclude)
+
+
+def save_report(report: Dict[str, Any], results_dir: str, as_baseline: bool = False) -> str:
+    """Store ``report`` under ``results_dir`` (and as its baseline); return the path."""
+    os.makedirs(results_dir, exist_ok=True)
+    path = os.path.join(results_dir, f"{time.strftime('%Y%m%d-%H%M%S')}-{report['meta']['revision']}.json")
+    for target in (path, os.path.join(results_dir, BASELINE_NAME)) if as_baseline else (path,):
+        with open(target, "w", encoding="utf-8") as handle:
+            json.dump(report, handle, indent=2)
+    print(f"Saved {path}" + (" (new baseline)" if as_baseline else ""))
+    return path
+
+
+def compare(current: Dict[str, Any], baseline: Dict[str, Any]) -> None:
+    print(f"Compared with {baseline['meta']['revision']} ({baseline['meta']['timestamp']}):")
+    for name, stats in current["parse"].items():
+        before = baseline.get("parse", {}).get(name)
+        if before and before["median_ms"]:
+            change = (stats["median_ms"] - before["median_ms"]) / before["median_ms"] * 100
+            print(f"  parse {name:<16} {before['median_ms']:>8.2f} -> {stats['median_ms']:>8.2f} ms ({change:+.1f}%)")
+    for count, stats in current.get("shopify_fanout", {}).items():
+        before = baseline.get("shopify_fanout", {}).get(count)
+        if before:
+            print(f"  shopify x{count:<12} {before['median_s']:>8} -> {stats['median_s']:>8} s")
+    for key in ("median_run_s", "runs_per_s", "peak_traced_mb"):
+        before = baseline.get("end_to_end", {}).get(key)
+        after = current.get("end_to_end", {}).get(key)
+        if before and after is not None:
+            print(f"  e2e {key:<18} {before:>8} -> {after:>8} ({(after - before) / before * 100:+.1f}%)")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--query", default="charizard base set", help="Query used for end-to-end runs")
+    parser.add_argument("--parse-repeat", type=int, default=20, help="Timed parses per fixture (default: 20)")
+    parser.add_argument("--runs", type=int, default=5, help="Timed end-to-end runs (default: 5)")
+    parser.add_argument("--latency-ms", type=float, default=50.0, help="Mock server base latency (default: 50)")
+    parser.add_argument("--jitter-ms", type=float, default=25.0, help="Extra random latency, up to (default: 25)")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="Share of requests answered with 503")
+    parser.add_argument("--skip-e2e", action="store_true", help="Only run the parse benchmarks")
+    parser.add_argument(
+        "--shopify-stores",
+        default="2,50",
+        help="Store counts for the Shopify fan-out benchmark (default: 2,50)",
+    )
+    parser.add_argument(
+        "--render",
+        action="store_true",
+        help="Also benchmark headless rendering of a JavaScript-only page (needs Playwright)",
+    )
+    parser.add_argument("--results-dir", default=RESULTS_DIR, help="Where result files are stored")
+    parser.add_argument("--no-save", action="store_true", help="Print results without storing them")
+    parser.add_argument(
+        "--save-baseline",
+        action="store_true",
+        help="Also store this run as the baseline later runs compare with",
+    )
+    parser.add_argument(
+        "--compare",
+        metavar="PATH",
+        help="Result file to compare against (default: the saved baseline, else the latest stored run)",
+    )
+    args = parser.parse_args()
+
+    report: Dict[str, Any] = {
+        "meta": {
+            "revision": git_revision(),
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "query": args.query,
+            "latency_ms": args.latency_ms,
+            "jitter_ms": args.jitter_ms,
+            "error_rate": args.error_rate,
+        },
+        "parse": bench_parse(args.parse_repeat),
+    }
+    print("Parse (median ms / items / MB/s):")
+    for name, stats in report["parse"].items():
+        print(f"  {name:<16} {stats['median_ms']:>8.2f}  {stats['items']:>4}  {stats['mb_per_s']:>7.2f}")
+
+    if not args.skip_e2e:
+        report["end_to_end"] = bench_end_to_end(
+            args.query, args.runs, args.latency_ms, args.jitter_ms, args.error_rate
+        )
+        print("End to end:")
+        for key, value in report["end_to_end"].items():
+            print(f"  {key:<18} {value}")
+
+        report["woocommerce_mirror"] = bench_woocommerce_mirror(args.query, args.runs, args.latency_ms, args.jitter_ms)
+        print("WooCommerce mirror:")
+        for key, value in report["woocommerce_mirror"].items():
+            print(f"  {key:<18} {value}")
+
+        counts = [int(count) for count in args.shopify_stores.split(",") if count]
+        report["shopify_fanout"] = bench_shopify_fanout(args.query, counts, args.runs, args.latency_ms, args.jitter_ms)
+        print("Shopify fan-out (median s / items):")
+        for count, stats in report["shopify_fanout"].items():
+            print(f"  {count:>4} stores  {stats['median_s']:>8.3f}  {stats['items']:>6}")
+
+        if args.render:
+            report["render"] = bench_render(args.query, args.runs, args.latency_ms, max_pages=2)
+            print("Headless rendering:")
+            for key, value in report["render"].items():
+                print(f"  {key:<18} {value}")
+
+    baseline_path = args.compare or baseline_result(args.results_dir)
+    if not args.no_save:
+        save_report(report, args.results_dir, as_baseline=args.save_baseline)
+    if baseline_path:
+        with open(baseline_path, "r", encoding="utf-8") as handle:
+            compare(report, json.load(handle))
+
+
+if __name__ == "__main__":
+    main()
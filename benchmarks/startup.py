@@ -0,0 +1,102 @@
+"""Startup benchmark: wall time of short CLI invocations and imports, each in a fresh interpreter."""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+from typing import Dict, List
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+REPO_DIR = os.path.dirname(BENCH_DIR)
+sys.path.insert(0, REPO_DIR)
+
+from benchmarks.run_benchmarks import RESULTS_DIR, baseline_result, git_revision, save_report  # noqa: E402
+
+STARTUP_RESULTS_DIR = os.path.join(RESULTS_DIR, "startup")
+
+CASES: Dict[str, List[str]] = {
+    "interpreter": ["-c", "pass"],
+    "run.py --help": ["run.py", "--help"],
+    "import orchestrator": ["-c", "import collector_scraper.core.orchestrator"],
+    "build one source": [
+        "-c",
+        "from collector_scraper.scrapers import build_scrapers; build_scrapers(['beyondgaming'])",
+    ],
+    "build all sources": ["-c", "from collector_scraper.scrapers import build_scrapers; build_scrapers()"],
+}
+
+
+def time_case(argv: List[str], repeat: int) -> Dict[str, float]:
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        subprocess.run([sys.executable, *argv], cwd=REPO_DIR, check=True, stdout=subprocess.DEVNULL)
+        timings.append((time.perf_counter() - started) * 1000)
+    return {"median_ms": round(statistics.median(timings), 1), "min_ms": round(min(timings), 1)}
+
+
+def top_imports(argv: List[str], limit: int) -> List[Dict[str, object]]:
+    """Slowest top-level imports (cumulative) from ``-X importtime``."""
+    completed = subprocess.run(
+        [sys.executable, "-X", "importtime", *argv],
+        cwd=REPO_DIR,
+        check=True,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.PIPE,
+        text=True,
+    )
+    rows = []
+    for line in completed.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = (part.strip() for part in line.split(":", 1)[1].split("|"))
+        rows.append({"module": name, "cumulative_ms": round(int(cumulative) / 1000, 1)})
+    rows.sort(key=lambda row: -row["cumulative_ms"])
+    return rows[:limit]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--repeat", type=int, default=10, help="Runs per case (default: 10)")
+    parser.add_argument("--top", type=int, default=10, help="Slowest imports to list for run.py --help")
+    parser.add_argument("--no-save", action="store_true", help="Print results without storing them")
+    parser.add_argument(
+        "--save-baseline",
+        action="store_true",
+        help="Also store this run as the baseline later runs compare with",
+    )
+    args = parser.parse_args()
+
+    report = {
+        "meta": {"revision": git_revision(), "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S")},
+        "cases": {name: time_case(argv, args.repeat) for name, argv in CASES.items()},
+        "top_imports": top_imports(CASES["run.py --help"], args.top),
+    }
+
+    print("Startup (median / min ms):")
+    for name, stats in report["cases"].items():
+        print(f"  {name:<22} {stats['median_ms']:>8.1f} {stats['min_ms']:>8.1f}")
+    print("Slowest imports for run.py --help (cumulative ms):")
+    for row in report["top_imports"]:
+        print(f"  {row['module']:<45} {row['cumulative_ms']:>8.1f}")
+
+    baseline_path = baseline_result(STARTUP_RESULTS_DIR)
+    if not args.no_save:
+        save_report(report, STARTUP_RESULTS_DIR, as_baseline=args.save_baseline)
+    if baseline_path:
+        with open(baseline_path, "r", encoding="utf-8") as handle:
+            baseline = json.load(handle)
+        print(f"Compared with {baseline['meta']['revision']}:")
+        for name, stats in report["cases"].items():
+            before = baseline["cases"].get(name)
+            if before:
+                print(f"  {name:<22} {before['median_ms']:>8.1f} -> {stats['median_ms']:>8.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,11 +1,79 @@
 from __future__ import annotations
 
+import codecs
+import json
+import re
+import threading
 from abc import ABC, abstractmethod
-from typing import Any, Dict, List, Mapping
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Mapping, Pattern, Sequence, Tuple, TypeVar
 
-import requests
-from requests.adapters import HTTPAdapter
-from urllib3.util.retry import Retry
+from collector_scraper.core.fingerprint_cache import (
+    DEFAULT_VOLATILE_PATTERNS,
+    FingerprintStore,
+    compile_patterns,
+    fingerprint_region,
+)
+from collector_scraper.core.tracing import span
+from collector_scraper.utils.listing_diff import ListingDiff, diff_listings
+from collector_scraper.utils.structured_data import extract_listing
+
+if TYPE_CHECKING:
+    import requests
+
+    from collector_scraper.core.browser_pool import BrowserPool
+
+_CHUNK_BYTES = 64 * 1024
+# Declared charset of an HTML page, looked for in its first few KB.
+_META_CHARSET = re.compile(rb"""<meta[^>]{0,200}?charset\s*=\s*["']?\s*([A-Za-z0-9_.:-]+)""", re.IGNORECASE)
+_META_CHARSET_WINDOW = 4096
+# Parsing holds the GIL, so running more parses at once only keeps more half-built
+# trees (and page bodies) alive. Fetches stay fully concurrent.
+_PARSE_SLOTS = threading.BoundedSemaphore(4)
+# Rendered pages are re-encoded as UTF-8 and already decompressed.
+_RENDER_DROPPED_HEADERS = ("content-encoding", "content-length", "content-type", "transfer-encoding")
+
+T = TypeVar("T")
+
+
+class ResponseTooLarge(IOError):
+    """A response body went over the adapter's ``max_body_bytes``."""
+
+
+@dataclass
+class FetchedResponse:
+    """Status, headers and the size-capped body of a fetch (or a rendered page)."""
+
+    url: str
+    status_code: int
+    headers: Mapping[str, str]
+    content: bytes
+    encoding: str
+
+    @property
+    def ok(self) -> bool:
+        return self.status_code < 400
+
+    @property
+    def text(self) -> str:
+        return self.content.decode(self.encoding, errors="replace")
+
+    def json(self) -> Any:
+        # json.loads detects UTF-8/16/32 in bytes itself, so no str copy is made.
+        return json.loads(self.content)
+
+    def raise_for_status(self) -> None:
+        if not self.ok:
+            import requests
+
+            raise requests.HTTPError(f"{self.status_code} error for url: {self.url}")
+
+
+@lru_cache(maxsize=None)
+def _marker_pattern(markers: Tuple[str, ...], binary: bool) -> Pattern[Any]:
+    alternatives = "|".join(re.escape(marker) for marker in markers)
+    return re.compile(alternatives.encode("utf-8") if binary else alternatives, re.IGNORECASE)
 
 
 class BaseScraper(ABC):
@@ -21,6 +89,32 @@ class BaseScraper(ABC):
         "AppleWebKit/537.36 (KHTML, like Gecko) "
         "Chrome/124.0.0.0 Safari/537.36"
     )
+    supports_sold: bool = False
+    # Set per instance; a function stored on the class would bind as a method.
+    fingerprint_store: FingerprintStore | None = None
+    change_listener: Callable[[str, str, ListingDiff], None] | None = None
+    # Called with each request URL before it is sent; may block to honour a rate limit.
+    request_throttle: Callable[[str], None] | None = None
+    fingerprint_markers: Tuple[str, str] | None = None
+    # HTML adapters read JSON-LD, microdata or embedded app state before running selectors;
+    # fewer than min_structured_items such listings (a lone featured product) don't count.
+    structured_data_first: bool = True
+    min_structured_items: int = 2
+    fingerprint_volatile_patterns: Sequence[str] = DEFAULT_VOLATILE_PATTERNS
+    # "auto" re-fetches pages that come back as a JavaScript shell through a headless browser,
+    # "always" renders every page, "off" never does. Rendering needs Playwright.
+    render_mode: str = "off"
+    render_wait_selector: str | None = None
+    js_shell_markers: Sequence[str] = (
+        "doesn't work properly without javascript",
+        "enable javascript to continue",
+    )
+    # Set per instance to use a dedicated pool; otherwise the process-wide pool is shared.
+    browser_pool: BrowserPool | None = None
+    # Bodies are streamed and refused past this size (0 disables the cap). Pages that
+    # declare no charset are decoded as default_encoding rather than sniffed.
+    max_body_bytes: int = 10_000_000
+    default_encoding: str = "utf-8"
     _session: requests.Session | None = None
 
     @abstractmethod
@@ -34,6 +128,17 @@ class BaseScraper(ABC):
     def parse_sold(self, payload: Any) -> List[Dict[str, Any]]:
         return []
 
+    def search_sold(self, query: str) -> List[Dict[str, Any]]:
+        return []
+
+    def map_sources(self, run: Callable[[BaseScraper], T]) -> List[T]:
+        """``run`` applied to each adapter reported as a source of its own.
+
+        That is just this adapter, except for engines that search a list of
+        stores, which return one result per store.
+        """
+        return [run(self)]
+
     def normalize(self, item: Dict[str, Any]) -> Dict[str, Any]:
         return {
             "product_name": item.get("title"),
@@ -44,6 +149,58 @@ class BaseScraper(ABC):
             "currency": item.get("currency"),
         }
 
+    def parse_structured(self, html: str) -> List[Dict[str, Any]]:
+        """Listings from structured data embedded in ``html``, or [] when there are too few."""
+        if not self.structured_data_first:
+            return []
+        with span("structured", self.source) as structured_span:
+            products = extract_listing(html, getattr(self, "base_url", ""))
+            structured_span.set("items", len(products))
+        if len(products) < self.min_structured_items:
+            return []
+        return [self.normalize({**product, "source": self.source}) for product in products]
+
+    def _parse_with_fingerprint(
+        self,
+        url: str,
+        body: str | bytes,
+        parse: Callable[[Any], List[Dict[str, Any]]],
+    ) -> List[Dict[str, Any]]:
+        """Parse ``body`` unless its result region is unchanged since the last fetch of ``url``."""
+        with span("parse", self.source) as parse_span:
+            items = self._parse_or_reuse(url, body, parse)
+            parse_span.set("items", len(items))
+        return items
+
+    def _parse_or_reuse(
+        self,
+        url: str,
+        body: str | bytes,
+        parse: Callable[[Any], List[Dict[str, Any]]],
+    ) -> List[Dict[str, Any]]:
+        store = self.fingerprint_store
+        if store is None:
+            with _PARSE_SLOTS:
+                return parse(body)
+
+        fingerprint = fingerprint_region(
+            body,
+            self.fingerprint_markers,
+            compile_patterns(tuple(self.fingerprint_volatile_patterns), isinstance(body, bytes)),
+        )
+        previous = store.get(self.source, url)
+        if previous is not None and previous.fingerprint == fingerprint:
+            return list(previous.items)
+
+        with _PARSE_SLOTS:
+            items = parse(body)
+        store.put(self.source, url, fingerprint, items)
+        if previous is not None and self.change_listener is not None:
+            changes = diff_listings(previous.items, items)
+            if changes:
+                self.change_listener(self.source, url, changes)
+        return items
+
     def get_headers(self) -> Dict[str, str]:
         return {
             "User-Agent": self.user_agent,
@@ -57,6 +214,11 @@ class BaseScraper(ABC):
         }
 
     def _build_session(self) -> requests.Session:
+        # Imported here so listing sources or printing --help doesn't load the HTTP stack.
+        import requests
+        from requests.adapters import HTTPAdapter
+        from urllib3.util.retry import Retry
+
         retry_strategy = Retry(
             total=self.max_retries,
             connect=self.max_retries,
@@ -84,18 +246,147 @@ class BaseScraper(ABC):
         url: str,
         extra_headers: Mapping[str, str] | None = None,
         allowed_statuses: tuple[int, ...] = (),
-    ) -> requests.Response:
+        json_body: Any = None,
+        max_bytes: int | None = None,
+    ) -> FetchedResponse:
+        """GET ``url``, or POST ``json_body`` to it when given (JSON search APIs).
+
+        The body is read in chunks up to ``max_bytes`` (default
+        ``max_body_bytes``). Its encoding comes from the ``Content-Type``
+        header, an HTML ``<meta charset>`` or ``default_encoding``, never
+        from charset detection.
+        """
         headers = self.get_headers().copy()
         if extra_headers:
             headers.update(extra_headers)
+        if self.request_throttle is not None:
+            self.request_throttle(url)
+        limit = self.max_body_bytes if max_bytes is None else max_bytes
+        if self.render_mode == "always" and json_body is None:
+            return self._render(url, headers, allowed_statuses, limit)
+
+        with span("request", self.source) as request_span:
+            timeout = (self.connect_timeout_seconds, self.read_timeout_seconds)
+            if json_body is None:
+                response = self._get_session().get(url, headers=headers, timeout=timeout, stream=True)
+            else:
+                response = self._get_session().post(
+                    url, headers=headers, json=json_body, timeout=timeout, stream=True
+                )
+            failed = response.status_code >= 400 and response.status_code not in allowed_statuses
+            content = b""
+            if failed:
+                response.close()  # The error body is never read.
+            else:
+                content = self._read_body(response, url, limit)
+            if request_span.recording:
+                # requests only exposes time-to-headers; connect/TLS are not split out.
+                retries = getattr(response.raw, "retries", None)
+                request_span.set("url", url)
+                request_span.set("status", response.status_code)
+                request_span.set("bytes", len(content))
+                request_span.set("retries", len(retries.history) if retries is not None else 0)
+                request_span.set("ttfb_ms", response.elapsed.total_seconds() * 1000)
+
+        if failed:
+            response.raise_for_status()
 
-        response = self._get_session().get(
-            url,
-            headers=headers,
-            timeout=(self.connect_timeout_seconds, self.read_timeout_seconds),
+        fetched = FetchedResponse(
+            url=response.url,
+            status_code=response.status_code,
+            headers=response.headers,
+            content=content,
+            encoding=self._body_encoding(response.headers, content),
         )
+        if (
+            self.render_mode == "auto"
+            and json_body is None
+            and fetched.ok
+            and self._page_requires_js(fetched.content)
+        ):
+            if self.request_throttle is not None:
+                self.request_throttle(url)
+            return self._render(url, headers, allowed_statuses, limit)
+
+        return fetched
+
+    def _fetch_text(self, url: str, extra_headers: Mapping[str, str] | None = None) -> str:
+        """Decoded body of ``url``; the bytes are dropped before the caller parses."""
+        return self._request(url, extra_headers).text
 
+    def _fetch_bytes(self, url: str, extra_headers: Mapping[str, str] | None = None) -> bytes:
+        """Raw body of ``url``, for JSON parsers: ``json.loads`` takes bytes, so no decoded copy is made."""
+        return self._request(url, extra_headers).content
+
+    def _read_body(self, response: requests.Response, url: str, limit: int) -> bytes:
+        declared = response.headers.get("Content-Length", "")
+        if limit and declared.isdigit() and int(declared) > limit:
+            response.close()
+            raise ResponseTooLarge(f"{url}: body of {declared} bytes is over the {limit}-byte limit")
+        chunks: List[bytes] = []
+        size = 0
+        for chunk in response.iter_content(_CHUNK_BYTES):
+            size += len(chunk)
+            if limit and size > limit:
+                response.close()
+                raise ResponseTooLarge(f"{url}: body is over the {limit}-byte limit")
+            chunks.append(chunk)
+        return b"".join(chunks)
+
+    def _body_encoding(self, headers: Mapping[str, str], content: bytes) -> str:
+        """Header charset, else an HTML/XML page's ``<meta charset>``, else ``default_encoding``."""
+        content_type = headers.get("Content-Type", "").lower()
+        encoding = self.default_encoding
+        if "charset=" in content_type:
+            encoding = content_type.split("charset=", 1)[1].split(";", 1)[0].strip(" \"'")
+        elif "html" in content_type or "xml" in content_type or not content_type:
+            match = _META_CHARSET.search(content, 0, _META_CHARSET_WINDOW)
+            if match:
+                encoding = match.group(1).decode("ascii")
+        try:
+            codecs.lookup(encoding)
+        except LookupError:
+            encoding = self.default_encoding
+        return encoding
+
+    def _page_requires_js(self, body: bytes | str) -> bool:
+        """Whether ``body`` is a JavaScript shell; scans bytes or text in place, without a lowered copy."""
+        pattern = _marker_pattern(tuple(self.js_shell_markers), isinstance(body, bytes))
+        return pattern.search(body) is not None
+
+    def _render(
+        self,
+        url: str,
+        headers: Mapping[str, str],
+        allowed_statuses: tuple[int, ...] = (),
+        limit: int = 0,
+    ) -> FetchedResponse:
+        """Fetch ``url`` through the browser pool, returned like any other fetch."""
+        from requests.structures import CaseInsensitiveDict
+
+        from collector_scraper.core.browser_pool import get_browser_pool
+
+        pool = self.browser_pool or get_browser_pool(self.user_agent)
+        wait_selector = self.render_wait_selector or getattr(self, "item_selector", None)
+        with span("render", self.source) as render_span:
+            page = pool.render(url, headers, wait_selector)
+            render_span.set("url", url)
+            render_span.set("status", page.status)
+            render_span.set("bytes", len(page.html))
+        page_headers = CaseInsensitiveDict(
+            {name: value for name, value in page.headers.items() if name.lower() not in _RENDER_DROPPED_HEADERS}
+        )
+        page_headers["Content-Type"] = "text/html; charset=utf-8"
+        response = FetchedResponse(
+            url=page.url,
+            status_code=page.status,
+            headers=page_headers,
+            content=page.html.encode("utf-8"),
+            encoding="utf-8",
+        )
+        del page
+        if limit and len(response.content) > limit:
+            raise ResponseTooLarge(f"{url}: rendered page is over the {limit}-byte limit")
         if response.status_code not in allowed_statuses:
             response.raise_for_status()
-
         return response
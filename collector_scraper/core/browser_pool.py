@@ -0,0 +1,342 @@
+from __future__ import annotations
+
+import asyncio
+import atexit
+import concurrent.futures
+import os
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Mapping, Sequence
+
+DEFAULT_BLOCKED_RESOURCE_TYPES = ("image", "font", "media")
+DEFAULT_BLOCKED_URL_PATTERNS = (
+    "google-analytics.com",
+    "googletagmanager.com",
+    "doubleclick.net",
+    "connect.facebook.net",
+    "hotjar.com",
+    "segment.io",
+    "cdn.segment.com",
+    "clarity.ms",
+    "bat.bing.com",
+)
+# Headers the browser sets itself; forwarding them from requests would break the page load.
+_BROWSER_OWNED_HEADERS = {"user-agent", "accept-encoding", "connection", "host", "content-length"}
+
+
+@dataclass
+class RenderedPage:
+    url: str
+    status: int
+    html: str
+    headers: Dict[str, str] = field(default_factory=dict)
+    elapsed_ms: float = 0.0
+
+
+@dataclass
+class _Slot:
+    # None after a failure; the context is rebuilt when the slot is next used.
+    context: Any = None
+    uses: int = 0
+    generation: int = 0
+
+
+def _process_tree_rss_mb(root_pid: int, include_root: bool = True) -> float | None:
+    """RSS of ``root_pid``'s process tree from /proc, or None where /proc is unavailable."""
+    try:
+        pids = [int(name) for name in os.listdir("/proc") if name.isdigit()]
+    except OSError:
+        return None
+    parents: Dict[int, int] = {}
+    rss_pages: Dict[int, int] = {}
+    for pid in pids:
+        try:
+            with open(f"/proc/{pid}/stat", "rb") as handle:
+                stat = handle.read()
+        except OSError:
+            continue
+        # The command name may contain spaces; fields after it are fixed.
+        fields = stat[stat.rfind(b")") + 2 :].split()
+        parents[pid] = int(fields[1])
+        rss_pages[pid] = int(fields[21])
+
+    tree = {root_pid}
+    changed = True
+    while changed:
+        changed = False
+        for pid, parent in parents.items():
+            if parent in tree and pid not in tree:
+                tree.add(pid)
+                changed = True
+    if not include_root:
+        tree.discard(root_pid)
+    page_size = os.sysconf("SC_PAGE_SIZE")
+    return sum(rss_pages.get(pid, 0) for pid in tree) * page_size / 1e6
+
+
+class BrowserPool:
+    """Warm headless-browser contexts for sources that only render listings with JavaScript.
+
+    Playwright is optional and imported on ``start``. The browser runs on a
+    private event-loop thread, so adapters on any thread can call ``render``.
+    There are ``max_pages`` contexts and each renders one page at a time,
+    which caps concurrent pages. A context is replaced after
+    ``max_uses_per_context`` renders, or when the browser processes together
+    exceed ``max_memory_mb``. If the browser dies it is relaunched on the
+    next render. Images, fonts, media and common analytics hosts are blocked.
+    """
+
+    def __init__(
+        self,
+        max_pages: int = 2,
+        max_uses_per_context: int = 50,
+        max_memory_mb: float = 1500.0,
+        navigation_timeout_seconds: float = 30.0,
+        settle_timeout_seconds: float = 5.0,
+        browser_type: str = "chromium",
+        user_agent: str | None = None,
+        block_resource_types: Sequence[str] = DEFAULT_BLOCKED_RESOURCE_TYPES,
+        block_url_patterns: Sequence[str] = DEFAULT_BLOCKED_URL_PATTERNS,
+    ) -> None:
+        self.max_pages = max(1, max_pages)
+        self.max_uses_per_context = max_uses_per_context
+        self.max_memory_mb = max_memory_mb
+        self.navigation_timeout_seconds = navigation_timeout_seconds
+        self.settle_timeout_seconds = settle_timeout_seconds
+        self.browser_type = browser_type
+        self.user_agent = user_agent
+        self.block_resource_types = frozenset(block_resource_types)
+        self.block_url_patterns = tuple(block_url_patterns)
+        # Maps a request URL to the URL actually fetched (the benchmarks point it at the mock server).
+        self.request_rewriter: Callable[[str], str] | None = None
+        self.pages_rendered = 0
+        self.requests_blocked = 0
+        self.contexts_recycled = 0
+        self.browsers_relaunched = 0
+        self._lock = threading.Lock()
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._thread: threading.Thread | None = None
+        self._playwright: Any = None
+        self._browser: Any = None
+        self._idle: asyncio.Queue[_Slot] | None = None
+        self._relaunch_lock: asyncio.Lock | None = None
+        self._generation = 0
+        self._timeout_error: type[Exception] = Exception
+
+    def start(self) -> "BrowserPool":
+        with self._lock:
+            if self._loop is not None:
+                return self
+            try:
+                from playwright.async_api import TimeoutError as PlaywrightTimeoutError
+            except ImportError:
+                raise RuntimeError(
+                    "Rendering JavaScript pages needs Playwright: "
+                    "pip install playwright && python -m playwright install chromium"
+                ) from None
+            self._timeout_error = PlaywrightTimeoutError
+            loop = asyncio.new_event_loop()
+            thread = threading.Thread(target=loop.run_forever, name="browser-pool", daemon=True)
+            thread.start()
+            try:
+                asyncio.run_coroutine_threadsafe(self._launch(), loop).result()
+            except BaseException:
+                loop.call_soon_threadsafe(loop.stop)
+                thread.join()
+                raise
+            self._loop, self._thread = loop, thread
+        return self
+
+    def close(self) -> None:
+        with self._lock:
+            if self._loop is None:
+                return
+            asyncio.run_coroutine_threadsafe(self._shutdown(), self._loop).result()
+            self._loop.call_soon_threadsafe(self._loop.stop)
+            if self._thread is not None:
+                self._thread.join()
+            self._loop, self._thread = None, None
+
+    def __enter__(self) -> "BrowserPool":
+        return self.start()
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    def render(
+        self,
+        url: str,
+        headers: Mapping[str, str] | None = None,
+        wait_selector: str | None = None,
+    ) -> RenderedPage:
+        """Load ``url`` in a warm context and return the DOM once it settles."""
+        self.start()
+        assert self._loop is not None
+        future = asyncio.run_coroutine_threadsafe(self._render(url, headers or {}, wait_selector), self._loop)
+        try:
+            return future.result(self.navigation_timeout_seconds + self.settle_timeout_seconds + 30)
+        except concurrent.futures.TimeoutError:
+            future.cancel()  # Closes the page and hands its slot back.
+            raise
+
+    def memory_mb(self) -> float | None:
+        """RSS of the Playwright driver and browser processes (this process's children)."""
+        return _process_tree_rss_mb(os.getpid(), include_root=False)
+
+    async def _launch(self) -> None:
+        from playwright.async_api import async_playwright
+
+        self._playwright = await async_playwright().start()
+        self._browser = await getattr(self._playwright, self.browser_type).launch(headless=True)
+        self._idle = asyncio.Queue()
+        self._relaunch_lock = asyncio.Lock()
+        for _ in range(self.max_pages):
+            self._idle.put_nowait(await self._new_slot())
+
+    async def _relaunch(self) -> None:
+        """Replace a browser that crashed or was closed; its contexts are rebuilt as slots come back."""
+        assert self._relaunch_lock is not None
+        async with self._relaunch_lock:
+            if self._browser is not None and self._browser.is_connected():
+                return  # Another render already relaunched it.
+            dead, self._browser = self._browser, None
+            if dead is not None:
+                try:
+                    await dead.close()
+                except Exception:
+                    pass
+            self._browser = await getattr(self._playwright, self.browser_type).launch(headless=True)
+            self._generation += 1
+            self.browsers_relaunched += 1
+
+    async def _shutdown(self) -> None:
+        slots: List[_Slot] = []
+        while self._idle is not None and not self._idle.empty():
+            slots.append(self._idle.get_nowait())
+        for slot in slots:
+            if slot.context is not None and slot.generation == self._generation:
+                try:
+                    await slot.context.close()
+                except Exception:
+                    pass
+        if self._browser is not None:
+            await self._browser.close()
+        if self._playwright is not None:
+            await self._playwright.stop()
+        self._browser = self._playwright = self._idle = self._relaunch_lock = None
+
+    async def _new_slot(self) -> _Slot:
+        options = {"user_agent": self.user_agent} if self.user_agent else {}
+        context = await self._browser.new_context(java_script_enabled=True, **options)
+        context.set_default_navigation_timeout(self.navigation_timeout_seconds * 1000)
+        await context.route("**/*", self._route)
+        return _Slot(context, generation=self._generation)
+
+    async def _acquire(self) -> _Slot:
+        """An idle slot with a live context, relaunching the browser if it died."""
+        assert self._idle is not None
+        slot = await self._idle.get()
+        try:
+            if self._browser is None or not self._browser.is_connected():
+                await self._relaunch()
+            if slot.context is None or slot.generation != self._generation:
+                slot = await self._new_slot()
+        except BaseException:
+            self._idle.put_nowait(_Slot())
+            raise
+        return slot
+
+    async def _release(self, slot: _Slot, page: Any) -> None:
+        """Close ``page`` and hand the slot back, recycling its context when due.
+
+        Always returns a slot to the pool, even when closing fails (the
+        browser died): an empty one then, rebuilt by the next ``_acquire``.
+        """
+        assert self._idle is not None
+        try:
+            if page is not None:
+                await page.close()
+            slot.uses += 1
+            if slot.uses >= self.max_uses_per_context or self._over_memory():
+                await slot.context.close()
+                slot = await self._new_slot()
+                self.contexts_recycled += 1
+        except BaseException:
+            self._idle.put_nowait(_Slot())
+            raise
+        self._idle.put_nowait(slot)
+
+    async def _route(self, route: Any) -> None:
+        request = route.request
+        if request.resource_type in self.block_resource_types or any(
+            pattern in request.url for pattern in self.block_url_patterns
+        ):
+            self.requests_blocked += 1
+            await route.abort()
+        elif self.request_rewriter is not None:
+            response = await route.fetch(url=self.request_rewriter(request.url))
+            await route.fulfill(response=response)
+        else:
+            await route.continue_()
+
+    async def _render(self, url: str, headers: Mapping[str, str], wait_selector: str | None) -> RenderedPage:
+        slot = await self._acquire()
+        page = None
+        started = time.perf_counter()
+        try:
+            page = await slot.context.new_page()
+            extra = {name: value for name, value in headers.items() if name.lower() not in _BROWSER_OWNED_HEADERS}
+            if extra:
+                await page.set_extra_http_headers(extra)
+            response = await page.goto(url, wait_until="domcontentloaded")
+            try:
+                if wait_selector:
+                    await page.wait_for_selector(wait_selector, timeout=self.settle_timeout_seconds * 1000)
+                else:
+                    await page.wait_for_load_state("networkidle", timeout=self.settle_timeout_seconds * 1000)
+            except self._timeout_error:
+                pass  # Render whatever is there; the adapter decides if it's enough.
+            html = await page.content()
+            self.pages_rendered += 1
+            return RenderedPage(
+                url=url,
+                status=response.status if response is not None else 200,
+                html=html,
+                headers=await response.all_headers() if response is not None else {},
+                elapsed_ms=(time.perf_counter() - started) * 1000,
+            )
+        finally:
+            try:
+                await self._release(slot, page)
+            except Exception:
+                pass  # The slot went back empty; a render error, if any, is the one to raise.
+
+    def _over_memory(self) -> bool:
+        if not self.max_memory_mb:
+            return False
+        used = self.memory_mb()
+        return used is not None and used > self.max_memory_mb
+
+
+_default_pool: BrowserPool | None = None
+_default_pool_lock = threading.Lock()
+
+
+def get_browser_pool(user_agent: str | None = None) -> BrowserPool:
+    """Process-wide pool shared by every adapter that renders, closed at exit.
+
+    ``user_agent`` only applies when this call creates the pool.
+    """
+    global _default_pool
+    with _default_pool_lock:
+        if _default_pool is None:
+            _default_pool = BrowserPool(user_agent=user_agent)
+            atexit.register(_default_pool.close)
+        return _default_pool
+
+
+def set_browser_pool(pool: BrowserPool | None) -> None:
+    global _default_pool
+    with _default_pool_lock:
+        _default_pool = pool
@@ -0,0 +1,200 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import sqlite3
+import threading
+from typing import Any, Dict, Iterable, List, Mapping, Set, Tuple
+
+from collector_scraper.utils.relevance import default_engine, rank_by_relevance, tokenize
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS products (
+    source TEXT NOT NULL,
+    product_id TEXT NOT NULL,
+    item TEXT NOT NULL,
+    digest TEXT NOT NULL,
+    first_seen REAL NOT NULL,
+    modified_at REAL NOT NULL,
+    seen_at REAL NOT NULL,
+    revision TEXT NOT NULL DEFAULT '',
+    checked_at REAL NOT NULL DEFAULT 0,
+    PRIMARY KEY (source, product_id)
+);
+CREATE TABLE IF NOT EXISTS sync_state (
+    source TEXT PRIMARY KEY,
+    last_sync REAL NOT NULL,
+    last_full_sync REAL NOT NULL,
+    last_complete_sync REAL NOT NULL DEFAULT 0
+);
+"""
+
+
+class _TitleIndex:
+    """Token postings over one source's mirrored titles."""
+
+    def __init__(self, items: List[Dict[str, Any]]) -> None:
+        self.items = items
+        self.postings: Dict[str, Set[int]] = {}
+        for row, item in enumerate(items):
+            for token in set(tokenize(item.get("product_name"))):
+                self.postings.setdefault(token, set()).add(row)
+
+    def candidates(self, query: str) -> List[Dict[str, Any]]:
+        terms = default_engine.query_terms(query)
+        if not terms:
+            return list(self.items)
+        rows: Set[int] = set()
+        for term in terms:
+            rows |= self.postings.get(term, set())
+        return [self.items[row] for row in sorted(rows)]
+
+
+class CatalogMirror:
+    """Local copy of store catalogs, keyed by ``(source, product_id)``, in one SQLite file.
+
+    ``modified_at`` is when a product's listing last changed between syncs;
+    ``seen_at`` is the last sync that returned it. ``revision`` is an
+    optional upstream version marker (such as a sitemap ``lastmod``) with
+    the time it was last fetched, so crawlers can skip unchanged pages. Searches are answered
+    from an in-memory title index rebuilt only after a sync changes something.
+    """
+
+    def __init__(self, path: str) -> None:
+        self.path = path
+        self._conn = sqlite3.connect(path, isolation_level=None, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.executescript(_SCHEMA)
+        columns = {row[1] for row in self._conn.execute("PRAGMA table_info(sync_state)")}
+        if "last_complete_sync" not in columns:  # Files created before the column existed.
+            self._conn.execute("ALTER TABLE sync_state ADD COLUMN last_complete_sync REAL NOT NULL DEFAULT 0")
+        self._lock = threading.RLock()
+        self._indexes: Dict[str, _TitleIndex] = {}
+
+    def close(self) -> None:
+        self._conn.close()
+
+    def sync_state(self, source: str) -> Tuple[float, float]:
+        """``(last_sync, last_full_sync)`` timestamps, zero when never synced."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT last_sync, last_full_sync FROM sync_state WHERE source = ?", (source,)
+            ).fetchone()
+        return (row[0], row[1]) if row else (0.0, 0.0)
+
+    def last_complete_sync(self, source: str) -> float:
+        """When a sync last covered the whole upstream catalog, zero if none ever did."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT last_complete_sync FROM sync_state WHERE source = ?", (source,)
+            ).fetchone()
+        return row[0] if row else 0.0
+
+    def mark_synced(self, source: str, synced_at: float, full: bool, complete: bool = False) -> None:
+        last_full = synced_at if full else self.sync_state(source)[1]
+        last_complete = synced_at if complete else self.last_complete_sync(source)
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO sync_state (source, last_sync, last_full_sync, last_complete_sync) "
+                "VALUES (?, ?, ?, ?)",
+                (source, synced_at, last_full, last_complete),
+            )
+
+    def upsert(
+        self,
+        source: str,
+        products: Iterable[Tuple[str, Dict[str, Any]]],
+        seen_at: float,
+        revisions: Mapping[str, str] | None = None,
+    ) -> int:
+        """Store ``(product_id, item)`` pairs; return how many were new or changed."""
+        revisions = revisions or {}
+        changed = 0
+        with self._lock:
+            existing = dict(
+                self._conn.execute("SELECT product_id, digest FROM products WHERE source = ?", (source,))
+            )
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                for product_id, item in products:
+                    encoded = json.dumps(item, sort_keys=True)
+                    digest = hashlib.blake2b(encoded.encode("utf-8"), digest_size=16).hexdigest()
+                    revision = revisions.get(product_id, "")
+                    if existing.get(product_id) == digest:
+                        self._conn.execute(
+                            "UPDATE products SET seen_at = ?, revision = ?, checked_at = ? "
+                            "WHERE source = ? AND product_id = ?",
+                            (seen_at, revision, seen_at, source, product_id),
+                        )
+                        continue
+                    self._conn.execute(
+                        """
+                        INSERT INTO products
+                            (source, product_id, item, digest, first_seen, modified_at, seen_at, revision, checked_at)
+                        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+                        ON CONFLICT (source, product_id) DO UPDATE SET
+                            item = excluded.item, digest = excluded.digest,
+                            modified_at = excluded.modified_at, seen_at = excluded.seen_at,
+                            revision = excluded.revision, checked_at = excluded.checked_at
+                        """,
+                        (source, product_id, encoded, digest, seen_at, seen_at, seen_at, revision, seen_at),
+                    )
+                    changed += 1
+                self._conn.execute("COMMIT")
+            except BaseException:
+                self._conn.execute("ROLLBACK")
+                raise
+            if changed:
+                self._indexes.pop(source, None)
+        return changed
+
+    def revisions(self, source: str) -> Dict[str, Tuple[str, float]]:
+        """``product_id -> (revision, checked_at)`` for one source."""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT product_id, revision, checked_at FROM products WHERE source = ?", (source,)
+            ).fetchall()
+        return {product_id: (revision, checked_at) for product_id, revision, checked_at in rows}
+
+    def mark_seen(self, source: str, product_ids: Iterable[str], seen_at: float) -> None:
+        """Record that upstream still lists these products, without refetching them."""
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                self._conn.executemany(
+                    "UPDATE products SET seen_at = ? WHERE source = ? AND product_id = ?",
+                    ((seen_at, source, product_id) for product_id in product_ids),
+                )
+                self._conn.execute("COMMIT")
+            except BaseException:
+                self._conn.execute("ROLLBACK")
+                raise
+
+    def remove_unseen(self, source: str, since: float) -> int:
+        """Drop products a complete sync starting at ``since`` no longer returned."""
+        with self._lock:
+            removed = self._conn.execute(
+                "DELETE FROM products WHERE source = ? AND seen_at < ?", (source, since)
+            ).rowcount
+            if removed:
+                self._indexes.pop(source, None)
+        return removed
+
+    def items(self, source: str) -> List[Dict[str, Any]]:
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT item FROM products WHERE source = ? ORDER BY product_id", (source,)
+            ).fetchall()
+        return [json.loads(row[0]) for row in rows]
+
+    def search(self, source: str, query: str, limit: int | None = None) -> List[Dict[str, Any]]:
+        with self._lock:
+            index = self._indexes.get(source)
+            if index is None:
+                index = self._indexes[source] = _TitleIndex(self.items(source))
+        ranked = rank_by_relevance(index.candidates(query), query)
+        return [dict(item) for item in (ranked[:limit] if limit else ranked)]
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM products").fetchone()[0]
@@ -0,0 +1,136 @@
+from __future__ import annotations
+
+import atexit
+import hashlib
+import json
+import os
+import re
+import threading
+import time
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import Any, Dict, List, Sequence, Tuple
+
+DEFAULT_VOLATILE_PATTERNS: Tuple[str, ...] = (
+    r"<script\b[^>]*>.*?</script>",
+    r"<style\b[^>]*>.*?</style>",
+    r"<!--.*?-->",
+    r"\b(?:nonce|data-csrf|csrf-token|data-request-id)=\"[^\"]*\"",
+)
+
+
+@dataclass
+class FingerprintEntry:
+    fingerprint: str
+    items: List[Dict[str, Any]] = field(default_factory=list)
+    updated_at: float = 0.0
+
+
+@lru_cache(maxsize=64)
+def compile_patterns(patterns: Tuple[str, ...], binary: bool = False) -> Tuple[re.Pattern[Any], ...]:
+    return tuple(
+        re.compile(pattern.encode("utf-8") if binary else pattern, re.IGNORECASE | re.DOTALL) for pattern in patterns
+    )
+
+
+def fingerprint_region(
+    body: str | bytes,
+    markers: Tuple[str, str] | None = None,
+    volatile: Sequence[re.Pattern[Any]] = (),
+) -> str:
+    """Hash the part of ``body`` that holds results, ignoring volatile markup.
+
+    Raw bytes (JSON bodies) need ``volatile`` compiled with ``binary=True``.
+    """
+    binary = isinstance(body, bytes)
+    region = body
+    if markers:
+        start_marker, end_marker = (marker.encode("utf-8") for marker in markers) if binary else markers
+        start = body.find(start_marker)
+        if start >= 0:
+            end = body.find(end_marker, start)
+            region = body[start : end if end >= 0 else len(body)]
+    empty = b"" if binary else ""
+    for pattern in volatile:
+        region = pattern.sub(empty, region)
+    region = (b" " if binary else " ").join(region.split())
+    return hashlib.blake2b(region if binary else region.encode("utf-8"), digest_size=16).hexdigest()
+
+
+class FingerprintStore:
+    """Last fingerprint and parsed results per ``(source, url)``.
+
+    Kept in memory; when ``path`` is given it is loaded on start, and
+    changes are written back atomically at most every ``flush_seconds``,
+    on ``flush``/``close`` and at interpreter exit, so cron-style runs
+    share it.
+    """
+
+    def __init__(self, path: str | None = None, flush_seconds: float = 30.0) -> None:
+        self.path = path
+        self.flush_seconds = flush_seconds
+        self._entries: Dict[str, FingerprintEntry] = {}
+        self._lock = threading.Lock()
+        self._save_lock = threading.Lock()
+        self._dirty = False
+        self._flushed_at = time.monotonic()
+        if path:
+            self._load()
+            atexit.register(self.flush)
+
+    @staticmethod
+    def _key(source: str, url: str) -> str:
+        return f"{source} {url}"
+
+    def get(self, source: str, url: str) -> FingerprintEntry | None:
+        with self._lock:
+            return self._entries.get(self._key(source, url))
+
+    def put(self, source: str, url: str, fingerprint: str, items: List[Dict[str, Any]]) -> None:
+        with self._lock:
+            self._entries[self._key(source, url)] = FingerprintEntry(
+                fingerprint=fingerprint,
+                items=list(items),
+                updated_at=time.time(),
+            )
+            self._dirty = True
+            due = bool(self.path) and time.monotonic() - self._flushed_at >= self.flush_seconds
+        if due:
+            self.flush()
+
+    def flush(self) -> None:
+        """Write pending changes to ``path``; the file is written outside the entry lock."""
+        if not self.path:
+            return
+        with self._save_lock:
+            with self._lock:
+                if not self._dirty:
+                    return
+                # Entries are replaced, never mutated, so the snapshot stays valid while it is written.
+                snapshot = {key: vars(entry) for key, entry in self._entries.items()}
+                self._dirty = False
+                self._flushed_at = time.monotonic()
+            try:
+                self._save(snapshot)
+            except BaseException:
+                with self._lock:
+                    self._dirty = True
+                raise
+
+    def close(self) -> None:
+        self.flush()
+
+    def _load(self) -> None:
+        try:
+            with open(self.path, "r", encoding="utf-8") as handle:
+                raw = json.load(handle)
+        except (OSError, ValueError):
+            return
+        for key, entry in raw.items():
+            self._entries[key] = FingerprintEntry(**entry)
+
+    def _save(self, snapshot: Dict[str, Dict[str, Any]]) -> None:
+        tmp_path = f"{self.path}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as handle:
+            json.dump(snapshot, handle)
+        os.replace(tmp_path, self.path)
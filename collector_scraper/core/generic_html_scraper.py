@@ -1,13 +1,17 @@
 from __future__ import annotations
 
 import re
-from typing import Any, Dict, List, Sequence
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Any, Dict, Iterator, List, Sequence
 from urllib.parse import quote_plus, urljoin
 
 from bs4 import BeautifulSoup
 
 from collector_scraper.core.base_scraper import BaseScraper
+from collector_scraper.core.pagination import PageResult, Paginator, current_result_limit
+from collector_scraper.core.tracing import span
 from collector_scraper.utils.price_parser import parse_price
+from collector_scraper.utils.relevance import rank_by_relevance
 
 
 class GenericListScraper(BaseScraper):
@@ -22,21 +26,30 @@ class GenericListScraper(BaseScraper):
     blocked_title_keywords: Sequence[str] = ()
     fallback_search_url_templates: Sequence[str] = ()
     max_items: int = 60
-    _generic_stopwords = {
-        "pokemon",
-        "cards",
-        "card",
-        "booster",
-        "set",
-        "tcg",
-        "the",
-        "and",
-    }
+    page_url_template: str = ""
+    max_pages: int = 1
+    page_workers: int = 3
+    sold_search_url_template: str = ""
+    max_sold_pages: int = 3
+    sold_page_workers: int = 3
+
+    @property
+    def supports_sold(self) -> bool:
+        return bool(self.sold_search_url_template)
 
     def build_search_url(self, query: str) -> str:
         encoded_query = quote_plus(query.strip())
         return self.search_url_template.format(query=encoded_query)
 
+    def build_page_url(self, query: str, page: int) -> str:
+        encoded_query = quote_plus(query.strip())
+        return self.page_url_template.format(query=encoded_query, page=page)
+
+    def result_cap(self) -> int | None:
+        """Results kept across all pages: ``max_items`` caps each page, not the total."""
+        total = self.max_items * max(1, self.max_pages) if self.max_items else None
+        return current_result_limit(total)
+
     def search(self, query: str) -> List[Dict[str, Any]]:
         encoded_query = quote_plus(query.strip())
         candidate_urls = [self.build_search_url(query)]
@@ -45,25 +58,114 @@ class GenericListScraper(BaseScraper):
         )
 
         last_exception: Exception | None = None
-        for url in candidate_urls:
+        for index, url in enumerate(candidate_urls):
             try:
-                response = self._request(url)
+                body = self._fetch_text(url)
             except Exception as exc:
                 last_exception = exc
                 continue
 
-            parsed = self.parse_listing(response.text)
-            if not parsed:
-                parsed = self._parse_anchor_fallback(response.text)
+            parsed = self._parse_with_fingerprint(url, body, self._parse_page)
+            del body
 
             filtered = self._filter_by_query(parsed, query)
             if filtered:
-                return filtered[: self.max_items]
+                if index == 0:
+                    filtered = self._fetch_more_pages(query, filtered)
+                cap = self.result_cap()
+                return filtered[:cap] if cap else filtered
 
         if last_exception is not None:
             raise last_exception
         return []
 
+    def _fetch_more_pages(self, query: str, first_page: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        if self.max_pages <= 1 or not self.page_url_template:
+            return first_page
+
+        def fetch_page(page: int) -> PageResult:
+            url = self.build_page_url(query, page)
+            return PageResult(self._parse_with_fingerprint(url, self._fetch_text(url), self._parse_page))
+
+        paginator = Paginator(
+            fetch_page,
+            max_pages=self.max_pages,
+            workers=self.page_workers,
+            max_results=self.result_cap(),
+            relevance_filter=lambda items: self._filter_by_query(items, query),
+        )
+        return paginator.collect(first_page, start_page=2)
+
+    def build_sold_url(self, query: str, page: int) -> str:
+        encoded_query = quote_plus(query.strip())
+        return self.sold_search_url_template.format(query=encoded_query, page=page)
+
+    def iter_sold(self, query: str) -> Iterator[List[Dict[str, Any]]]:
+        """Yield parsed sold pages as they complete; pages are fetched concurrently."""
+        if not self.supports_sold:
+            return
+
+        urls = [self.build_sold_url(query, page) for page in range(1, self.max_sold_pages + 1)]
+        workers = max(1, min(self.sold_page_workers, len(urls)))
+        last_exception: Exception | None = None
+        yielded = False
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = {executor.submit(self._fetch_text, url): url for url in urls}
+            for future in as_completed(futures):
+                try:
+                    body = future.result()
+                except Exception as exc:
+                    last_exception = exc
+                    continue
+                sold = self._parse_with_fingerprint(futures.pop(future), body, self.parse_sold)
+                del body
+                if sold:
+                    yielded = True
+                    yield sold
+
+        if not yielded and last_exception is not None:
+            raise last_exception
+
+    def search_sold(self, query: str) -> List[Dict[str, Any]]:
+        results: List[Dict[str, Any]] = []
+        seen_keys = set()
+        for page_items in self.iter_sold(query):
+            for item in page_items:
+                dedupe_key = (str(item.get("product_name") or "").lower(), item.get("price"), item.get("url"))
+                if dedupe_key in seen_keys:
+                    continue
+                seen_keys.add(dedupe_key)
+                results.append(item)
+        return self._filter_by_query(results, query)
+
+    def parse_sold(self, html: str) -> List[Dict[str, Any]]:
+        # Sold/completed result pages share the live listing markup.
+        return [dict(item, price_type="sold") for item in self.parse_listing(html)]
+
+    def parse_structured(self, html: str) -> List[Dict[str, Any]]:
+        items = [
+            item for item in super().parse_structured(html) if not self._is_blocked_title(item.get("product_name"))
+        ]
+        return items if len(items) >= self.min_structured_items else []
+
+    def _is_blocked_title(self, title: str | None) -> bool:
+        title_lower = str(title or "").lower()
+        return any(blocked.lower() in title_lower for blocked in self.blocked_title_keywords)
+
+    def _parse_page(self, html: str) -> List[Dict[str, Any]]:
+        items = self.parse_structured(html)
+        if items:
+            return items[: self.max_items] if self.max_items else items
+        with span("parse_listing", self.source) as parse_span:
+            items = self.parse_listing(html)
+            parse_span.set("items", len(items))
+        if items:
+            return items
+        with span("anchor_fallback", self.source) as fallback_span:
+            items = self._parse_anchor_fallback(html)
+            fallback_span.set("items", len(items))
+        return items
+
     def parse_listing(self, html: str) -> List[Dict[str, Any]]:
         soup = BeautifulSoup(html, "html.parser")
         containers = soup.select(self.item_selector)
@@ -76,12 +178,11 @@ class GenericListScraper(BaseScraper):
             if not title:
                 continue
 
-            title_lower = title.lower()
-            if any(blocked.lower() in title_lower for blocked in self.blocked_title_keywords):
+            if self._is_blocked_title(title):
                 continue
 
             price_text = self._extract_text(container, self.price_selectors)
-            price = parse_price(price_text)
+            price, currency = parse_price(price_text)
             if price is None:
                 continue
 
@@ -99,6 +200,7 @@ class GenericListScraper(BaseScraper):
                     "price": price,
                     "source": self.source,
                     "url": item_url,
+                    "currency": currency if currency != "UNKNOWN" else None,
                 }
             )
             results.append(normalized)
@@ -106,6 +208,8 @@ class GenericListScraper(BaseScraper):
             if self.max_items and len(results) >= self.max_items:
                 break
 
+        # bs4 trees are reference cycles; decompose frees them now instead of at the next GC.
+        soup.decompose()
         return results
 
     def _parse_anchor_fallback(self, html: str) -> List[Dict[str, Any]]:
@@ -133,14 +237,14 @@ class GenericListScraper(BaseScraper):
                 else ""
             )
 
-            price = parse_price(f"{title_text} {parent_text} {grandparent_text}")
+            price, currency = parse_price(f"{title_text} {parent_text} {grandparent_text}")
             if price is None:
                 continue
 
             title = self._clean_title(title_text)
             if not title:
                 title = self._clean_title(parent_text)
-            if not title:
+            if not title or self._is_blocked_title(title):
                 continue
 
             item_url = urljoin(self.base_url, str(href))
@@ -156,6 +260,7 @@ class GenericListScraper(BaseScraper):
                         "price": price,
                         "source": self.source,
                         "url": item_url,
+                        "currency": currency if currency != "UNKNOWN" else None,
                     }
                 )
             )
@@ -163,26 +268,14 @@ class GenericListScraper(BaseScraper):
             if self.max_items and len(results) >= self.max_items:
                 break
 
+        soup.decompose()
         return results
 
     def _filter_by_query(self, items: List[Dict[str, Any]], query: str) -> List[Dict[str, Any]]:
-        terms = self._query_terms(query)
-        if not terms:
-            return items
-
-        filtered: List[Dict[str, Any]] = []
-        for item in items:
-            title = str(item.get("product_name") or item.get("title") or "").lower()
-            if not title:
-                continue
-            if any(term in title for term in terms):
-                filtered.append(item)
-        return filtered
-
-    def _query_terms(self, query: str) -> List[str]:
-        tokens = [tok.lower() for tok in re.split(r"[^A-Za-z0-9]+", query) if tok]
-        content_tokens = [tok for tok in tokens if len(tok) >= 3 and tok not in self._generic_stopwords]
-        return content_tokens if content_tokens else [tok for tok in tokens if len(tok) >= 3]
+        with span("filter", self.source, items_in=len(items)) as filter_span:
+            kept = rank_by_relevance(items, query)
+            filter_span.set("items_out", len(kept))
+        return kept
 
     @staticmethod
     def _clean_title(text: str | None) -> str | None:
@@ -1,32 +1,85 @@
 from __future__ import annotations
 
 import time
-from collections.abc import Sequence
+from collections.abc import Mapping, Sequence
+from contextlib import AbstractContextManager, nullcontext
 from concurrent.futures import ThreadPoolExecutor, as_completed
-from dataclasses import dataclass, field
-from typing import Any, Dict, List
+from dataclasses import asdict, dataclass, field, fields
+from typing import Any, Callable, Dict, List
 
 from collector_scraper.core.base_scraper import BaseScraper
-from collector_scraper.scrapers import build_tier1_scrapers
+from collector_scraper.core.pagination import result_limit_scope
+from collector_scraper.core.profiler import SamplingProfiler, thread_label
+from collector_scraper.core.tracing import span
+from collector_scraper.scrapers.registry import (
+    AdapterRegistry,
+    SourceSelection,
+    default_registry,
+    strip_currency_hints,
+)
+from collector_scraper.utils.catalog_index import CatalogIndex
+from collector_scraper.utils.dedup import MinHashDeduplicator, default_deduplicator
+from collector_scraper.utils.outlier_filter import calculate_stats_by_price_type
+from collector_scraper.utils.relevance import RelevanceEngine, default_engine
 
 
 @dataclass
 class OrchestrationResult:
     query: str
     items: List[Dict[str, Any]] = field(default_factory=list)
+    sold_items: List[Dict[str, Any]] = field(default_factory=list)
     errors: List[Dict[str, str]] = field(default_factory=list)
     durations_ms: Dict[str, int] = field(default_factory=dict)
+    dropped_irrelevant: int = 0
+    duplicates_merged: int = 0
+    # Sources that returned max_results_per_site listings or more, so lower-ranked ones were cut.
+    capped_sources: List[str] = field(default_factory=list)
 
+    def to_dict(self) -> Dict[str, Any]:
+        return asdict(self)
 
-def _run_single_scraper(scraper: BaseScraper, query: str) -> tuple[str, List[Dict[str, Any]], str | None, int]:
-    started = time.perf_counter()
-    try:
-        items = scraper.search(query)
-        elapsed = int((time.perf_counter() - started) * 1000)
-        return scraper.source, items, None, elapsed
-    except Exception as exc:  # pragma: no cover
-        elapsed = int((time.perf_counter() - started) * 1000)
-        return scraper.source, [], str(exc), elapsed
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "OrchestrationResult":
+        known = {f.name for f in fields(cls)}
+        return cls(**{key: value for key, value in data.items() if key in known})
+
+    def market_stats(self) -> Dict[str, Dict[str, float | int | None]]:
+        """Stats for asking prices ("listing") and sold prices ("sold"), kept apart."""
+        with span("stats", items=len(self.items) + len(self.sold_items)):
+            return calculate_stats_by_price_type([*self.items, *self.sold_items])
+
+
+def run_scraper(
+    scraper: BaseScraper,
+    query: str,
+    sold: bool = False,
+    result_limit: int | None = None,
+    gate: AbstractContextManager[Any] | None = None,
+) -> tuple[str, List[Dict[str, Any]], str | None, int]:
+    label = f"{scraper.source}:sold" if sold else scraper.source
+    query = strip_currency_hints(query)
+    with gate if gate is not None else nullcontext():
+        started = time.perf_counter()
+        try:
+            with span("search", label), thread_label(label), result_limit_scope(None if sold else result_limit):
+                items = scraper.search_sold(query) if sold else scraper.search(query)
+            elapsed = int((time.perf_counter() - started) * 1000)
+            return label, items, None, elapsed
+        except Exception as exc:  # pragma: no cover
+            elapsed = int((time.perf_counter() - started) * 1000)
+            return label, [], str(exc), elapsed
+
+
+def _run_scraper_sources(
+    scraper: BaseScraper,
+    query: str,
+    sold: bool = False,
+    result_limit: int | None = None,
+    gate: AbstractContextManager[Any] | None = None,
+) -> List[tuple[str, List[Dict[str, Any]], str | None, int]]:
+    """``run_scraper`` per source ``scraper`` stands for (one per store for a store list)."""
+    with gate if gate is not None else nullcontext():
+        return scraper.map_sources(lambda each: run_scraper(each, query, sold, result_limit))
 
 
 def run_all_scrapers(
@@ -34,21 +87,104 @@ def run_all_scrapers(
     scrapers: Sequence[BaseScraper] | None = None,
     max_results_per_site: int = 40,
     max_workers: int = 5,
+    catalog: CatalogIndex | None = None,
+    min_catalog_score: float = 0.5,
+    relevance: RelevanceEngine | None = default_engine,
+    deduplicator: MinHashDeduplicator | None = default_deduplicator,
+    include_sold: bool = False,
+    site_limits: Mapping[str, AbstractContextManager[Any]] | None = None,
+    on_site_result: Callable[[str, List[Dict[str, Any]], str | None, int], None] | None = None,
+    profiler: SamplingProfiler | None = None,
+    selection: SourceSelection | None = None,
+    registry: AdapterRegistry | None = None,
 ) -> OrchestrationResult:
-    active_scrapers = list(scrapers) if scrapers else build_tier1_scrapers()
+    """Search every selected source in parallel and merge the results.
+
+    Without ``scrapers``, sources come from the registry, chosen for this
+    query by ``selection`` (a query naming a market only hits its stores).
+    With ``scrapers`` and a ``selection``, the given adapters are filtered
+    the same way.
+    """
+    registry = registry or default_registry()
+    if scrapers:
+        active_scrapers = list(scrapers)
+        if selection is not None:
+            chosen = {spec.source for spec in registry.select(query, selection)}
+            active_scrapers = [scraper for scraper in active_scrapers if scraper.source in chosen]
+    else:
+        active_scrapers = registry.build_for_query(query, selection)
     result = OrchestrationResult(query=query)
+    catalog_match = catalog.resolve(strip_currency_hints(query)) if catalog is not None else None
+
+    tasks = [(scraper, False) for scraper in active_scrapers]
+    if include_sold:
+        # Sold searches share the pool so they overlap the listing searches.
+        tasks.extend((scraper, True) for scraper in active_scrapers if scraper.supports_sold)
+
+    workers = max(1, min(max_workers, len(tasks)))
+    with profiler if profiler is not None else nullcontext():
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = {
+                executor.submit(
+                    _run_scraper_sources,
+                    scraper,
+                    query,
+                    sold,
+                    max_results_per_site,
+                    site_limits.get(scraper.source) if site_limits else None,
+                ): sold
+                for scraper, sold in tasks
+            }
+            for future in as_completed(futures):
+                for source, site_items, error, elapsed in future.result():
+                    result.durations_ms[source] = elapsed
+                    if error:
+                        result.errors.append({"source": source, "error": error})
+                    elif futures[future]:
+                        result.sold_items.extend(site_items)
+                    else:
+                        if catalog_match:
+                            relevant = catalog.filter_items(site_items, catalog_match, min_catalog_score)
+                            result.dropped_irrelevant += len(site_items) - len(relevant)
+                            site_items = relevant
+                        if max_results_per_site > 0:
+                            if len(site_items) >= max_results_per_site:
+                                result.capped_sources.append(source)
+                            site_items = site_items[:max_results_per_site]
+                        result.items.extend(site_items)
+                    if on_site_result is not None:
+                        # Partial per-site results, before cross-source ranking and dedup.
+                        on_site_result(source, site_items, error, elapsed)
+
+        return finalize_result(result, relevance, deduplicator)
+
+
+def _source_key(item: Dict[str, Any]) -> str:
+    return str(item.get("source") or "")
+
+
+def finalize_result(
+    result: OrchestrationResult,
+    relevance: RelevanceEngine | None = default_engine,
+    deduplicator: MinHashDeduplicator | None = default_deduplicator,
+) -> OrchestrationResult:
+    """Cross-source ranking and dedup once every site's listings are in ``result``."""
+    # Sites finish in a different order each run; a stable sort by source keeps ranking
+    # ties, and so the listing kept from each duplicate cluster, the same run to run.
+    result.items.sort(key=_source_key)
+    result.sold_items.sort(key=_source_key)
+    if relevance is not None:
+        # One batch over every source so scores share the same term statistics.
+        query = strip_currency_hints(result.query)
+        with span("rank", items=len(result.items)):
+            ranked = relevance.rank(result.items, query)
+            result.dropped_irrelevant += len(result.items) - len(ranked)
+            result.items = ranked
+            if result.sold_items:
+                result.sold_items = relevance.rank(result.sold_items, query)
 
-    workers = max(1, min(max_workers, len(active_scrapers)))
-    with ThreadPoolExecutor(max_workers=workers) as executor:
-        futures = [executor.submit(_run_single_scraper, scraper, query) for scraper in active_scrapers]
-        for future in as_completed(futures):
-            source, site_items, error, elapsed = future.result()
-            result.durations_ms[source] = elapsed
-            if error:
-                result.errors.append({"source": source, "error": error})
-                continue
-            if max_results_per_site > 0:
-                site_items = site_items[:max_results_per_site]
-            result.items.extend(site_items)
+    if deduplicator is not None:
+        with span("dedup", items=len(result.items)):
+            result.items, result.duplicates_merged = deduplicator.dedupe(result.items)
 
     return result
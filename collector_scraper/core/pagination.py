@@ -0,0 +1,141 @@
+from __future__ import annotations
+
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Iterator, List, Sequence
+
+_result_limit: ContextVar[int | None] = ContextVar("result_limit", default=None)
+
+
+@contextmanager
+def result_limit_scope(limit: int | None) -> Iterator[None]:
+    """Cap how many results paginating adapters collect in this context."""
+    token = _result_limit.set(limit if limit and limit > 0 else None)
+    try:
+        yield
+    finally:
+        _result_limit.reset(token)
+
+
+def current_result_limit(default: int | None = None) -> int | None:
+    limit = _result_limit.get()
+    if limit is None:
+        return default
+    if default is None:
+        return limit
+    return min(limit, default)
+
+
+@dataclass
+class PageResult:
+    items: List[Dict[str, Any]] = field(default_factory=list)
+    total_pages: int | None = None
+
+
+def _item_key(item: Dict[str, Any]) -> tuple:
+    return (
+        item.get("url") or str(item.get("product_name") or "").lower(),
+        item.get("price"),
+    )
+
+
+class Paginator:
+    """Fetch result pages concurrently in waves and stop as soon as paging stops paying off.
+
+    Paging stops when a page is empty or fails, when too few of a page's items
+    are new (the site is repeating itself) or relevant, when ``max_results``
+    is reached, or at ``total_pages`` when the site reports it.
+    """
+
+    def __init__(
+        self,
+        fetch_page: Callable[[int], PageResult],
+        max_pages: int,
+        workers: int = 3,
+        max_results: int | None = None,
+        relevance_filter: Callable[[List[Dict[str, Any]]], List[Dict[str, Any]]] | None = None,
+        total_pages: int | None = None,
+        min_new_ratio: float = 0.25,
+        min_relevant_ratio: float = 0.25,
+    ) -> None:
+        self.fetch_page = fetch_page
+        self.max_pages = max_pages
+        self.workers = max(1, workers)
+        self.max_results = max_results
+        self.relevance_filter = relevance_filter
+        self.total_pages = total_pages
+        self.min_new_ratio = min_new_ratio
+        self.min_relevant_ratio = min_relevant_ratio
+        self.pages_fetched = 0
+
+    def _last_page(self) -> int:
+        if self.total_pages is not None:
+            return min(self.max_pages, self.total_pages)
+        return self.max_pages
+
+    def collect(
+        self,
+        seed: Sequence[Dict[str, Any]] = (),
+        start_page: int = 1,
+    ) -> List[Dict[str, Any]]:
+        results: List[Dict[str, Any]] = []
+        seen = set()
+        for item in seed:
+            key = _item_key(item)
+            if key not in seen:
+                seen.add(key)
+                results.append(item)
+
+        next_page = start_page
+        with ThreadPoolExecutor(max_workers=self.workers) as executor:
+            while next_page <= self._last_page() and not self._full(results):
+                wave = list(range(next_page, min(next_page + self.workers, self._last_page() + 1)))
+                futures = [executor.submit(self.fetch_page, page) for page in wave]
+                next_page = wave[-1] + 1
+
+                for future in futures:
+                    try:
+                        page = future.result()
+                    except Exception:
+                        return self._cap(results)
+                    self.pages_fetched += 1
+                    if page.total_pages is not None:
+                        self.total_pages = page.total_pages
+                    if not self._absorb(page.items, results, seen):
+                        return self._cap(results)
+
+        return self._cap(results)
+
+    def _absorb(
+        self,
+        items: List[Dict[str, Any]],
+        results: List[Dict[str, Any]],
+        seen: set,
+    ) -> bool:
+        """Merge one page into ``results``; return False when paging should stop."""
+        if not items:
+            return False
+
+        relevant = self.relevance_filter(items) if self.relevance_filter else items
+        fresh = 0
+        for item in relevant:
+            key = _item_key(item)
+            if key in seen:
+                continue
+            seen.add(key)
+            results.append(item)
+            fresh += 1
+
+        if len(relevant) / len(items) < self.min_relevant_ratio:
+            return False
+        if relevant and fresh / len(relevant) < self.min_new_ratio:
+            return False
+        return not self._full(results)
+
+    def _full(self, results: List[Dict[str, Any]]) -> bool:
+        return self.max_results is not None and len(results) >= self.max_results
+
+    def _cap(self, results: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        return results[: self.max_results] if self.max_results is not None else results
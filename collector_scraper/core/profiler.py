@@ -0,0 +1,194 @@
+from __future__ import annotations
+
+import os
+import sys
+import threading
+import time
+from collections import Counter
+from contextlib import contextmanager
+from types import CodeType, FrameType
+from typing import Dict, Iterator, List, Tuple
+
+from collector_scraper.core.base_scraper import BaseScraper
+
+# Innermost matching frame decides the phase of a sample.
+PHASE_BY_FUNCTION: Dict[str, str] = {
+    "_clean_title": "clean_title",
+    "parse_price": "parse_price",
+    "rank_by_relevance": "relevance",
+    "score_titles": "relevance",
+    "dedupe": "dedup",
+    "fingerprint_region": "fingerprint",
+    "extract_listing": "structured",
+    "extract_product": "structured",
+}
+PHASE_BY_MODULE: Tuple[Tuple[str, str], ...] = (
+    (f"{os.sep}bs4{os.sep}", "html_parse"),
+    (f"{os.sep}soupsieve{os.sep}", "html_parse"),
+    (f"{os.sep}html{os.sep}parser.py", "html_parse"),
+    (f"{os.sep}socket.py", "network"),
+    (f"{os.sep}ssl.py", "network"),
+    (f"{os.sep}http{os.sep}client.py", "network"),
+    (f"{os.sep}urllib3{os.sep}", "network"),
+    (f"{os.sep}requests{os.sep}", "network"),
+    (f"{os.sep}json{os.sep}", "json"),
+)
+_IDLE_FUNCTIONS = {"wait", "_wait_for_tstate_lock", "acquire", "as_completed", "result", "_worker"}
+
+_PACKAGE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+_thread_labels: Dict[int, str] = {}
+
+
+@contextmanager
+def thread_label(label: str) -> Iterator[None]:
+    """Attribute samples from the current thread to ``label`` (usually a source)."""
+    ident = threading.get_ident()
+    previous = _thread_labels.get(ident)
+    _thread_labels[ident] = label
+    try:
+        yield
+    finally:
+        if previous is None:
+            _thread_labels.pop(ident, None)
+        else:
+            _thread_labels[ident] = previous
+
+
+class SamplingProfiler:
+    """Samples every thread's stack at a fixed interval while running.
+
+    Samples are grouped by source and phase. The source comes from
+    ``thread_label`` or, for helper threads such as page fetchers, from the
+    nearest adapter method on the stack; threads that never run scraper
+    code are not sampled. The phase comes from the innermost
+    frame that matches ``PHASE_BY_FUNCTION`` or ``PHASE_BY_MODULE``.
+    """
+
+    def __init__(self, interval_seconds: float = 0.005, max_depth: int = 64) -> None:
+        self.interval_seconds = interval_seconds
+        self.max_depth = max_depth
+        self.samples: Counter[Tuple[str, str, Tuple[str, ...]]] = Counter()
+        self.sample_count = 0
+        self.elapsed_seconds = 0.0
+        self._names: Dict[CodeType, str] = {}
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+        self._started = 0.0
+
+    def start(self) -> "SamplingProfiler":
+        if self._thread is None:
+            self._stop.clear()
+            self._started = time.perf_counter()
+            self._thread = threading.Thread(target=self._run, name="sampling-profiler", daemon=True)
+            self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        if self._thread is not None:
+            self._stop.set()
+            self._thread.join()
+            self._thread = None
+            self.elapsed_seconds += time.perf_counter() - self._started
+
+    def __enter__(self) -> "SamplingProfiler":
+        return self.start()
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.stop()
+
+    def _run(self) -> None:
+        own = threading.get_ident()
+        while not self._stop.wait(self.interval_seconds):
+            for ident, frame in sys._current_frames().items():
+                if ident != own:
+                    self._sample(ident, frame)
+            self.sample_count += 1
+
+    def _name(self, code: CodeType) -> str:
+        name = self._names.get(code)
+        if name is None:
+            module = os.path.splitext(os.path.basename(code.co_filename))[0]
+            name = self._names[code] = f"{module}:{code.co_name}"
+        return name
+
+    def _sample(self, ident: int, frame: FrameType | None) -> None:
+        frames: List[FrameType] = []
+        while frame is not None and len(frames) < self.max_depth:
+            frames.append(frame)
+            frame = frame.f_back
+
+        source = _thread_labels.get(ident) or self._source_from_stack(frames)
+        if source is None:
+            return
+        phase = self._phase(frames)
+        stack = tuple(self._name(item.f_code) for item in reversed(frames))
+        self.samples[(source, phase, stack)] += 1
+
+    @staticmethod
+    def _phase(frames: List[FrameType]) -> str:
+        if frames:
+            innermost = frames[0].f_code
+            if innermost.co_name in _IDLE_FUNCTIONS and (
+                "threading" in innermost.co_filename or "concurrent" in innermost.co_filename
+            ):
+                return "idle"
+        for frame in frames:
+            code = frame.f_code
+            phase = PHASE_BY_FUNCTION.get(code.co_name)
+            if phase:
+                return phase
+            for marker, module_phase in PHASE_BY_MODULE:
+                if marker in code.co_filename:
+                    return module_phase
+        return "other"
+
+    @staticmethod
+    def _source_from_stack(frames: List[FrameType]) -> str | None:
+        """Source of the nearest adapter on the stack, "-" for other scraper code, else None."""
+        in_package = False
+        for frame in frames:
+            if _PACKAGE_DIR not in frame.f_code.co_filename:
+                continue
+            in_package = True
+            if "self" not in frame.f_code.co_varnames:
+                continue
+            owner = frame.f_locals.get("self")
+            if isinstance(owner, BaseScraper):
+                return owner.source
+        # Threads that never enter this package (servers, unrelated pools) are skipped.
+        return "-" if in_package else None
+
+    def summary(self, include_idle: bool = False) -> Dict[str, Counter[str]]:
+        """Sample counts per source, broken down by phase."""
+        by_source: Dict[str, Counter[str]] = {}
+        for (source, phase, _), count in self.samples.items():
+            if phase == "idle" and not include_idle:
+                continue
+            by_source.setdefault(source, Counter())[phase] += count
+        return by_source
+
+    def format_summary(self, top_phases: int = 4) -> str:
+        # Sampling can fall behind its interval under load; scale by the real rate.
+        per_sample = self.elapsed_seconds / self.sample_count if self.sample_count else self.interval_seconds
+        lines = [f"{'source':<20} {'samples':>8} {'~thread s':>9}  top phases"]
+        rows = sorted(self.summary().items(), key=lambda pair: -sum(pair[1].values()))
+        for source, phases in rows:
+            total = sum(phases.values())
+            top = ", ".join(
+                f"{phase} {count / total:.0%}" for phase, count in phases.most_common(top_phases)
+            )
+            lines.append(f"{source:<20} {total:>8} {total * per_sample:>9.2f}  {top}")
+        return "\n".join(lines)
+
+    def collapsed_stacks(self, include_idle: bool = False) -> List[str]:
+        """Lines in flamegraph.pl / speedscope "collapsed" format, rooted at source and phase."""
+        merged: Counter[str] = Counter()
+        for (source, phase, stack), count in self.samples.items():
+            if phase == "idle" and not include_idle:
+                continue
+            merged[";".join((source, phase, *stack))] += count
+        return [f"{stack} {count}" for stack, count in merged.most_common()]
+
+    def write_collapsed(self, path: str, include_idle: bool = False) -> None:
+        with open(path, "w", encoding="utf-8") as handle:
+            handle.write("\n".join(self.collapsed_stacks(include_idle)) + "\n")
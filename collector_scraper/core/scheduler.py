@@ -0,0 +1,212 @@
+from __future__ import annotations
+
+import heapq
+import itertools
+import json
+import logging
+import random
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Callable, Dict, List, Sequence
+
+from collector_scraper.core.base_scraper import BaseScraper
+from collector_scraper.core.orchestrator import OrchestrationResult, run_all_scrapers
+from collector_scraper.scrapers import build_tier1_scrapers
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class ScrapeJob:
+    query: str
+    interval_seconds: float = 900.0
+    sources: List[str] | None = None
+    priority: int = 0
+    max_results_per_site: int = 40
+    include_sold: bool = False
+    name: str = ""
+
+    def __post_init__(self) -> None:
+        if not self.name:
+            self.name = self.query
+
+
+def load_jobs(path: str) -> List[ScrapeJob]:
+    """Read jobs from a JSON file holding a list of ``ScrapeJob`` fields."""
+    with open(path, "r", encoding="utf-8") as handle:
+        raw = json.load(handle)
+    entries = raw.get("jobs", []) if isinstance(raw, dict) else raw
+    return [ScrapeJob(**entry) for entry in entries]
+
+
+@dataclass
+class SchedulerStats:
+    queued: int = 0
+    due: int = 0
+    running: int = 0
+    runs: int = 0
+    failures: int = 0
+    last_lag_seconds: float = 0.0
+    max_lag_seconds: float = 0.0
+    lag_by_job: Dict[str, float] = field(default_factory=dict)
+    # repr() of each job's last failure; cleared when the job next succeeds.
+    errors_by_job: Dict[str, str] = field(default_factory=dict)
+
+
+class Scheduler:
+    """Resident scheduler that runs recurring scrape jobs on warm adapters.
+
+    Adapters (and their HTTP sessions) are built once and shared by every
+    job. Jobs are ordered by due time then priority (lower runs first); each
+    rescheduling adds jitter so jobs with the same interval spread out.
+    Per-site semaphores cap concurrent requests to any one source across
+    all running jobs.
+    """
+
+    def __init__(
+        self,
+        jobs: Sequence[ScrapeJob],
+        scrapers: Sequence[BaseScraper] | None = None,
+        max_concurrent_jobs: int = 2,
+        max_workers_per_job: int = 5,
+        site_concurrency: int = 2,
+        jitter_ratio: float = 0.1,
+        on_result: Callable[[ScrapeJob, OrchestrationResult], None] | None = None,
+    ) -> None:
+        self.scrapers: Dict[str, BaseScraper] = {
+            scraper.source: scraper for scraper in (scrapers or build_tier1_scrapers())
+        }
+        self.max_concurrent_jobs = max(1, max_concurrent_jobs)
+        self.max_workers_per_job = max_workers_per_job
+        self.jitter_ratio = jitter_ratio
+        self.on_result = on_result
+        self.site_limits = {
+            source: threading.BoundedSemaphore(max(1, site_concurrency)) for source in self.scrapers
+        }
+
+        self._heap: List[tuple[float, int, int, ScrapeJob]] = []
+        self._sequence = itertools.count()
+        self._lock = threading.Lock()
+        self._wakeup = threading.Condition(self._lock)
+        self._stop = threading.Event()
+        self._slots = threading.BoundedSemaphore(self.max_concurrent_jobs)
+        self._stats = SchedulerStats()
+        self._thread: threading.Thread | None = None
+
+        now = time.monotonic()
+        for job in jobs:
+            # Spread first runs a little so jobs loaded together don't start together.
+            self._push(job, now + random.uniform(0, job.interval_seconds * self.jitter_ratio))
+
+    def _jitter(self, interval: float) -> float:
+        spread = interval * self.jitter_ratio
+        return random.uniform(-spread, spread) if spread > 0 else 0.0
+
+    def _push(self, job: ScrapeJob, due: float) -> None:
+        heapq.heappush(self._heap, (due, job.priority, next(self._sequence), job))
+
+    def add_job(self, job: ScrapeJob) -> None:
+        with self._wakeup:
+            self._push(job, time.monotonic())
+            self._wakeup.notify()
+
+    def stats(self) -> SchedulerStats:
+        now = time.monotonic()
+        with self._lock:
+            self._stats.queued = len(self._heap)
+            self._stats.due = sum(1 for due, *_ in self._heap if due <= now)
+            return SchedulerStats(
+                **{
+                    **vars(self._stats),
+                    "lag_by_job": dict(self._stats.lag_by_job),
+                    "errors_by_job": dict(self._stats.errors_by_job),
+                }
+            )
+
+    def start(self) -> None:
+        if self._thread is None:
+            self._thread = threading.Thread(target=self.run_forever, name="scrape-scheduler", daemon=True)
+            self._thread.start()
+
+    def stop(self, timeout: float | None = None) -> None:
+        self._stop.set()
+        with self._wakeup:
+            self._wakeup.notify_all()
+        if self._thread is not None:
+            self._thread.join(timeout)
+
+    def run_forever(self) -> None:
+        with ThreadPoolExecutor(max_workers=self.max_concurrent_jobs, thread_name_prefix="scrape-job") as pool:
+            while not self._stop.is_set():
+                job, due = self._next_due_job()
+                if job is None:
+                    continue
+                # Wait for a free slot so queue depth keeps reflecting real backlog.
+                while not self._slots.acquire(timeout=0.5):
+                    if self._stop.is_set():
+                        with self._wakeup:
+                            self._push(job, due)
+                        return
+                pool.submit(self._run_job, job, due)
+
+    def _next_due_job(self) -> tuple[ScrapeJob | None, float]:
+        with self._wakeup:
+            while not self._stop.is_set():
+                if self._heap:
+                    due = self._heap[0][0]
+                    delay = due - time.monotonic()
+                    if delay <= 0:
+                        due, _, _, job = heapq.heappop(self._heap)
+                        return job, due
+                    self._wakeup.wait(timeout=min(delay, 1.0))
+                else:
+                    self._wakeup.wait(timeout=1.0)
+        return None, 0.0
+
+    def _run_job(self, job: ScrapeJob, due: float) -> None:
+        started = time.monotonic()
+        lag = max(0.0, started - due)
+        with self._lock:
+            self._stats.running += 1
+            self._stats.last_lag_seconds = lag
+            self._stats.max_lag_seconds = max(self._stats.max_lag_seconds, lag)
+            self._stats.lag_by_job[job.name] = lag
+
+        error: str | None = None
+        try:
+            selected = [
+                scraper
+                for source, scraper in self.scrapers.items()
+                if job.sources is None or source in job.sources
+            ]
+            if not selected:
+                raise ValueError(f"Job {job.name!r} selects no known sources: {job.sources}")
+            result = run_all_scrapers(
+                query=job.query,
+                scrapers=selected,
+                max_results_per_site=job.max_results_per_site,
+                max_workers=self.max_workers_per_job,
+                include_sold=job.include_sold,
+                site_limits=self.site_limits,
+            )
+            if self.on_result is not None:
+                self.on_result(job, result)
+        except Exception as exc:
+            logger.exception("Scrape job %r failed", job.name)
+            error = repr(exc)
+        finally:
+            with self._wakeup:
+                self._stats.running -= 1
+                self._stats.runs += 1
+                if error is not None:
+                    self._stats.failures += 1
+                    self._stats.errors_by_job[job.name] = error
+                else:
+                    self._stats.errors_by_job.pop(job.name, None)
+                # Schedule from the planned due time so runs don't drift later and later.
+                next_due = max(due + job.interval_seconds, time.monotonic()) + self._jitter(job.interval_seconds)
+                self._push(job, next_due)
+                self._wakeup.notify()
+            self._slots.release()
@@ -0,0 +1,285 @@
+from __future__ import annotations
+
+import itertools
+import json
+import logging
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, Iterator, List, Sequence, Tuple
+from urllib.parse import parse_qs, urlsplit
+
+from collector_scraper.core.base_scraper import BaseScraper
+from collector_scraper.core.orchestrator import OrchestrationResult, run_all_scrapers
+from collector_scraper.scrapers import build_tier1_scrapers
+
+QueryKey = Tuple[str, Tuple[str, ...], bool]
+
+logger = logging.getLogger(__name__)
+
+
+class ServiceBusy(RuntimeError):
+    """Raised when the number of distinct in-flight scrapes is at its cap."""
+
+
+@dataclass
+class _Flight:
+    """One in-flight scrape shared by every caller asking for the same key."""
+
+    events: List[Dict[str, Any]] = field(default_factory=list)
+    result: OrchestrationResult | None = None
+    error: BaseException | None = None
+    done: bool = False
+    condition: threading.Condition = field(default_factory=threading.Condition)
+
+    def publish(self, event: Dict[str, Any]) -> None:
+        with self.condition:
+            self.events.append(event)
+            self.condition.notify_all()
+
+    def finish(self, result: OrchestrationResult | None, error: BaseException | None) -> None:
+        with self.condition:
+            self.result = result
+            self.error = error
+            self.done = True
+            self.condition.notify_all()
+
+    def wait(self) -> OrchestrationResult:
+        with self.condition:
+            while not self.done:
+                self.condition.wait()
+        if self.error is not None:
+            raise self.error
+        assert self.result is not None
+        return self.result
+
+    def follow(self) -> Iterator[Dict[str, Any]]:
+        position = 0
+        while True:
+            with self.condition:
+                while position >= len(self.events) and not self.done:
+                    self.condition.wait()
+                pending = self.events[position:]
+                position = len(self.events)
+                finished = self.done
+            yield from pending
+            if finished and position >= len(self.events):
+                return
+
+
+class QueryService:
+    """Orchestrator front end with single-flight coalescing and a TTL cache.
+
+    Identical queries (same normalized text, source set and sold flag) that
+    arrive while a scrape is running wait on that scrape instead of starting
+    another one. Finished results are served from cache for ``ttl_seconds``;
+    expired entries are swept on every insert and the cache never holds more
+    than ``max_cached`` results (oldest dropped first).
+    """
+
+    def __init__(
+        self,
+        scrapers: Sequence[BaseScraper] | None = None,
+        ttl_seconds: float = 300.0,
+        max_inflight: int = 8,
+        max_workers: int = 5,
+        max_results_per_site: int = 40,
+        max_cached: int = 1024,
+    ) -> None:
+        self.scrapers: Dict[str, BaseScraper] = {
+            scraper.source: scraper for scraper in (scrapers or build_tier1_scrapers())
+        }
+        self.ttl_seconds = ttl_seconds
+        self.max_inflight = max_inflight
+        self.max_workers = max_workers
+        self.max_results_per_site = max_results_per_site
+        self.max_cached = max_cached
+        self._lock = threading.Lock()
+        self._inflight: Dict[QueryKey, _Flight] = {}
+        # Insertion order is age order: every entry lives exactly ttl_seconds.
+        self._cache: OrderedDict[QueryKey, Tuple[float, OrchestrationResult]] = OrderedDict()
+
+    def key(self, query: str, sources: Sequence[str] | None = None, include_sold: bool = False) -> QueryKey:
+        normalized = " ".join(query.lower().split())
+        selected = tuple(sorted(set(sources))) if sources else tuple(sorted(self.scrapers))
+        unknown = [source for source in selected if source not in self.scrapers]
+        if unknown:
+            raise ValueError(f"Unknown sources: {', '.join(unknown)}")
+        return normalized, selected, include_sold
+
+    def _cached(self, key: QueryKey) -> OrchestrationResult | None:
+        entry = self._cache.get(key)
+        if entry is None:
+            return None
+        stored_at, result = entry
+        if time.monotonic() - stored_at > self.ttl_seconds:
+            del self._cache[key]
+            return None
+        return result
+
+    def _store(self, key: QueryKey, result: OrchestrationResult) -> None:
+        now = time.monotonic()
+        self._cache.pop(key, None)
+        self._cache[key] = (now, result)
+        while self._cache:
+            oldest_key, (stored_at, _) = next(iter(self._cache.items()))
+            if now - stored_at <= self.ttl_seconds and len(self._cache) <= self.max_cached:
+                break
+            del self._cache[oldest_key]
+
+    def _join_or_start(self, key: QueryKey) -> Tuple[_Flight | None, OrchestrationResult | None, bool]:
+        """Return ``(flight, cached_result, is_leader)`` for ``key``."""
+        with self._lock:
+            cached = self._cached(key)
+            if cached is not None:
+                return None, cached, False
+            flight = self._inflight.get(key)
+            if flight is not None:
+                return flight, None, False
+            if len(self._inflight) >= self.max_inflight:
+                raise ServiceBusy(f"{len(self._inflight)} scrapes already in flight")
+            flight = _Flight()
+            self._inflight[key] = flight
+            return flight, None, True
+
+    def _lead(self, key: QueryKey, flight: _Flight, query: str) -> None:
+        _, sources, include_sold = key
+        result: OrchestrationResult | None = None
+        error: BaseException | None = None
+        try:
+            result = run_all_scrapers(
+                query=query,
+                scrapers=[self.scrapers[source] for source in sources],
+                max_results_per_site=self.max_results_per_site,
+                max_workers=self.max_workers,
+                include_sold=include_sold,
+                on_site_result=lambda source, items, err, elapsed: flight.publish(
+                    {"source": source, "items": items, "error": err, "elapsed_ms": elapsed}
+                ),
+            )
+        except BaseException as exc:
+            error = exc
+        finally:
+            with self._lock:
+                self._inflight.pop(key, None)
+                if result is not None:
+                    self._store(key, result)
+            flight.finish(result, error)
+
+    def search(
+        self,
+        query: str,
+        sources: Sequence[str] | None = None,
+        include_sold: bool = False,
+    ) -> Tuple[OrchestrationResult, str]:
+        """Return ``(result, cache_status)`` where status is "hit", "coalesced" or "miss"."""
+        key = self.key(query, sources, include_sold)
+        flight, cached, leader = self._join_or_start(key)
+        if cached is not None:
+            return cached, "hit"
+        assert flight is not None
+        if leader:
+            self._lead(key, flight, query)
+            return flight.wait(), "miss"
+        return flight.wait(), "coalesced"
+
+    def stream(
+        self,
+        query: str,
+        sources: Sequence[str] | None = None,
+        include_sold: bool = False,
+    ) -> Iterator[Tuple[str, Dict[str, Any]]]:
+        """Yield ``("site", partial)`` events as sites finish, then ``("result", full)``."""
+        key = self.key(query, sources, include_sold)
+        flight, cached, leader = self._join_or_start(key)
+        if cached is not None:
+            yield "result", {**cached.to_dict(), "cache": "hit"}
+            return
+        assert flight is not None
+        if leader:
+            threading.Thread(target=self._lead, args=(key, flight, query), daemon=True).start()
+        for event in flight.follow():
+            yield "site", event
+        yield "result", {**flight.wait().to_dict(), "cache": "miss" if leader else "coalesced"}
+
+
+class _Handler(BaseHTTPRequestHandler):
+    service: QueryService
+
+    def log_message(self, format: str, *args: Any) -> None:  # noqa: A002 - stdlib signature
+        pass
+
+    def _send_json(self, status: int, payload: Dict[str, Any], headers: Dict[str, str] | None = None) -> None:
+        self._send_body(status, json.dumps(payload).encode("utf-8"), headers)
+
+    def _send_body(self, status: int, body: bytes, headers: Dict[str, str] | None = None) -> None:
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self) -> None:  # noqa: N802 - stdlib naming
+        url = urlsplit(self.path)
+        params = parse_qs(url.query)
+        if url.path == "/healthz":
+            self._send_json(200, {"status": "ok"})
+            return
+        if url.path not in ("/search", "/search/stream"):
+            self._send_json(404, {"error": "not found"})
+            return
+
+        query = (params.get("q") or [""])[0].strip()
+        if not query:
+            self._send_json(400, {"error": "missing q"})
+            return
+        sources = [s for raw in params.get("sources", []) for s in raw.split(",") if s] or None
+        include_sold = (params.get("sold") or ["0"])[0].lower() in ("1", "true", "yes")
+
+        try:
+            if url.path == "/search/stream":
+                self._stream(query, sources, include_sold)
+                return
+            result, cache_status = self.service.search(query, sources, include_sold)
+            # Encoded here so a listing that can't be serialized is a 500, not a dropped connection.
+            body = json.dumps(result.to_dict()).encode("utf-8")
+        except ServiceBusy as exc:
+            self._send_json(503, {"error": str(exc)}, {"Retry-After": "5"})
+            return
+        except ValueError as exc:
+            self._send_json(400, {"error": str(exc)})
+            return
+        except Exception as exc:
+            logger.exception("Search %r failed", query)
+            self._send_json(500, {"error": f"{type(exc).__name__}: {exc}"})
+            return
+        self._send_body(200, body, {"X-Cache": cache_status})
+
+    def _stream(self, query: str, sources: List[str] | None, include_sold: bool) -> None:
+        events = self.service.stream(query, sources, include_sold)
+        # Pull the first event before sending headers so "busy" can still be a 503.
+        first = next(events)
+        self.send_response(200)
+        self.send_header("Content-Type", "text/event-stream")
+        self.send_header("Cache-Control", "no-cache")
+        self.end_headers()
+        try:
+            for name, payload in itertools.chain([first], events):
+                self._write_event(name, payload)
+        except Exception as exc:
+            self._write_event("error", {"error": str(exc)})
+
+    def _write_event(self, name: str, payload: Dict[str, Any]) -> None:
+        self.wfile.write(f"event: {name}\ndata: {json.dumps(payload)}\n\n".encode("utf-8"))
+        self.wfile.flush()
+
+
+def build_server(service: QueryService, host: str = "127.0.0.1", port: int = 8080) -> ThreadingHTTPServer:
+    handler = type("QueryServiceHandler", (_Handler,), {"service": service})
+    server = ThreadingHTTPServer((host, port), handler)
+    server.daemon_threads = True
+    return server
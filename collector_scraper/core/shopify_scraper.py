@@ -1,10 +1,53 @@
 from __future__ import annotations
 
-from typing import Any, Dict, List, Sequence
+import json
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Mapping, Sequence, TypeVar
 from urllib.parse import quote_plus, urljoin
 
 from collector_scraper.core.base_scraper import BaseScraper
+from collector_scraper.core.pagination import PageResult, Paginator, current_result_limit
 from collector_scraper.utils.price_parser import parse_price
+from collector_scraper.utils.relevance import rank_by_relevance
+
+if TYPE_CHECKING:
+    import requests
+
+    from collector_scraper.core.generic_html_scraper import GenericListScraper
+
+T = TypeVar("T")
+
+
+@lru_cache(maxsize=None)
+def _html_fallback_class() -> type[GenericListScraper]:
+    """Selector scraper for Online Store 2.0 search pages, defined once per process."""
+    from collector_scraper.core.generic_html_scraper import GenericListScraper
+
+    class ShopifyHTMLFallback(GenericListScraper):
+        item_selector = ".card-wrapper, .grid__item, .product-item, .product-card"
+        title_selectors = (
+            "a.full-unstyled-link",
+            ".card__heading a",
+            ".product-item__title",
+            "a[href*='/products/']",
+        )
+        price_selectors = (
+            ".price-item--last",
+            ".price-item--regular",
+            ".price",
+            ".money",
+        )
+        link_selectors = (
+            "a.full-unstyled-link",
+            ".card__heading a",
+            "a[href*='/products/']",
+        )
+
+    return ShopifyHTMLFallback
 
 
 class ShopifyPredictiveScraper(BaseScraper):
@@ -13,6 +56,17 @@ class ShopifyPredictiveScraper(BaseScraper):
     base_url: str = ""
     max_items: int = 60
     fallback_html_templates: Sequence[str] = ()
+    # Currency of JSON prices, which carry no symbol; None leaves it unknown.
+    currency: str | None = None
+    max_pages: int = 1
+    page_workers: int = 3
+    # Pages of /products.json (250 products each) to mirror for deeper results
+    # instead of paging the HTML search; 0 disables it.
+    catalog_pages: int = 0
+    catalog_ttl_seconds: float = 900.0
+    _html_fallback: GenericListScraper | None = None
+    _catalog: List[Dict[str, Any]] | None = None
+    _catalog_fetched_at: float = 0.0
 
     def build_predictive_url(self, query: str) -> str:
         encoded_query = quote_plus(query.strip())
@@ -21,19 +75,39 @@ class ShopifyPredictiveScraper(BaseScraper):
             f"q={encoded_query}&resources[type]=product&resources[limit]={self.max_items}"
         )
 
+    def build_page_url(self, query: str, page: int) -> str:
+        encoded_query = quote_plus(query.strip())
+        return f"{self.base_url.rstrip('/')}/search?q={encoded_query}&type=product&page={page}"
+
+    def build_catalog_url(self, page: int) -> str:
+        return f"{self.base_url.rstrip('/')}/products.json?limit=250&page={page}"
+
     def search(self, query: str) -> List[Dict[str, Any]]:
+        """Predictive search, then the catalog, then HTML search; raises if no request got an answer."""
+        answered = False
+        last_error: Exception | None = None
         # First try the Shopify predictive endpoint.
         try:
-            response = self._request(
-                self.build_predictive_url(query),
-                extra_headers={"Accept": "application/json"},
+            predictive_url = self.build_predictive_url(query)
+            parsed = self._parse_with_fingerprint(
+                predictive_url,
+                self._fetch_bytes(predictive_url, extra_headers={"Accept": "application/json"}),
+                lambda body: self.parse_listing(json.loads(body)),
             )
-            payload = response.json()
-            parsed = self.parse_listing(payload)
+            answered = True
             if parsed:
-                return parsed[: self.max_items]
-        except Exception:
-            pass
+                return self._fetch_more_pages(query, parsed)[: self.max_items]
+        except Exception as exc:
+            last_error = exc
+
+        if self.catalog_pages > 0:
+            try:
+                matches = self.search_catalog(query)
+                answered = True
+            except Exception as exc:
+                last_error, matches = exc, []
+            if matches:
+                return matches[: self.max_items]
 
         # Fall back to HTML search pages for themes that disable suggest.json.
         encoded_query = quote_plus(query.strip())
@@ -42,16 +116,45 @@ class ShopifyPredictiveScraper(BaseScraper):
             f"{self.base_url.rstrip('/')}/search?q={{query}}",
         )
         for template in templates:
+            url = template.format(query=encoded_query)
             try:
-                response = self._request(template.format(query=encoded_query))
-            except Exception:
+                body = self._fetch_text(url)
+            except Exception as exc:
+                last_error = exc
                 continue
-            html_results = self._parse_html_listing(response.text)
+            answered = True
+            html_results = self._parse_with_fingerprint(url, body, self._parse_html_listing)
+            del body
             if html_results:
                 return html_results[: self.max_items]
 
+        if not answered and last_error is not None:
+            raise last_error
         return []
 
+    def _fetch_more_pages(self, query: str, first_page: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        # Predictive search is capped to one short page; deeper results come
+        # from the paginated HTML search, deduped against what we already have.
+        if self.catalog_pages > 0:
+            # Suggest URLs carry tracking params (?_pos=...&_sid=...); compare by path.
+            seen = {str(item.get("url") or "").split("?", 1)[0] for item in first_page}
+            extra = [item for item in self.search_catalog(query) if str(item.get("url")).split("?", 1)[0] not in seen]
+            return first_page + extra
+        if self.max_pages <= 1:
+            return first_page
+
+        def fetch_page(page: int) -> PageResult:
+            url = self.build_page_url(query, page)
+            return PageResult(self._parse_with_fingerprint(url, self._fetch_text(url), self._parse_html_listing))
+
+        paginator = Paginator(
+            fetch_page,
+            max_pages=self.max_pages,
+            workers=self.page_workers,
+            max_results=current_result_limit(self.max_items),
+        )
+        return paginator.collect(first_page, start_page=1)
+
     def parse_listing(self, payload: Any) -> List[Dict[str, Any]]:
         if not isinstance(payload, dict):
             return []
@@ -88,38 +191,81 @@ class ShopifyPredictiveScraper(BaseScraper):
                         "price": price,
                         "source": self.source,
                         "url": urljoin(self.base_url, raw_url),
+                        "currency": self.currency,
                     }
                 )
             )
         return results
 
-    def _parse_html_listing(self, html: str) -> List[Dict[str, Any]]:
-        from collector_scraper.core.generic_html_scraper import GenericListScraper
+    def search_catalog(self, query: str) -> List[Dict[str, Any]]:
+        return rank_by_relevance(self.fetch_catalog(), query)
 
-        class _Fallback(GenericListScraper):
-            pass
+    def fetch_catalog(self) -> List[Dict[str, Any]]:
+        """Every product from /products.json, re-fetched at most every ``catalog_ttl_seconds``."""
+        with self._get_catalog_lock():
+            if self._catalog is None or time.monotonic() - self._catalog_fetched_at > self.catalog_ttl_seconds:
 
-        fallback = _Fallback()
-        fallback.source = self.source
-        fallback.base_url = self.base_url
-        fallback.item_selector = ".card-wrapper, .grid__item, .product-item, .product-card"
-        fallback.title_selectors = (
-            "a.full-unstyled-link",
-            ".card__heading a",
-            ".product-item__title",
-            "a[href*='/products/']",
-        )
-        fallback.price_selectors = (
-            ".price-item--last",
-            ".price-item--regular",
-            ".price",
-            ".money",
-        )
-        fallback.link_selectors = (
-            "a.full-unstyled-link",
-            ".card__heading a",
-            "a[href*='/products/']",
-        )
+                def fetch_page(page: int) -> PageResult:
+                    url = self.build_catalog_url(page)
+                    body = self._fetch_bytes(url, extra_headers={"Accept": "application/json"})
+                    return PageResult(
+                        self._parse_with_fingerprint(url, body, lambda body: self.parse_catalog(json.loads(body)))
+                    )
+
+                # The catalog isn't query-ordered, so only empty pages stop paging.
+                paginator = Paginator(
+                    fetch_page,
+                    max_pages=self.catalog_pages,
+                    workers=self.page_workers,
+                    min_new_ratio=0.0,
+                    min_relevant_ratio=0.0,
+                )
+                self._catalog = paginator.collect()
+                self._catalog_fetched_at = time.monotonic()
+            return self._catalog
+
+    def _get_catalog_lock(self) -> threading.Lock:
+        # setdefault is atomic, so concurrent first searches share one lock.
+        return self.__dict__.setdefault("_catalog_lock", threading.Lock())
+
+    def parse_catalog(self, payload: Any) -> List[Dict[str, Any]]:
+        products = payload.get("products") if isinstance(payload, dict) else None
+        if not isinstance(products, list):
+            return []
+
+        results: List[Dict[str, Any]] = []
+        for product in products:
+            if not isinstance(product, dict) or not product.get("title") or not product.get("handle"):
+                continue
+            variants = [variant for variant in product.get("variants") or () if isinstance(variant, dict)]
+            # products.json prices are decimal strings in the store currency, not cents.
+            available = [variant for variant in variants if variant.get("available", True)] or variants
+            prices = [parse_price(str(variant.get("price")))[0] for variant in available]
+            prices = [price for price in prices if price is not None]
+            if not prices:
+                continue
+            results.append(
+                self.normalize(
+                    {
+                        "title": str(product["title"]).strip(),
+                        "price": min(prices),
+                        "source": self.source,
+                        "url": urljoin(self.base_url, f"/products/{product['handle']}"),
+                        "currency": self.currency,
+                    }
+                )
+            )
+        return results
+
+    def _parse_html_listing(self, html: str) -> List[Dict[str, Any]]:
+        structured = self.parse_structured(html)
+        if structured:
+            return structured[: self.max_items]
+        fallback = self._html_fallback
+        if fallback is None or fallback.source != self.source or fallback.base_url != self.base_url:
+            fallback = self._html_fallback = _html_fallback_class()()
+            fallback.source = self.source
+            fallback.base_url = self.base_url
         fallback.max_items = self.max_items
         return fallback.parse_listing(html) or fallback._parse_anchor_fallback(html)
 
@@ -142,7 +288,7 @@ class ShopifyPredictiveScraper(BaseScraper):
             product.get("formatted_price"),
         )
         for candidate in text_candidates:
-            price = parse_price(str(candidate))
+            price, _ = parse_price(str(candidate))
             if price is not None:
                 return price
         return None
@@ -169,4 +315,119 @@ class ShopifyPredictiveScraper(BaseScraper):
                 return round(value / 100.0, 2)
             return round(value, 2)
 
-        return parse_price(text)
+        return parse_price(text)[0]
+
+
+@dataclass
+class ShopifyStore:
+    """One storefront driven by ``ShopifyStoreEngine``."""
+
+    source: str
+    base_url: str
+    currency: str | None = None
+    requests_per_second: float | None = None
+    max_items: int = 60
+    max_pages: int = 1
+    catalog_pages: int = 0
+
+
+class ShopifyStoreEngine(BaseScraper):
+    """Searches many Shopify stores from a list, concurrently, as one adapter.
+
+    Every store gets a ``ShopifyPredictiveScraper`` sharing one session
+    (with a connection pool per store host) and the compiled HTML fallback.
+    ``suggest.json`` requests for all stores go out at once, so a query costs
+    about as long as the slowest store rather than the sum of them. Each
+    store is its own source: the orchestrator caps, times and reports errors
+    for it separately (see ``map_sources``).
+    """
+
+    source = "shopify"
+    stores: Sequence[ShopifyStore | Mapping[str, Any]] = ()
+    store_workers: int = 32
+    pool_maxsize: int = 4
+    _store_scrapers: List[ShopifyPredictiveScraper] | None = None
+    _built_from: Sequence[Any] | None = None
+
+    def __init__(self, stores: Sequence[ShopifyStore | Mapping[str, Any]] | None = None) -> None:
+        if stores is not None:
+            self.stores = tuple(stores)
+
+    def store_scrapers(self) -> List[ShopifyPredictiveScraper]:
+        # Built on first use so registry settings applied after __init__ count.
+        if self._store_scrapers is None or self._built_from is not self.stores:
+            self._store_scrapers = [self._build_store_scraper(store) for store in self.stores]
+            self._built_from = self.stores
+        return self._store_scrapers
+
+    def _build_store_scraper(self, store: ShopifyStore | Mapping[str, Any]) -> ShopifyPredictiveScraper:
+        if not isinstance(store, ShopifyStore):
+            store = ShopifyStore(**store)
+        scraper = ShopifyPredictiveScraper()
+        scraper.source = store.source
+        scraper.base_url = store.base_url
+        scraper.max_items = store.max_items
+        scraper.max_pages = store.max_pages
+        scraper.catalog_pages = store.catalog_pages
+        scraper.currency = store.currency
+        scraper.request_throttle = self._store_throttle(store)
+        return scraper
+
+    def _store_throttle(self, store: ShopifyStore) -> Any:
+        from collector_scraper.scrapers.registry import IntervalThrottle
+
+        interval = IntervalThrottle(store.requests_per_second) if store.requests_per_second else None
+
+        def throttle(url: str) -> None:
+            if interval is not None:
+                interval(url)
+            # Looked up per call: queue workers install theirs after the engine is built.
+            if self.request_throttle is not None:
+                self.request_throttle(url)
+
+        return throttle
+
+    def _build_session(self) -> requests.Session:
+        from requests.adapters import HTTPAdapter
+
+        session = super()._build_session()
+        # The default adapter keeps pools for only 10 hosts; keep one per store.
+        adapter = HTTPAdapter(
+            pool_connections=max(10, len(self.stores)),
+            pool_maxsize=self.pool_maxsize,
+            max_retries=session.get_adapter("https://").max_retries,
+        )
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        return session
+
+    def map_sources(self, run: Callable[[BaseScraper], T]) -> List[T]:
+        """``run`` for every store at once, in store order."""
+        scrapers = self.store_scrapers()
+        if not scrapers:
+            return []
+        session = self._get_session()
+        for scraper in scrapers:
+            scraper._session = session
+            scraper.fingerprint_store = self.fingerprint_store
+            scraper.change_listener = self.change_listener
+        with ThreadPoolExecutor(max_workers=max(1, min(self.store_workers, len(scrapers)))) as executor:
+            return list(executor.map(run, scrapers))
+
+    def search(self, query: str) -> List[Dict[str, Any]]:
+        """Listings from every store; raises only when every store failed."""
+
+        def search_store(scraper: BaseScraper) -> tuple[List[Dict[str, Any]], str | None]:
+            try:
+                return scraper.search(query), None
+            except Exception as exc:
+                return [], f"{scraper.source}: {exc}"
+
+        outcomes = self.map_sources(search_store)
+        errors = [error for _, error in outcomes if error]
+        if outcomes and len(errors) == len(outcomes):
+            raise RuntimeError(f"every store failed ({'; '.join(errors)})")
+        return [item for items, _ in outcomes for item in items]
+
+    def parse_listing(self, payload: Any) -> List[Dict[str, Any]]:
+        return []
@@ -0,0 +1,216 @@
+from __future__ import annotations
+
+import threading
+import time
+import xml.etree.ElementTree as ElementTree
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass
+from typing import Any, Dict, List, Sequence, Tuple
+from urllib.robotparser import RobotFileParser
+
+from collector_scraper.core.base_scraper import BaseScraper
+from collector_scraper.core.catalog_mirror import CatalogMirror
+from collector_scraper.core.pagination import current_result_limit
+from collector_scraper.utils.structured_data import extract_product
+
+
+@dataclass
+class SitemapEntry:
+    url: str
+    lastmod: str = ""
+
+
+@dataclass
+class CrawlReport:
+    listed: int = 0
+    fetched: int = 0
+    changed: int = 0
+    removed: int = 0
+    failed: int = 0
+    disallowed: int = 0
+    complete: bool = False
+    elapsed_s: float = 0.0
+
+
+def parse_sitemap(body: bytes | str) -> Tuple[List[SitemapEntry], List[str]]:
+    """``(page entries, child sitemap URLs)`` from a sitemap or sitemap index."""
+    root = ElementTree.fromstring(body)
+    entries: List[SitemapEntry] = []
+    children: List[str] = []
+    for node in root:
+        fields = {child.tag.rsplit("}", 1)[-1]: (child.text or "").strip() for child in node}
+        if not fields.get("loc"):
+            continue
+        if node.tag.endswith("sitemap"):
+            children.append(fields["loc"])
+        else:
+            entries.append(SitemapEntry(fields["loc"], fields.get("lastmod", "")))
+    return entries, children
+
+
+class SitemapCatalogMixin(BaseScraper):
+    """Serves searches from a local index of product pages discovered through the sitemap.
+
+    ``refresh_catalog`` reads robots.txt and the sitemap(s), then fetches
+    new product pages and pages whose ``lastmod`` changed (or that were
+    last fetched more than ``recrawl_seconds`` ago when the sitemap has
+    no ``lastmod``), at most ``crawl_workers`` at a time and
+    ``crawl_requests_per_second`` overall. Title and price come from the
+    page's structured data. Once one refresh has covered the whole catalog
+    (every sitemap read, no page failed or left over for the next run by
+    ``crawl_max_pages``), ``search`` answers from it instead of scraping
+    search pages, until that complete crawl is older than
+    ``catalog_max_age_seconds``.
+    """
+
+    catalog_path: str | None = None
+    sitemap_urls: Sequence[str] = ()
+    product_url_patterns: Sequence[str] = ()
+    crawl_workers: int = 4
+    crawl_requests_per_second: float = 2.0
+    crawl_max_pages: int = 500
+    recrawl_seconds: float = 7 * 86400.0
+    # A catalog whose last complete crawl is older than this isn't trusted for prices; 0 disables it.
+    catalog_max_age_seconds: float = 3 * 86400.0
+    max_sitemaps: int = 50
+    sitemap_max_bytes: int = 52_428_800  # The sitemap protocol's own limit (50 MiB uncompressed).
+    _catalog: CatalogMirror | None = None
+
+    def search(self, query: str) -> List[Dict[str, Any]]:
+        if self.catalog_ready():
+            return self.search_catalog(query)
+        return super().search(query)
+
+    def _get_crawl_lock(self) -> threading.Lock:
+        # One lock per store; dict.setdefault is atomic, so concurrent first calls share it.
+        return self.__dict__.setdefault("_crawl_lock", threading.Lock())
+
+    def get_catalog(self) -> CatalogMirror:
+        if self._catalog is None:
+            self._catalog = CatalogMirror(self.catalog_path or ":memory:")
+        return self._catalog
+
+    def catalog_ready(self) -> bool:
+        if not self.catalog_path:
+            return False
+        completed = self.get_catalog().last_complete_sync(self.source)
+        if completed <= 0:
+            return False
+        return not self.catalog_max_age_seconds or time.time() - completed <= self.catalog_max_age_seconds
+
+    def search_catalog(self, query: str) -> List[Dict[str, Any]]:
+        return self.get_catalog().search(self.source, query, limit=current_result_limit())
+
+    def is_product_url(self, url: str) -> bool:
+        return not self.product_url_patterns or any(pattern in url for pattern in self.product_url_patterns)
+
+    def _robots(self) -> RobotFileParser:
+        # Same rules as RobotFileParser.read(): 401/403 forbid everything, other errors allow everything.
+        robots = RobotFileParser()
+        try:
+            response = self._request(f"{self.base_url.rstrip('/')}/robots.txt", allowed_statuses=(401, 403, 404))
+        except Exception:
+            robots.parse([])
+            return robots
+        if response.status_code in (401, 403):
+            robots.disallow_all = True
+        robots.parse(response.text.splitlines() if response.status_code == 200 else [])
+        return robots
+
+    def discover(self, robots: RobotFileParser) -> Tuple[List[SitemapEntry], bool]:
+        """Product entries from every reachable sitemap, and whether all of them were read."""
+        pending = list(self.sitemap_urls or robots.site_maps() or [f"{self.base_url.rstrip('/')}/sitemap.xml"])
+        visited = set()
+        entries: Dict[str, SitemapEntry] = {}
+        complete = True
+        while pending and len(visited) < self.max_sitemaps:
+            sitemap_url = pending.pop(0)
+            if sitemap_url in visited:
+                continue
+            visited.add(sitemap_url)
+            try:
+                found, children = parse_sitemap(self._request(sitemap_url, max_bytes=self.sitemap_max_bytes).content)
+            except Exception:
+                complete = False
+                continue
+            pending.extend(children)
+            for entry in found:
+                if self.is_product_url(entry.url):
+                    entries.setdefault(entry.url, entry)
+        return list(entries.values()), complete and not pending
+
+    def refresh_catalog(self) -> CrawlReport:
+        from collector_scraper.scrapers.registry import IntervalThrottle
+
+        with self._get_crawl_lock():
+            started = time.time()
+            report = CrawlReport()
+            catalog = self.get_catalog()
+            robots = self._robots()
+            entries, complete = self.discover(robots)
+
+            allowed = [entry for entry in entries if robots.can_fetch(self.user_agent, entry.url)]
+            report.disallowed = len(entries) - len(allowed)
+            report.listed = len(allowed)
+
+            known = catalog.revisions(self.source)
+            stale = [entry for entry in allowed if self._is_stale(entry, known.get(entry.url), started)]
+            # New pages first, then the most recently modified.
+            stale.sort(key=lambda entry: entry.lastmod, reverse=True)
+            stale.sort(key=lambda entry: entry.url in known)
+            truncated = len(stale) > self.crawl_max_pages
+            stale = stale[: self.crawl_max_pages]
+
+            catalog.mark_seen(self.source, (entry.url for entry in allowed if entry.url in known), started)
+
+            delay = robots.crawl_delay(self.user_agent)
+            rate = self.crawl_requests_per_second
+            if delay:
+                rate = min(rate, 1.0 / float(delay))
+            throttle = IntervalThrottle(rate)
+            products: List[Tuple[str, Dict[str, Any]]] = []
+            revisions: Dict[str, str] = {}
+            with ThreadPoolExecutor(max_workers=max(1, self.crawl_workers)) as executor:
+                futures = {executor.submit(self._fetch_product, entry.url, throttle): entry for entry in stale}
+                for future in as_completed(futures):
+                    entry = futures[future]
+                    try:
+                        item = future.result()
+                    except Exception:
+                        report.failed += 1
+                        continue
+                    report.fetched += 1
+                    if item is not None:
+                        products.append((entry.url, item))
+                        revisions[entry.url] = entry.lastmod
+
+            report.changed = catalog.upsert(self.source, products, seen_at=started, revisions=revisions)
+            if complete and allowed:
+                report.removed = catalog.remove_unseen(self.source, since=started)
+            report.complete = complete and not truncated and not report.failed
+            catalog.mark_synced(self.source, started, full=complete, complete=report.complete)
+            report.elapsed_s = round(time.time() - started, 3)
+            return report
+
+    def _is_stale(self, entry: SitemapEntry, known: Tuple[str, float] | None, now: float) -> bool:
+        if known is None:
+            return True
+        revision, checked_at = known
+        if entry.lastmod:
+            return entry.lastmod != revision
+        return now - checked_at > self.recrawl_seconds
+
+    def _fetch_product(self, url: str, throttle: Any) -> Dict[str, Any] | None:
+        throttle(url)
+        product = extract_product(self._fetch_text(url))
+        if product is None:
+            return None
+        return self.normalize(
+            {
+                "title": product["title"],
+                "price": product["price"],
+                "source": self.source,
+                "url": url,
+                "currency": product["currency"],
+            }
+        )
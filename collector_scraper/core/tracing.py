@@ -0,0 +1,249 @@
+from __future__ import annotations
+
+import json
+import os
+import threading
+import time
+from bisect import bisect_left
+from dataclasses import asdict, dataclass, field
+from typing import Any, Dict, Iterable, List, Protocol, Tuple
+
+# Upper bounds (seconds) of the Prometheus duration histogram buckets.
+DEFAULT_BUCKETS: Tuple[float, ...] = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+
+@dataclass
+class Span:
+    name: str
+    source: str | None
+    started_at: float
+    duration_ms: float
+    attributes: Dict[str, Any] = field(default_factory=dict)
+    error: str | None = None
+
+    def to_dict(self) -> Dict[str, Any]:
+        return asdict(self)
+
+
+class SpanCollector(Protocol):
+    def collect(self, span: Span) -> None:
+        ...
+
+
+class _NullSpan:
+    recording = False
+
+    def set(self, key: str, value: Any) -> None:
+        pass
+
+    def __enter__(self) -> "_NullSpan":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> bool:
+        return False
+
+
+_NULL_SPAN = _NullSpan()
+
+
+class _ActiveSpan:
+    __slots__ = ("tracer", "name", "source", "attributes", "_started_at", "_start")
+    recording = True
+
+    def __init__(self, tracer: "Tracer", name: str, source: str | None, attributes: Dict[str, Any]) -> None:
+        self.tracer = tracer
+        self.name = name
+        self.source = source
+        self.attributes = attributes
+
+    def set(self, key: str, value: Any) -> None:
+        self.attributes[key] = value
+
+    def __enter__(self) -> "_ActiveSpan":
+        self._started_at = time.time()
+        self._start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type: Any, exc: Any, tb: Any) -> bool:
+        duration_ms = (time.perf_counter() - self._start) * 1000
+        self.tracer.record(
+            Span(
+                name=self.name,
+                source=self.source,
+                started_at=self._started_at,
+                duration_ms=duration_ms,
+                attributes=self.attributes,
+                error=exc_type.__name__ if exc_type is not None else None,
+            )
+        )
+        return False
+
+
+class Tracer:
+    """Times named spans and hands each finished span to every collector."""
+
+    def __init__(self, collectors: Iterable[SpanCollector] = ()) -> None:
+        self.collectors = list(collectors)
+
+    def span(self, name: str, source: str | None = None, **attributes: Any) -> _ActiveSpan:
+        return _ActiveSpan(self, name, source, attributes)
+
+    def record(self, span: Span) -> None:
+        for collector in self.collectors:
+            collector.collect(span)
+
+
+_tracer: Tracer | None = None
+
+
+def set_tracer(tracer: Tracer | None) -> None:
+    """Install the process-wide tracer; ``None`` turns tracing off."""
+    global _tracer
+    _tracer = tracer
+
+
+def get_tracer() -> Tracer | None:
+    return _tracer
+
+
+def span(name: str, source: str | None = None, **attributes: Any) -> _ActiveSpan | _NullSpan:
+    """Context manager timing ``name``; a shared no-op when no tracer is installed."""
+    tracer = _tracer
+    if tracer is None:
+        return _NULL_SPAN
+    return tracer.span(name, source, **attributes)
+
+
+class InMemoryCollector:
+    def __init__(self) -> None:
+        self.spans: List[Span] = []
+        self._lock = threading.Lock()
+
+    def collect(self, span: Span) -> None:
+        with self._lock:
+            self.spans.append(span)
+
+    def summary(self) -> Dict[str, Dict[str, float]]:
+        """Count, total and max milliseconds per span name."""
+        totals: Dict[str, Dict[str, float]] = {}
+        with self._lock:
+            spans = list(self.spans)
+        for span in spans:
+            entry = totals.setdefault(span.name, {"count": 0, "total_ms": 0.0, "max_ms": 0.0})
+            entry["count"] += 1
+            entry["total_ms"] += span.duration_ms
+            entry["max_ms"] = max(entry["max_ms"], span.duration_ms)
+        return totals
+
+
+class JsonlCollector:
+    """Append spans to a JSON Lines file, buffered and flushed every ``flush_every`` spans."""
+
+    def __init__(self, path: str, flush_every: int = 50) -> None:
+        self.path = path
+        self.flush_every = max(1, flush_every)
+        self._buffer: List[str] = []
+        self._lock = threading.Lock()
+
+    def collect(self, span: Span) -> None:
+        line = json.dumps(span.to_dict(), default=str) + "\n"
+        with self._lock:
+            self._buffer.append(line)
+            if len(self._buffer) >= self.flush_every:
+                self._flush_locked()
+
+    def flush(self) -> None:
+        with self._lock:
+            self._flush_locked()
+
+    def _flush_locked(self) -> None:
+        if not self._buffer:
+            return
+        with open(self.path, "a", encoding="utf-8") as handle:
+            handle.write("".join(self._buffer))
+        self._buffer.clear()
+
+
+def _label_value(value: Any) -> str:
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+class PrometheusCollector:
+    """Aggregate spans into Prometheus metrics rendered in the text exposition format.
+
+    Durations go into one histogram labelled by span and source; request
+    spans also add to byte, retry and status-code counters.
+    """
+
+    def __init__(self, buckets: Tuple[float, ...] = DEFAULT_BUCKETS, prefix: str = "collector_scraper") -> None:
+        self.buckets = tuple(sorted(buckets))
+        self.prefix = prefix
+        self._histograms: Dict[Tuple[str, str], List[int]] = {}
+        self._sums: Dict[Tuple[str, str], float] = {}
+        self._errors: Dict[Tuple[str, str], int] = {}
+        self._bytes: Dict[str, int] = {}
+        self._retries: Dict[str, int] = {}
+        self._statuses: Dict[Tuple[str, str], int] = {}
+        self._lock = threading.Lock()
+
+    def collect(self, span: Span) -> None:
+        key = (span.name, span.source or "")
+        seconds = span.duration_ms / 1000
+        with self._lock:
+            counts = self._histograms.get(key)
+            if counts is None:
+                counts = self._histograms[key] = [0] * (len(self.buckets) + 1)
+            counts[bisect_left(self.buckets, seconds)] += 1
+            self._sums[key] = self._sums.get(key, 0.0) + seconds
+            if span.error:
+                self._errors[key] = self._errors.get(key, 0) + 1
+            if span.name == "request":
+                source = span.source or ""
+                self._bytes[source] = self._bytes.get(source, 0) + int(span.attributes.get("bytes", 0))
+                self._retries[source] = self._retries.get(source, 0) + int(span.attributes.get("retries", 0))
+                status_key = (source, str(span.attributes.get("status", "error")))
+                self._statuses[status_key] = self._statuses.get(status_key, 0) + 1
+
+    def render(self) -> str:
+        name = f"{self.prefix}_span_duration_seconds"
+        lines = [f"# HELP {name} Time spent in instrumented phases.", f"# TYPE {name} histogram"]
+        with self._lock:
+            for (span_name, source), counts in sorted(self._histograms.items()):
+                labels = f'span="{_label_value(span_name)}",source="{_label_value(source)}"'
+                cumulative = 0
+                for bound, count in zip(self.buckets, counts):
+                    cumulative += count
+                    lines.append(f'{name}_bucket{{{labels},le="{bound}"}} {cumulative}')
+                cumulative += counts[-1]
+                lines.append(f'{name}_bucket{{{labels},le="+Inf"}} {cumulative}')
+                lines.append(f"{name}_sum{{{labels}}} {self._sums[(span_name, source)]:.6f}")
+                lines.append(f"{name}_count{{{labels}}} {cumulative}")
+
+            errors = {
+                f'span="{_label_value(span_name)}",source="{_label_value(source)}"': value
+                for (span_name, source), value in self._errors.items()
+            }
+            received = {f'source="{_label_value(source)}"': value for source, value in self._bytes.items()}
+            retries = {f'source="{_label_value(source)}"': value for source, value in self._retries.items()}
+            statuses = {
+                f'source="{_label_value(source)}",status="{status}"': value
+                for (source, status), value in self._statuses.items()
+            }
+        lines.extend(self._counter("span_errors_total", "Spans that ended with an exception.", errors))
+        lines.extend(self._counter("http_response_bytes_total", "Response body bytes received.", received))
+        lines.extend(self._counter("http_retries_total", "Retries performed by urllib3.", retries))
+        lines.extend(self._counter("http_responses_total", "Responses by final status code.", statuses))
+        return "\n".join(lines) + "\n"
+
+    def _counter(self, metric: str, help_text: str, values: Dict[str, int]) -> List[str]:
+        name = f"{self.prefix}_{metric}"
+        lines = [f"# HELP {name} {help_text}", f"# TYPE {name} counter"]
+        lines.extend(f"{name}{{{labels}}} {value}" for labels, value in sorted(values.items()))
+        return lines
+
+    def write(self, path: str) -> None:
+        """Write the current metrics atomically, e.g. for node_exporter's textfile collector."""
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as handle:
+            handle.write(self.render())
+        os.replace(tmp_path, path)
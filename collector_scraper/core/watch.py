@@ -0,0 +1,229 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import socket
+import threading
+import time
+from dataclasses import asdict, dataclass
+from typing import Any, Dict, Iterable, List, Protocol, Sequence
+
+from collector_scraper.core.orchestrator import OrchestrationResult
+from collector_scraper.utils.listing_diff import diff_listings
+
+
+@dataclass
+class ChangeEvent:
+    query: str
+    kind: str  # "new", "removed", "price_up" or "price_down"
+    source: str | None
+    url: str | None
+    product_name: str | None
+    old_price: float | None
+    new_price: float | None
+    currency: str | None
+    observed_at: float
+
+    def to_dict(self) -> Dict[str, Any]:
+        return asdict(self)
+
+
+def _event(query: str, kind: str, item: Dict[str, Any], observed_at: float, old_price: Any = None) -> ChangeEvent:
+    return ChangeEvent(
+        query=query,
+        kind=kind,
+        source=item.get("source"),
+        url=item.get("url"),
+        product_name=item.get("product_name"),
+        old_price=old_price if kind != "new" else None,
+        new_price=item.get("price") if kind != "removed" else None,
+        currency=item.get("currency"),
+        observed_at=observed_at,
+    )
+
+
+def _failed_sources(result: OrchestrationResult) -> set:
+    return {error.get("source") for error in result.errors}
+
+
+def compute_events(
+    previous: OrchestrationResult | None,
+    current: OrchestrationResult,
+    observed_at: float | None = None,
+) -> List[ChangeEvent]:
+    """Per-listing change events between two runs of the same query, keyed by URL.
+
+    Sources that hit their per-site cap this run report no removals: a
+    listing missing from them may only have been ranked below the cut.
+    """
+    if previous is None:
+        return []
+
+    stamp = observed_at if observed_at is not None else time.time()
+    # A site that failed this run says nothing about its listings being gone.
+    failed = _failed_sources(current)
+    diff = diff_listings(
+        [item for item in previous.items if item.get("source") not in failed],
+        current.items,
+    )
+    events = [_event(current.query, "new", item, stamp) for item in diff.new]
+    capped = set(current.capped_sources)
+    events.extend(
+        _event(current.query, "removed", item, stamp, old_price=item.get("price"))
+        for item in diff.removed
+        if item.get("source") not in capped
+    )
+    for change in diff.repriced:
+        old_price, new_price = change["old_price"], change["new_price"]
+        try:
+            kind = "price_up" if float(new_price) > float(old_price) else "price_down"
+        except (TypeError, ValueError):
+            kind = "price_up"
+        events.append(_event(current.query, kind, change["item"], stamp, old_price=old_price))
+    return events
+
+
+def _query_key(query: str) -> str:
+    normalized = " ".join(query.lower().split())
+    return hashlib.sha1(normalized.encode("utf-8")).hexdigest()
+
+
+class SnapshotStore:
+    """Last ``OrchestrationResult`` per query, one JSON file per query.
+
+    Without a directory, snapshots are only kept in memory.
+    """
+
+    def __init__(self, directory: str | None = None) -> None:
+        self.directory = directory
+        self._memory: Dict[str, OrchestrationResult] = {}
+        self._lock = threading.Lock()
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.directory or "", f"{key}.json")
+
+    def load(self, query: str) -> OrchestrationResult | None:
+        key = _query_key(query)
+        with self._lock:
+            if key in self._memory:
+                return self._memory[key]
+        if not self.directory:
+            return None
+        try:
+            with open(self._path(key), "r", encoding="utf-8") as handle:
+                snapshot = OrchestrationResult.from_dict(json.load(handle))
+        except (OSError, ValueError, TypeError):
+            return None
+        with self._lock:
+            self._memory[key] = snapshot
+        return snapshot
+
+    def save(self, result: OrchestrationResult) -> None:
+        key = _query_key(result.query)
+        with self._lock:
+            self._memory[key] = result
+        if not self.directory:
+            return
+        path = self._path(key)
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as handle:
+            json.dump(result.to_dict(), handle)
+        os.replace(tmp_path, path)
+
+
+class EventSink(Protocol):
+    def emit(self, events: Sequence[ChangeEvent]) -> None:
+        ...
+
+
+class MemorySink:
+    def __init__(self) -> None:
+        self.events: List[ChangeEvent] = []
+        self._lock = threading.Lock()
+
+    def emit(self, events: Sequence[ChangeEvent]) -> None:
+        with self._lock:
+            self.events.extend(events)
+
+
+class JsonlSink:
+    """Append events to a JSON Lines file."""
+
+    def __init__(self, path: str) -> None:
+        self.path = path
+        self._lock = threading.Lock()
+
+    def emit(self, events: Sequence[ChangeEvent]) -> None:
+        if not events:
+            return
+        payload = "".join(json.dumps(event.to_dict()) + "\n" for event in events)
+        with self._lock, open(self.path, "a", encoding="utf-8") as handle:
+            handle.write(payload)
+
+
+class SocketSink:
+    """Send events as JSON lines to a local TCP ``(host, port)`` or Unix socket path."""
+
+    def __init__(self, address: str | tuple[str, int], timeout_seconds: float = 5.0) -> None:
+        self.address = address
+        self.timeout_seconds = timeout_seconds
+        self._lock = threading.Lock()
+
+    def emit(self, events: Sequence[ChangeEvent]) -> None:
+        if not events:
+            return
+        payload = "".join(json.dumps(event.to_dict()) + "\n" for event in events).encode("utf-8")
+        family = socket.AF_UNIX if isinstance(self.address, str) else socket.AF_INET
+        with self._lock, socket.socket(family, socket.SOCK_STREAM) as sock:
+            sock.settimeout(self.timeout_seconds)
+            sock.connect(self.address)
+            sock.sendall(payload)
+
+
+class WebhookSink:
+    """POST each batch of events as JSON to a webhook URL."""
+
+    def __init__(self, url: str, timeout_seconds: float = 10.0, session: Any = None) -> None:
+        self.url = url
+        self.timeout_seconds = timeout_seconds
+        self._session = session
+
+    def emit(self, events: Sequence[ChangeEvent]) -> None:
+        if not events:
+            return
+        if self._session is None:
+            import requests
+
+            self._session = requests.Session()
+        response = self._session.post(
+            self.url,
+            json={"events": [event.to_dict() for event in events]},
+            timeout=self.timeout_seconds,
+        )
+        response.raise_for_status()
+
+
+class Watcher:
+    """Diff each new result against the stored snapshot and emit change events."""
+
+    def __init__(self, store: SnapshotStore, sinks: Iterable[EventSink] = ()) -> None:
+        self.store = store
+        self.sinks = list(sinks)
+
+    def observe(self, result: OrchestrationResult) -> List[ChangeEvent]:
+        previous = self.store.load(result.query)
+        events = compute_events(previous, result)
+
+        failed = _failed_sources(result)
+        if previous is not None and failed:
+            # Carry failed sites' last known listings forward for the next diff.
+            carried = [item for item in previous.items if item.get("source") in failed]
+            result = OrchestrationResult.from_dict({**result.to_dict(), "items": result.items + carried})
+        self.store.save(result)
+        if events:
+            for sink in self.sinks:
+                sink.emit(events)
+        return events
@@ -1,38 +1,210 @@
 from __future__ import annotations
 
-from typing import Any, Dict, List
+import json
+import logging
+import threading
+import time
+from typing import Any, Dict, Iterator, List, Tuple
 from urllib.parse import quote_plus
 
 from collector_scraper.core.base_scraper import BaseScraper
+from collector_scraper.core.catalog_mirror import CatalogMirror
+from collector_scraper.core.pagination import PageResult, Paginator, current_result_limit
 from collector_scraper.utils.price_parser import parse_price
 
+logger = logging.getLogger(__name__)
+
 
 class WooCommerceStoreScraper(BaseScraper):
     """Scraper that uses WooCommerce Store API public product search."""
 
     base_url: str = ""
     per_page: int = 30
+    max_pages: int = 1
+    page_workers: int = 3
+    # With a mirror path, searches are answered from a local copy of the whole
+    # catalog. Once it is older than mirror_refresh_seconds, a search starts an
+    # incremental refresh in the background and is answered from the copy meanwhile.
+    mirror_path: str | None = None
+    mirror_per_page: int = 100
+    mirror_max_pages: int = 100
+    mirror_refresh_seconds: float = 3600.0
+    mirror_full_refresh_seconds: float = 86400.0
+    # After a failed background refresh, the next one waits this long.
+    mirror_retry_seconds: float = 300.0
+    last_mirror_error: str | None = None
+    _mirror: CatalogMirror | None = None
+    _mirror_retry_at: float = 0.0
 
-    def build_search_url(self, query: str) -> str:
+    def build_search_url(self, query: str, page: int = 1) -> str:
         encoded_query = quote_plus(query.strip())
-        return (
+        url = (
             f"{self.base_url.rstrip('/')}/wp-json/wc/store/v1/products"
             f"?search={encoded_query}&per_page={self.per_page}"
         )
+        return f"{url}&page={page}" if page > 1 else url
+
+    def build_catalog_url(self, page: int, modified_after: float | None = None) -> str:
+        url = (
+            f"{self.base_url.rstrip('/')}/wp-json/wc/store/v1/products"
+            f"?per_page={self.mirror_per_page}&page={page}&orderby=id&order=asc"
+        )
+        if modified_after is not None:
+            after = time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(modified_after))
+            url += f"&date_column=modified_gmt&after={after}"
+        return url
 
     def search(self, query: str) -> List[Dict[str, Any]]:
+        if self.mirror_path:
+            return self.search_mirror(query)
+        return self._search_live(query)
+
+    def _search_live(self, query: str) -> List[Dict[str, Any]]:
+        first_page = self._fetch_page(query, 1)
+        if self.max_pages <= 1 or not first_page.items:
+            return first_page.items
+
+        paginator = Paginator(
+            lambda page: self._fetch_page(query, page),
+            max_pages=self.max_pages,
+            workers=self.page_workers,
+            max_results=current_result_limit(),
+            total_pages=first_page.total_pages,
+        )
+        return paginator.collect(first_page.items, start_page=2)
+
+    def _fetch_page(self, query: str, page: int) -> PageResult:
+        url = self.build_search_url(query, page)
         response = self._request(
-            self.build_search_url(query),
+            url,
             extra_headers={"Accept": "application/json"},
         )
+        return PageResult(
+            self._parse_with_fingerprint(url, response.content, lambda body: self.parse_listing(json.loads(body))),
+            total_pages=self._total_pages(response.headers.get("X-WP-TotalPages")),
+        )
+
+    def _get_mirror_lock(self) -> threading.Lock:
+        # One lock per store; dict.setdefault is atomic, so concurrent first calls share it.
+        return self.__dict__.setdefault("_mirror_lock", threading.Lock())
+
+    def get_mirror(self) -> CatalogMirror:
+        if self._mirror is None:
+            self._mirror = CatalogMirror(self.mirror_path or ":memory:")
+        return self._mirror
+
+    def search_mirror(self, query: str) -> List[Dict[str, Any]]:
+        """Answer from the mirror without waiting on the network.
+
+        A due refresh runs on a background thread. Until the first sync has
+        finished there is nothing to answer from, so those searches go to the
+        live Store API.
+        """
+        mirror = self.get_mirror()
+        last_sync, last_full_sync = mirror.sync_state(self.source)
+        if self._refresh_due(last_sync, last_full_sync, time.time()):
+            self.start_mirror_refresh()
+        if last_sync <= 0:
+            return self._search_live(query)
+        return mirror.search(self.source, query, limit=current_result_limit())
+
+    def start_mirror_refresh(self) -> threading.Thread | None:
+        """Run ``refresh_mirror`` on a background thread; None if one is running or a retry is pending."""
+        if time.monotonic() < self._mirror_retry_at:
+            return None
+        running = self.__dict__.setdefault("_refresh_running", threading.Lock())
+        if not running.acquire(blocking=False):
+            return None
+
+        def refresh() -> None:
+            try:
+                self.refresh_mirror()
+            except Exception as exc:
+                self.last_mirror_error = f"{type(exc).__name__}: {exc}"
+                self._mirror_retry_at = time.monotonic() + self.mirror_retry_seconds
+                logger.warning("Mirror refresh for %s failed: %s", self.source, self.last_mirror_error)
+            else:
+                self.last_mirror_error = None
+            finally:
+                running.release()
+
+        thread = threading.Thread(target=refresh, name=f"mirror-{self.source}", daemon=True)
+        thread.start()
+        return thread
+
+    def _refresh_due(self, last_sync: float, last_full_sync: float, now: float) -> bool:
+        return (
+            now - last_full_sync >= self.mirror_full_refresh_seconds
+            or now - last_sync >= self.mirror_refresh_seconds
+        )
+
+    def refresh_mirror(self, force_full: bool = False) -> int:
+        """Bring the mirror up to date if it is stale; return the number of changed products.
+
+        A full sync pages the whole catalog concurrently; products that
+        disappeared are only dropped when it read every page. In between,
+        only products modified since the last sync (less a small clock-skew
+        margin) are fetched. A full sync that could not finish (no page
+        count, or more than ``mirror_max_pages``) still counts as one, so the
+        next is not due for another ``mirror_full_refresh_seconds``.
+        """
+        with self._get_mirror_lock():
+            mirror = self.get_mirror()
+            last_sync, last_full_sync = mirror.sync_state(self.source)
+            started = time.time()
+            full = force_full or started - last_full_sync >= self.mirror_full_refresh_seconds
+            if not full and not self._refresh_due(last_sync, last_full_sync, started):
+                return 0
+
+            modified_after = None if full else last_sync - 300
+            first_page = self._fetch_catalog_page(1, modified_after)
+            paginator = Paginator(
+                lambda page: self._fetch_catalog_page(page, modified_after),
+                max_pages=self.mirror_max_pages,
+                workers=self.page_workers,
+                total_pages=first_page.total_pages,
+                min_new_ratio=0.0,
+                min_relevant_ratio=0.0,
+            )
+            products = paginator.collect(first_page.items, start_page=2)
+            complete = first_page.total_pages is not None and 1 + paginator.pages_fetched >= min(
+                first_page.total_pages, self.mirror_max_pages
+            )
+
+            changed = mirror.upsert(
+                self.source,
+                ((str(item.pop("product_id")), item) for item in products),
+                seen_at=started,
+            )
+            if full and complete:
+                changed += mirror.remove_unseen(self.source, since=started)
+            mirror.mark_synced(self.source, started, full=full)
+            return changed
+
+    def _fetch_catalog_page(self, page: int, modified_after: float | None) -> PageResult:
+        url = self.build_catalog_url(page, modified_after)
+        response = self._request(url, extra_headers={"Accept": "application/json"})
         payload = response.json()
-        return self.parse_listing(payload)
+        items = [
+            dict(item, product_id=product.get("id", item["url"])) for product, item in self._iter_products(payload)
+        ]
+        return PageResult(items, total_pages=self._total_pages(response.headers.get("X-WP-TotalPages")))
+
+    @staticmethod
+    def _total_pages(raw: Any) -> int | None:
+        try:
+            return int(raw)
+        except (TypeError, ValueError):
+            return None
 
     def parse_listing(self, payload: Any) -> List[Dict[str, Any]]:
+        return [item for _, item in self._iter_products(payload)]
+
+    def _iter_products(self, payload: Any) -> Iterator[Tuple[Dict[str, Any], Dict[str, Any]]]:
+        """``(raw product, normalized item)`` for every priced product in a Store API page."""
         if not isinstance(payload, list):
-            return []
+            return
 
-        results: List[Dict[str, Any]] = []
         for product in payload:
             if not isinstance(product, dict):
                 continue
@@ -45,18 +217,15 @@ class WooCommerceStoreScraper(BaseScraper):
             if price is None:
                 continue
 
-            results.append(
-                self.normalize(
-                    {
-                        "title": str(title).strip(),
-                        "price": price,
-                        "source": self.source,
-                        "url": product.get("permalink"),
-                        "currency": currency,
-                    }
-                )
+            yield product, self.normalize(
+                {
+                    "title": str(title).strip(),
+                    "price": price,
+                    "source": self.source,
+                    "url": product.get("permalink"),
+                    "currency": currency,
+                }
             )
-        return results
 
     @staticmethod
     def _extract_price(product: Dict[str, Any]) -> tuple[float | None, str | None]:
@@ -75,7 +244,7 @@ class WooCommerceStoreScraper(BaseScraper):
         # Some stores include user-facing text with currency symbol.
         for key in ("price_html",):
             value = prices.get(key)
-            numeric = parse_price(str(value)) if value is not None else None
+            numeric = parse_price(str(value))[0] if value is not None else None
             if numeric is not None:
                 return numeric, currency_code
 
@@ -103,4 +272,4 @@ class WooCommerceStoreScraper(BaseScraper):
         if text.isdigit():
             return round(float(int(text)) / scale, 2)
 
-        return parse_price(text)
+        return parse_price(text)[0]
@@ -0,0 +1,598 @@
+from __future__ import annotations
+
+import hmac
+import json
+import os
+import socket
+import sqlite3
+import threading
+import time
+import uuid
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import TYPE_CHECKING, Any, Dict, Iterator, List, Mapping, Protocol, Sequence
+from urllib.parse import urlsplit
+
+from collector_scraper.core.base_scraper import BaseScraper
+from collector_scraper.core.orchestrator import OrchestrationResult, finalize_result, run_scraper
+from collector_scraper.scrapers import build_tier1_scrapers
+from collector_scraper.utils.dedup import MinHashDeduplicator, default_deduplicator
+from collector_scraper.utils.relevance import RelevanceEngine, default_engine
+
+if TYPE_CHECKING:
+    import requests
+
+
+@dataclass
+class Task:
+    """One ``(query, source)`` unit of work as handed to a worker."""
+
+    id: int
+    batch_id: str
+    query: str
+    source: str
+    sold: bool
+    max_results: int
+    attempts: int
+    max_attempts: int
+    lease_token: str
+
+
+@dataclass
+class TaskResult:
+    source: str
+    sold: bool
+    items: List[Dict[str, Any]]
+    error: str | None
+    elapsed_ms: int
+    max_results: int = 0
+
+
+class Broker(Protocol):
+    def enqueue(
+        self,
+        query: str,
+        sources: Sequence[str],
+        include_sold: Sequence[str] = (),
+        max_results_per_site: int = 40,
+        max_attempts: int = 3,
+    ) -> str:
+        ...
+
+    def claim(self, worker_id: str, lease_seconds: float) -> Task | None:
+        ...
+
+    def renew(self, task: Task, lease_seconds: float) -> bool:
+        ...
+
+    def complete(self, task: Task, result: TaskResult, worker_id: str) -> bool:
+        ...
+
+    def fail(self, task: Task, error: str, retry_delay: float) -> bool:
+        ...
+
+    def reserve_slot(self, host: str, interval_seconds: float) -> float:
+        ...
+
+    def batch_results(self, batch_id: str) -> tuple[bool, List[TaskResult]]:
+        ...
+
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS tasks (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    batch_id TEXT NOT NULL,
+    query TEXT NOT NULL,
+    source TEXT NOT NULL,
+    sold INTEGER NOT NULL DEFAULT 0,
+    max_results INTEGER NOT NULL,
+    status TEXT NOT NULL DEFAULT 'pending',
+    attempts INTEGER NOT NULL DEFAULT 0,
+    max_attempts INTEGER NOT NULL,
+    available_at REAL NOT NULL,
+    lease_owner TEXT,
+    lease_token TEXT,
+    lease_expires REAL,
+    last_error TEXT
+);
+CREATE INDEX IF NOT EXISTS tasks_claim_idx ON tasks (status, available_at);
+CREATE INDEX IF NOT EXISTS tasks_batch_idx ON tasks (batch_id);
+CREATE TABLE IF NOT EXISTS task_results (
+    task_id INTEGER PRIMARY KEY REFERENCES tasks (id),
+    batch_id TEXT NOT NULL,
+    source TEXT NOT NULL,
+    sold INTEGER NOT NULL,
+    items TEXT NOT NULL,
+    error TEXT,
+    elapsed_ms INTEGER NOT NULL,
+    worker TEXT,
+    finished_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS task_results_batch_idx ON task_results (batch_id);
+CREATE TABLE IF NOT EXISTS host_slots (
+    host TEXT PRIMARY KEY,
+    next_at REAL NOT NULL
+);
+"""
+
+
+class SQLiteBroker:
+    """Task queue, result sink and shared rate limiter in one SQLite file.
+
+    Every worker process that opens the same file claims from the same
+    queue. The file must be on a local disk of the host that opens it: WAL
+    mode coordinates through shared memory, which NFS and SMB volumes don't
+    provide. Workers on other hosts reach it through ``build_broker_server``
+    and ``HTTPBroker``. Claims hold a lease; a task whose lease runs
+    out is handed to the next worker, and results from the earlier holder are
+    rejected by its stale lease token. Timestamps are wall-clock seconds so
+    they compare across processes.
+    """
+
+    def __init__(self, path: str, busy_timeout_seconds: float = 30.0) -> None:
+        self.path = path
+        self.busy_timeout_seconds = busy_timeout_seconds
+        self._local = threading.local()
+        self._connection().executescript(_SCHEMA)
+
+    def _connection(self) -> sqlite3.Connection:
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=self.busy_timeout_seconds, isolation_level=None)
+            conn.row_factory = sqlite3.Row
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+        return conn
+
+    @contextmanager
+    def _transaction(self) -> Iterator[sqlite3.Connection]:
+        conn = self._connection()
+        # IMMEDIATE takes the write lock up front so two claimers can't pick the same row.
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            yield conn
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+        conn.execute("COMMIT")
+
+    def enqueue(
+        self,
+        query: str,
+        sources: Sequence[str],
+        include_sold: Sequence[str] = (),
+        max_results_per_site: int = 40,
+        max_attempts: int = 3,
+    ) -> str:
+        """Queue one task per source (plus sold tasks for ``include_sold``); return the batch id."""
+        batch_id = uuid.uuid4().hex
+        now = time.time()
+        rows = [(batch_id, query, source, 0, max_results_per_site, max_attempts, now) for source in sources]
+        rows.extend((batch_id, query, source, 1, max_results_per_site, max_attempts, now) for source in include_sold)
+        with self._transaction() as conn:
+            conn.executemany(
+                "INSERT INTO tasks (batch_id, query, source, sold, max_results, max_attempts, available_at) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                rows,
+            )
+        return batch_id
+
+    def _record(self, conn: sqlite3.Connection, row: sqlite3.Row, result: TaskResult, worker_id: str | None) -> None:
+        conn.execute(
+            "INSERT OR REPLACE INTO task_results "
+            "(task_id, batch_id, source, sold, items, error, elapsed_ms, worker, finished_at) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            (
+                row["id"],
+                row["batch_id"],
+                result.source,
+                int(result.sold),
+                json.dumps(result.items),
+                result.error,
+                result.elapsed_ms,
+                worker_id,
+                time.time(),
+            ),
+        )
+
+    def claim(self, worker_id: str, lease_seconds: float) -> Task | None:
+        now = time.time()
+        with self._transaction() as conn:
+            # Leases that ran out on their last attempt are failures, not retries.
+            exhausted = conn.execute(
+                "SELECT * FROM tasks WHERE status = 'leased' AND lease_expires < ? AND attempts >= max_attempts",
+                (now,),
+            ).fetchall()
+            for row in exhausted:
+                error = f"lease expired on attempt {row['attempts']} ({row['lease_owner']})"
+                conn.execute(
+                    "UPDATE tasks SET status = 'failed', last_error = ?, lease_token = NULL WHERE id = ?",
+                    (error, row["id"]),
+                )
+                self._record(conn, row, TaskResult(row["source"], bool(row["sold"]), [], error, 0), None)
+
+            row = conn.execute(
+                "SELECT * FROM tasks "
+                "WHERE (status = 'pending' AND available_at <= ?) OR (status = 'leased' AND lease_expires < ?) "
+                "ORDER BY available_at, id LIMIT 1",
+                (now, now),
+            ).fetchone()
+            if row is None:
+                return None
+            token = uuid.uuid4().hex
+            conn.execute(
+                "UPDATE tasks SET status = 'leased', attempts = attempts + 1, lease_owner = ?, "
+                "lease_token = ?, lease_expires = ? WHERE id = ?",
+                (worker_id, token, now + lease_seconds, row["id"]),
+            )
+        return Task(
+            id=row["id"],
+            batch_id=row["batch_id"],
+            query=row["query"],
+            source=row["source"],
+            sold=bool(row["sold"]),
+            max_results=row["max_results"],
+            attempts=row["attempts"] + 1,
+            max_attempts=row["max_attempts"],
+            lease_token=token,
+        )
+
+    def renew(self, task: Task, lease_seconds: float) -> bool:
+        with self._transaction() as conn:
+            updated = conn.execute(
+                "UPDATE tasks SET lease_expires = ? WHERE id = ? AND status = 'leased' AND lease_token = ?",
+                (time.time() + lease_seconds, task.id, task.lease_token),
+            )
+        return updated.rowcount == 1
+
+    def complete(self, task: Task, result: TaskResult, worker_id: str) -> bool:
+        """Store ``result`` unless the lease was lost to another worker; return whether it was kept."""
+        with self._transaction() as conn:
+            row = conn.execute(
+                "SELECT * FROM tasks WHERE id = ? AND status = 'leased' AND lease_token = ?",
+                (task.id, task.lease_token),
+            ).fetchone()
+            if row is None:
+                return False
+            conn.execute("UPDATE tasks SET status = 'done', lease_token = NULL WHERE id = ?", (task.id,))
+            self._record(conn, row, result, worker_id)
+        return True
+
+    def fail(self, task: Task, error: str, retry_delay: float) -> bool:
+        """Requeue after ``retry_delay`` or, with no attempts left, store the error as the result."""
+        with self._transaction() as conn:
+            row = conn.execute(
+                "SELECT * FROM tasks WHERE id = ? AND status = 'leased' AND lease_token = ?",
+                (task.id, task.lease_token),
+            ).fetchone()
+            if row is None:
+                return False
+            if row["attempts"] < row["max_attempts"]:
+                conn.execute(
+                    "UPDATE tasks SET status = 'pending', available_at = ?, last_error = ?, "
+                    "lease_owner = NULL, lease_token = NULL, lease_expires = NULL WHERE id = ?",
+                    (time.time() + retry_delay, error, task.id),
+                )
+            else:
+                conn.execute(
+                    "UPDATE tasks SET status = 'failed', last_error = ?, lease_token = NULL WHERE id = ?",
+                    (error, task.id),
+                )
+                self._record(conn, row, TaskResult(task.source, task.sold, [], error, 0), row["lease_owner"])
+        return True
+
+    def reserve_slot(self, host: str, interval_seconds: float) -> float:
+        """Book the next request slot for ``host``; return seconds to wait until it."""
+        now = time.time()
+        with self._transaction() as conn:
+            row = conn.execute("SELECT next_at FROM host_slots WHERE host = ?", (host,)).fetchone()
+            slot = max(now, row["next_at"]) if row is not None else now
+            conn.execute(
+                "INSERT INTO host_slots (host, next_at) VALUES (?, ?) "
+                "ON CONFLICT (host) DO UPDATE SET next_at = excluded.next_at",
+                (host, slot + interval_seconds),
+            )
+        return slot - now
+
+    def batch_results(self, batch_id: str) -> tuple[bool, List[TaskResult]]:
+        """Return ``(finished, results)``; ``finished`` once every task in the batch is done or failed."""
+        conn = self._connection()
+        open_tasks = conn.execute(
+            "SELECT COUNT(*) FROM tasks WHERE batch_id = ? AND status IN ('pending', 'leased')",
+            (batch_id,),
+        ).fetchone()[0]
+        rows = conn.execute(
+            "SELECT task_results.*, tasks.max_results FROM task_results "
+            "JOIN tasks ON tasks.id = task_results.task_id WHERE task_results.batch_id = ? ORDER BY task_id",
+            (batch_id,),
+        ).fetchall()
+        results = [
+            TaskResult(
+                source=row["source"],
+                sold=bool(row["sold"]),
+                items=json.loads(row["items"]),
+                error=row["error"],
+                elapsed_ms=row["elapsed_ms"],
+                max_results=row["max_results"],
+            )
+            for row in rows
+        ]
+        return open_tasks == 0, results
+
+    def queue_depth(self) -> Dict[str, int]:
+        rows = self._connection().execute("SELECT status, COUNT(*) FROM tasks GROUP BY status").fetchall()
+        return {row[0]: row[1] for row in rows}
+
+
+
+class BrokerError(RuntimeError):
+    """A broker server rejected a call or could not be reached."""
+
+
+class HTTPBroker:
+    """``Broker`` for workers on other hosts, calling a ``build_broker_server`` endpoint.
+
+    Every call is one POST to ``<url>/<method>``; the queue, the leases and
+    the host slots all live in the server's ``SQLiteBroker``, so rate limits
+    hold across every worker on every host. Lease times are the server's
+    clock, so worker clocks need not agree.
+    """
+
+    def __init__(self, url: str, token: str | None = None, timeout_seconds: float = 30.0) -> None:
+        self.url = url.rstrip("/")
+        self.token = token
+        self.timeout_seconds = timeout_seconds
+        self._local = threading.local()
+
+    def _session(self) -> requests.Session:
+        session = getattr(self._local, "session", None)
+        if session is None:
+            import requests
+
+            session = requests.Session()
+            if self.token:
+                session.headers["Authorization"] = f"Bearer {self.token}"
+            self._local.session = session
+        return session
+
+    def _call(self, method: str, **arguments: Any) -> Any:
+        try:
+            response = self._session().post(f"{self.url}/{method}", json=arguments, timeout=self.timeout_seconds)
+        except OSError as exc:
+            raise BrokerError(f"broker {self.url} unreachable: {exc}") from exc
+        payload = response.json() if response.headers.get("Content-Type") == "application/json" else {}
+        if response.status_code != 200:
+            raise BrokerError(f"broker {method} failed ({response.status_code}): {payload.get('error')}")
+        return payload["result"]
+
+    def enqueue(
+        self,
+        query: str,
+        sources: Sequence[str],
+        include_sold: Sequence[str] = (),
+        max_results_per_site: int = 40,
+        max_attempts: int = 3,
+    ) -> str:
+        return self._call(
+            "enqueue",
+            query=query,
+            sources=list(sources),
+            include_sold=list(include_sold),
+            max_results_per_site=max_results_per_site,
+            max_attempts=max_attempts,
+        )
+
+    def claim(self, worker_id: str, lease_seconds: float) -> Task | None:
+        task = self._call("claim", worker_id=worker_id, lease_seconds=lease_seconds)
+        return Task(**task) if task is not None else None
+
+    def renew(self, task: Task, lease_seconds: float) -> bool:
+        return self._call("renew", task=asdict(task), lease_seconds=lease_seconds)
+
+    def complete(self, task: Task, result: TaskResult, worker_id: str) -> bool:
+        return self._call("complete", task=asdict(task), result=asdict(result), worker_id=worker_id)
+
+    def fail(self, task: Task, error: str, retry_delay: float) -> bool:
+        return self._call("fail", task=asdict(task), error=error, retry_delay=retry_delay)
+
+    def reserve_slot(self, host: str, interval_seconds: float) -> float:
+        return self._call("reserve_slot", host=host, interval_seconds=interval_seconds)
+
+    def batch_results(self, batch_id: str) -> tuple[bool, List[TaskResult]]:
+        finished, results = self._call("batch_results", batch_id=batch_id)
+        return finished, [TaskResult(**result) for result in results]
+
+    def queue_depth(self) -> Dict[str, int]:
+        return self._call("queue_depth")
+
+
+def _broker_call(broker: SQLiteBroker, method: str, arguments: Dict[str, Any]) -> Any:
+    if method in ("renew", "complete", "fail"):
+        arguments["task"] = Task(**arguments["task"])
+    if method == "complete":
+        arguments["result"] = TaskResult(**arguments["result"])
+    result = getattr(broker, method)(**arguments)
+    if method == "claim":
+        return asdict(result) if result is not None else None
+    if method == "batch_results":
+        finished, results = result
+        return finished, [asdict(task_result) for task_result in results]
+    return result
+
+
+class _BrokerHandler(BaseHTTPRequestHandler):
+    broker: SQLiteBroker
+    token: str | None = None
+    methods = ("enqueue", "claim", "renew", "complete", "fail", "reserve_slot", "batch_results", "queue_depth")
+
+    def log_message(self, format: str, *args: Any) -> None:  # noqa: A002 - stdlib signature
+        pass
+
+    def _send_json(self, status: int, payload: Dict[str, Any]) -> None:
+        body = json.dumps(payload).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_POST(self) -> None:  # noqa: N802 - stdlib naming
+        if self.token and not hmac.compare_digest(
+            self.headers.get("Authorization", ""), f"Bearer {self.token}"
+        ):
+            self._send_json(401, {"error": "bad token"})
+            return
+        method = urlsplit(self.path).path.strip("/")
+        if method not in self.methods:
+            self._send_json(404, {"error": f"unknown method {method!r}"})
+            return
+        try:
+            arguments = json.loads(self.rfile.read(int(self.headers.get("Content-Length") or 0)) or b"{}")
+            result = _broker_call(self.broker, method, arguments)
+        except (TypeError, ValueError, KeyError) as exc:
+            self._send_json(400, {"error": f"{type(exc).__name__}: {exc}"})
+            return
+        except Exception as exc:
+            self._send_json(500, {"error": f"{type(exc).__name__}: {exc}"})
+            return
+        self._send_json(200, {"result": result})
+
+
+def build_broker_server(
+    broker: SQLiteBroker, host: str = "127.0.0.1", port: int = 8765, token: str | None = None
+) -> ThreadingHTTPServer:
+    """HTTP endpoint that lets ``HTTPBroker`` workers on other hosts share ``broker``."""
+    handler = type("BrokerHandler", (_BrokerHandler,), {"broker": broker, "token": token})
+    server = ThreadingHTTPServer((host, port), handler)
+    server.daemon_threads = True
+    return server
+
+
+def open_broker(location: str, token: str | None = None) -> Broker:
+    """``HTTPBroker`` for an ``http(s)://`` URL, otherwise a ``SQLiteBroker`` on that file."""
+    if location.startswith(("http://", "https://")):
+        return HTTPBroker(location, token=token)
+    return SQLiteBroker(location)
+
+def gather_result(
+    broker: Broker,
+    batch_id: str,
+    query: str,
+    relevance: RelevanceEngine | None = default_engine,
+    deduplicator: MinHashDeduplicator | None = default_deduplicator,
+) -> OrchestrationResult | None:
+    """Merge a finished batch into one ``OrchestrationResult``; ``None`` while tasks are open."""
+    finished, task_results = broker.batch_results(batch_id)
+    if not finished:
+        return None
+    result = OrchestrationResult(query=query)
+    for task_result in task_results:
+        label = f"{task_result.source}:sold" if task_result.sold else task_result.source
+        result.durations_ms[label] = task_result.elapsed_ms
+        if task_result.error:
+            result.errors.append({"source": label, "error": task_result.error})
+        elif task_result.sold:
+            result.sold_items.extend(task_result.items)
+        else:
+            if task_result.max_results > 0 and len(task_result.items) >= task_result.max_results:
+                result.capped_sources.append(task_result.source)
+            result.items.extend(task_result.items)
+    return finalize_result(result, relevance, deduplicator)
+
+
+def wait_for_result(
+    broker: Broker,
+    batch_id: str,
+    query: str,
+    timeout_seconds: float | None = None,
+    poll_interval: float = 1.0,
+) -> OrchestrationResult | None:
+    deadline = None if timeout_seconds is None else time.monotonic() + timeout_seconds
+    while True:
+        result = gather_result(broker, batch_id, query)
+        if result is not None or (deadline is not None and time.monotonic() >= deadline):
+            return result
+        time.sleep(poll_interval)
+
+
+class QueueWorker:
+    """Claims tasks from a broker and runs them on warm adapters.
+
+    Every request an adapter sends first books a slot for its host through
+    the broker, so ``host_intervals`` hold across all workers sharing it.
+    Failed tasks are retried with exponential backoff until ``max_attempts``.
+    """
+
+    def __init__(
+        self,
+        broker: Broker,
+        scrapers: Sequence[BaseScraper] | None = None,
+        worker_id: str | None = None,
+        lease_seconds: float = 120.0,
+        poll_interval: float = 1.0,
+        retry_backoff_seconds: float = 5.0,
+        default_host_interval: float = 1.0,
+        host_intervals: Mapping[str, float] | None = None,
+    ) -> None:
+        self.broker = broker
+        self.scrapers: Dict[str, BaseScraper] = {
+            scraper.source: scraper for scraper in (scrapers or build_tier1_scrapers())
+        }
+        self.worker_id = worker_id or f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:6]}"
+        self.lease_seconds = lease_seconds
+        self.poll_interval = poll_interval
+        self.retry_backoff_seconds = retry_backoff_seconds
+        self.default_host_interval = default_host_interval
+        self.host_intervals = dict(host_intervals or {})
+        for scraper in self.scrapers.values():
+            scraper.request_throttle = self._throttle
+
+    def _throttle(self, url: str) -> None:
+        host = (urlsplit(url).hostname or "").lower()
+        interval = self.host_intervals.get(host, self.default_host_interval)
+        if not host or interval <= 0:
+            return
+        delay = self.broker.reserve_slot(host, interval)
+        if delay > 0:
+            time.sleep(delay)
+
+    def _keep_leased(self, task: Task, done: threading.Event) -> None:
+        while not done.wait(self.lease_seconds / 3):
+            if not self.broker.renew(task, self.lease_seconds):
+                return
+
+    def run_once(self) -> bool:
+        """Claim and run one task; return False when nothing was due."""
+        task = self.broker.claim(self.worker_id, self.lease_seconds)
+        if task is None:
+            return False
+
+        scraper = self.scrapers.get(task.source)
+        if scraper is None:
+            self.broker.fail(task, f"worker {self.worker_id} has no adapter for {task.source!r}", 0.0)
+            return True
+
+        done = threading.Event()
+        heartbeat = threading.Thread(target=self._keep_leased, args=(task, done), daemon=True)
+        heartbeat.start()
+        try:
+            _, items, error, elapsed = run_scraper(scraper, task.query, task.sold, task.max_results)
+        finally:
+            done.set()
+            heartbeat.join()
+
+        if error:
+            delay = self.retry_backoff_seconds * (2 ** (task.attempts - 1))
+            self.broker.fail(task, error, delay)
+        else:
+            if task.max_results > 0 and not task.sold:
+                items = items[: task.max_results]
+            self.broker.complete(task, TaskResult(task.source, task.sold, items, None, elapsed), self.worker_id)
+        return True
+
+    def run_forever(self, stop: threading.Event) -> None:
+        while not stop.is_set():
+            if not self.run_once():
+                stop.wait(self.poll_interval)
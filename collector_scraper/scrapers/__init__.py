@@ -1,32 +1,69 @@
-"""Scraper adapters for Tier-1 sites."""
-
-from collector_scraper.scrapers.beyondgaming import BeyondGamingScraper
-from collector_scraper.scrapers.cardmarket import CardmarketScraper
-from collector_scraper.scrapers.coolstuffinc import CoolStuffIncScraper
-from collector_scraper.scrapers.ebay import EbayScraper
-from collector_scraper.scrapers.pokedex import PokedexScraper
-from collector_scraper.scrapers.pokevolt import PokevoltScraper
-from collector_scraper.scrapers.tcgplayer import TCGPlayerScraper
-from collector_scraper.scrapers.toysonfire import ToysOnFireScraper
-from collector_scraper.scrapers.trollandtoad import TrollAndToadScraper
-
-
-def build_tier1_scrapers():
-    return [
-        EbayScraper(),
-        TCGPlayerScraper(),
-        CardmarketScraper(),
-        TrollAndToadScraper(),
-        CoolStuffIncScraper(),
-        PokevoltScraper(),
-        PokedexScraper(),
-        BeyondGamingScraper(),
-        ToysOnFireScraper(),
-    ]
+"""Scraper adapters for Tier-1 sites.
+
+Adapters are declared in ``registry.DEFAULT_SPECS`` (overridable through a
+JSON config). Adapter modules, and bs4/requests with them, are imported
+only when a source is built, so selecting a few sources doesn't pay for
+the rest.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Iterable, List
+
+from collector_scraper.scrapers.registry import (
+    DEFAULT_SPECS,
+    AdapterRegistry,
+    AdapterSpec,
+    SourceSelection,
+    default_registry,
+    infer_currency,
+    set_default_registry,
+    strip_currency_hints,
+)
+
+if TYPE_CHECKING:
+    from collector_scraper.core.base_scraper import BaseScraper
+
+_SOURCE_BY_CLASS = {spec.target.rsplit(":", 1)[1]: spec.source for spec in DEFAULT_SPECS}
+
+
+def available_sources() -> List[str]:
+    return default_registry().available_sources()
+
+
+def load_adapter(source: str) -> type[BaseScraper]:
+    return default_registry().load_adapter(source)
+
+
+def build_scrapers(sources: Iterable[str] | None = None) -> List[BaseScraper]:
+    """Instantiate the given sources (all enabled ones by default), importing only their modules."""
+    return default_registry().build_many(sources)
+
+
+def build_tier1_scrapers() -> List[BaseScraper]:
+    return build_scrapers()
+
+
+def __getattr__(name: str) -> type[BaseScraper]:
+    # Keeps `from collector_scraper.scrapers import EbayScraper` working without eager imports.
+    source = _SOURCE_BY_CLASS.get(name)
+    if source is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return AdapterRegistry(DEFAULT_SPECS).load_adapter(source)
 
 
 __all__ = [
+    "AdapterRegistry",
+    "AdapterSpec",
+    "SourceSelection",
+    "available_sources",
+    "build_scrapers",
     "build_tier1_scrapers",
+    "default_registry",
+    "infer_currency",
+    "load_adapter",
+    "set_default_registry",
+    "strip_currency_hints",
     "EbayScraper",
     "TCGPlayerScraper",
     "CardmarketScraper",
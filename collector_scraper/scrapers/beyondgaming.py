@@ -5,3 +5,4 @@ class BeyondGamingScraper(WooCommerceStoreScraper):
     source = "beyondgaming"
     base_url = "https://beyondgaming.in"
     per_page = 40
+    max_pages = 4
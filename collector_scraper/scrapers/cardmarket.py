@@ -1,7 +1,18 @@
+from __future__ import annotations
+
+import os
+from typing import Any, Dict, List, Tuple
+from urllib.parse import quote_plus, urljoin
+
 from collector_scraper.core.generic_html_scraper import GenericListScraper
+from collector_scraper.core.json_api import JsonSearchApiMixin, oauth1_header
+
+_CREDENTIAL_NAMES = ("app_token", "app_secret", "access_token", "access_token_secret")
 
 
-class CardmarketScraper(GenericListScraper):
+class CardmarketScraper(JsonSearchApiMixin, GenericListScraper):
+    """Searches the Cardmarket (MKM) API when app credentials are configured, then the HTML listing."""
+
     source = "cardmarket"
     base_url = "https://www.cardmarket.com"
     search_url_template = (
@@ -10,6 +21,10 @@ class CardmarketScraper(GenericListScraper):
     fallback_search_url_templates = (
         "https://www.cardmarket.com/en/Pokemon/Products/Search?searchString={query}&mode=list",
     )
+    page_url_template = (
+        "https://www.cardmarket.com/en/Pokemon/Products/Search?searchString={query}&site={page}"
+    )
+    max_pages = 2
     item_selector = ".table-body .row, .product-row, .article-row"
     title_selectors = (
         "a[href*='/Products/']",
@@ -24,3 +39,73 @@ class CardmarketScraper(GenericListScraper):
         ".article-price",
     )
     link_selectors = ("a[href*='/Products/']",)
+    api_url_template = (
+        "https://api.cardmarket.com/ws/v2.0/output.json/products/find"
+        "?search={query}&idGame={game}&idLanguage=1&exact=false&start=0&maxResults={limit}"
+    )
+    api_game_id = 6  # Pokémon
+    # Dedicated-app tokens from the Cardmarket account page. Unset ones are read from
+    # CARDMARKET_APP_TOKEN, CARDMARKET_APP_SECRET, ... ; without all four the API is skipped.
+    api_app_token: str | None = None
+    api_app_secret: str | None = None
+    api_access_token: str | None = None
+    api_access_token_secret: str | None = None
+
+    def build_api_url(self, query: str) -> str:
+        return self.api_url_template.format(
+            query=quote_plus(query.strip()), game=self.api_game_id, limit=self.max_items
+        )
+
+    def api_credentials(self) -> Tuple[str, ...] | None:
+        values = tuple(
+            getattr(self, f"api_{name}") or os.environ.get(f"CARDMARKET_{name.upper()}", "")
+            for name in _CREDENTIAL_NAMES
+        )
+        return values if all(values) else None
+
+    def search_api(self, query: str) -> List[Dict[str, Any]] | None:
+        credentials = self.api_credentials()
+        if credentials is None:
+            return None
+        url = self.build_api_url(query)
+        headers = {"Authorization": oauth1_header("GET", url, *credentials), "Accept": "application/json"}
+        response = self._request(url, extra_headers=headers, allowed_statuses=(204,))
+        if response.status_code == 204:  # No matching products.
+            return []
+        payload = response.json()
+        items = self.parse_api_listing(payload)
+        if not items and payload.get("product"):
+            return None  # Products without a price guide; the listing pages have prices.
+        return self._filter_by_query(items, query)[: self.max_items]
+
+    def parse_api_listing(self, payload: Any) -> List[Dict[str, Any]]:
+        products = payload.get("product") if isinstance(payload, dict) else None
+        if not isinstance(products, list):
+            raise ValueError(f"unexpected Cardmarket API response: {str(payload)[:200]}")
+        return [item for item in map(self._api_item, products) if item is not None]
+
+    def _api_item(self, product: Any) -> Dict[str, Any] | None:
+        if not isinstance(product, dict):
+            return None
+        name = product.get("enName") or product.get("locName")
+        guide = product.get("priceGuide") or {}
+        market_price = self.api_price(guide.get("TREND"), guide.get("AVG"))
+        price = self.api_price(guide.get("LOW"), guide.get("LOWEX+"), guide.get("SELL"), market_price)
+        if not name or price is None:
+            return None
+        title = " - ".join(part for part in (name, product.get("expansionName")) if part)
+        number = product.get("number")
+        if number:
+            title = f"{title} {number}"
+        website = product.get("website")
+        item = self.normalize(
+            {
+                "title": title,
+                "price": price,
+                "source": self.source,
+                "url": urljoin(self.base_url, website) if website else None,
+                "currency": "EUR",
+            }
+        )
+        item["market_price"] = market_price
+        return item
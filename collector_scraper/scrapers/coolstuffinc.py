@@ -1,9 +1,11 @@
 from collector_scraper.core.generic_html_scraper import GenericListScraper
+from collector_scraper.core.sitemap_crawler import SitemapCatalogMixin
 
 
-class CoolStuffIncScraper(GenericListScraper):
+class CoolStuffIncScraper(SitemapCatalogMixin, GenericListScraper):
     source = "coolstuffinc"
     base_url = "https://www.coolstuffinc.com"
+    product_url_patterns = ("/p/",)
     connect_timeout_seconds = 8
     read_timeout_seconds = 16
     search_url_template = (
@@ -12,6 +14,10 @@ class CoolStuffIncScraper(GenericListScraper):
     fallback_search_url_templates = (
         "https://www.coolstuffinc.com/main_search.php?q={query}",
     )
+    page_url_template = (
+        "https://www.coolstuffinc.com/main_search.php?pa=searchOnName&page={page}&q={query}"
+    )
+    max_pages = 3
     item_selector = ".prod_box, .search_result, .product-list-item, .product"
     title_selectors = (
         ".prod_name a",
@@ -1,3 +1,4 @@
+from collector_scraper.core.fingerprint_cache import DEFAULT_VOLATILE_PATTERNS
 from collector_scraper.core.generic_html_scraper import GenericListScraper
 
 
@@ -10,10 +11,21 @@ class EbayScraper(GenericListScraper):
     fallback_search_url_templates = (
         "https://www.ebay.com/sch/i.html?_nkw={query}&_sop=12&_ipg=60",
     )
+    page_url_template = "https://www.ebay.com/sch/i.html?_nkw={query}&_ipg=60&_pgn={page}"
+    max_pages = 3
+    sold_search_url_template = (
+        "https://www.ebay.com/sch/i.html?_nkw={query}&LH_Sold=1&LH_Complete=1&_ipg=60&_pgn={page}"
+    )
+    max_sold_pages = 4
+    sold_page_workers = 4
     item_selector = ".srp-results .s-item"
     title_selectors = ("h3.s-item__title", ".s-item__title")
     price_selectors = (".s-item__price", ".s-item__detail .s-item__price")
     link_selectors = (".s-item__link",)
+    fingerprint_markers = ('class="srp-results', 'class="s-pagination')
+    fingerprint_volatile_patterns = DEFAULT_VOLATILE_PATTERNS + (
+        r"[?&](?:_trksid|_trkparms|hash|amdata|itmmeta)=[^&\"']*",
+    )
     blocked_title_keywords = (
         "shop on ebay",
         "shop with confidence",
@@ -5,6 +5,7 @@ class PokedexScraper(ShopifyPredictiveScraper):
     source = "pokedex"
     base_url = "https://pokedex.in"
     max_items = 80
+    max_pages = 3
     fallback_html_templates = (
         "https://pokedex.in/search?q={query}&type=product",
         "https://pokedex.in/search?q={query}",
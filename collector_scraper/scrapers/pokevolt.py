@@ -6,16 +6,21 @@ from urllib.parse import quote_plus
 
 from bs4 import BeautifulSoup
 
-from collector_scraper.core.base_scraper import BaseScraper
+from collector_scraper.core.sitemap_crawler import SitemapCatalogMixin
 from collector_scraper.utils.price_parser import parse_price
+from collector_scraper.utils.relevance import rank_by_relevance
 
 
-class PokevoltScraper(BaseScraper):
+class PokevoltScraper(SitemapCatalogMixin):
     source = "pokevolt"
     base_url = "https://www.pokevolt.shop"
     max_items = 60
+    product_url_patterns = ("/product-page/", "/shop/product/")
 
     def search(self, query: str) -> List[Dict[str, Any]]:
+        if self.catalog_ready():
+            return self.search_catalog(query)
+
         encoded_query = quote_plus(query.strip())
         # Wix storefront currently exposes products under /shop and query-filtered views.
         candidate_urls = (
@@ -26,11 +31,12 @@ class PokevoltScraper(BaseScraper):
 
         for url in candidate_urls:
             try:
-                response = self._request(url)
+                body = self._fetch_text(url)
             except Exception:
                 continue
-            parsed = self.parse_listing(response.text)
-            filtered = self._filter_by_query(parsed, query)
+            parsed = self._parse_with_fingerprint(url, body, self.parse_listing)
+            del body
+            filtered = rank_by_relevance(parsed, query)
             if filtered:
                 return filtered[: self.max_items]
 
@@ -40,6 +46,11 @@ class PokevoltScraper(BaseScraper):
         if not isinstance(html, str):
             return []
 
+        # Wix pages usually carry the catalog in their warmup data.
+        structured = self.parse_structured(html)
+        if structured:
+            return structured[: self.max_items]
+
         soup = BeautifulSoup(html, "html.parser")
         results: List[Dict[str, Any]] = []
         seen = set()
@@ -51,7 +62,7 @@ class PokevoltScraper(BaseScraper):
 
             title = self._clean_title(anchor.get_text(" ", strip=True))
             parent_text = anchor.parent.get_text(" ", strip=True) if anchor.parent else ""
-            price = parse_price(f"{anchor.get_text(' ', strip=True)} {parent_text}")
+            price, currency = parse_price(f"{anchor.get_text(' ', strip=True)} {parent_text}")
             if not title or price is None:
                 continue
 
@@ -61,6 +72,7 @@ class PokevoltScraper(BaseScraper):
                     "price": price,
                     "source": self.source,
                     "url": href if href.startswith("http") else f"{self.base_url}{href}",
+                    "currency": currency if currency != "UNKNOWN" else None,
                 }
             )
             dedupe_key = (
@@ -75,19 +87,9 @@ class PokevoltScraper(BaseScraper):
             if len(results) >= self.max_items:
                 break
 
+        soup.decompose()
         return results
 
-    @staticmethod
-    def _filter_by_query(items: List[Dict[str, Any]], query: str) -> List[Dict[str, Any]]:
-        terms = [token.lower() for token in re.split(r"[^A-Za-z0-9]+", query) if len(token) >= 3]
-        if not terms:
-            return items
-        return [
-            item
-            for item in items
-            if any(term in str(item.get("product_name") or "").lower() for term in terms)
-        ]
-
     @staticmethod
     def _clean_title(text: str | None) -> str | None:
         if not text:
@@ -0,0 +1,245 @@
+from __future__ import annotations
+
+import json
+import os
+import re
+import threading
+import time
+from dataclasses import dataclass, field, fields, replace
+from importlib import import_module
+from typing import TYPE_CHECKING, Any, Dict, Iterable, List, Sequence
+
+if TYPE_CHECKING:
+    from collector_scraper.core.base_scraper import BaseScraper
+
+CONFIG_ENV_VAR = "COLLECTOR_SCRAPER_CONFIG"
+
+
+@dataclass
+class AdapterSpec:
+    """How to build one source and what it covers.
+
+    ``cost`` is the expected number of requests per search and ``priority``
+    breaks ties (lower first). ``settings`` override adapter class attributes
+    (timeouts, selectors, page limits, base_url, ...) on the built instance.
+    """
+
+    source: str
+    target: str  # "module:Class"
+    platform: str = "html"
+    region: str = ""
+    currency: str = ""
+    requests_per_second: float | None = None
+    priority: int = 100
+    cost: float = 1.0
+    enabled: bool = True
+    settings: Dict[str, Any] = field(default_factory=dict)
+
+
+DEFAULT_SPECS: List[AdapterSpec] = [
+    AdapterSpec("ebay", "collector_scraper.scrapers.ebay:EbayScraper",
+                platform="ebay", region="US", currency="USD", priority=0, cost=3),
+    AdapterSpec("tcgplayer", "collector_scraper.scrapers.tcgplayer:TCGPlayerScraper",
+                platform="html", region="US", currency="USD", priority=10, cost=3),
+    AdapterSpec("cardmarket", "collector_scraper.scrapers.cardmarket:CardmarketScraper",
+                platform="html", region="EU", currency="EUR", priority=10, cost=2),
+    AdapterSpec("trollandtoad", "collector_scraper.scrapers.trollandtoad:TrollAndToadScraper",
+                platform="shopify", region="US", currency="USD", priority=20, cost=4),
+    AdapterSpec("coolstuffinc", "collector_scraper.scrapers.coolstuffinc:CoolStuffIncScraper",
+                platform="html", region="US", currency="USD", priority=20, cost=3),
+    AdapterSpec("pokevolt", "collector_scraper.scrapers.pokevolt:PokevoltScraper",
+                platform="wix", region="IN", currency="INR", priority=30, cost=1),
+    AdapterSpec("pokedex", "collector_scraper.scrapers.pokedex:PokedexScraper",
+                platform="shopify", region="IN", currency="INR", priority=30, cost=4),
+    AdapterSpec("beyondgaming", "collector_scraper.scrapers.beyondgaming:BeyondGamingScraper",
+                platform="woocommerce", region="IN", currency="INR", priority=30, cost=4),
+    AdapterSpec("toysonfire", "collector_scraper.scrapers.toysonfire:ToysOnFireScraper",
+                platform="html", region="CA", currency="CAD", priority=40, cost=1),
+    # Any number of Shopify stores searched concurrently; list them under settings.stores.
+    AdapterSpec("shopify_stores", "collector_scraper.core.shopify_scraper:ShopifyStoreEngine",
+                platform="shopify", priority=50, cost=1, enabled=False),
+]
+
+# Query hints that pin a search to one market. Only currency codes and
+# symbols: words like "us" or "india" also occur in ordinary card queries.
+_CURRENCY_HINTS = (
+    (re.compile(r"₹|\binr\b", re.IGNORECASE), "INR"),
+    (re.compile(r"€|\beur\b", re.IGNORECASE), "EUR"),
+    (re.compile(r"\bc\$|\bcad\b", re.IGNORECASE), "CAD"),
+    (re.compile(r"\bus\$|\busd\b", re.IGNORECASE), "USD"),
+)
+
+
+def infer_currency(query: str) -> str | None:
+    """Currency a query is explicitly about ("charizard inr" -> INR), if any."""
+    for pattern, currency in _CURRENCY_HINTS:
+        if pattern.search(query):
+            return currency
+    return None
+
+
+def strip_currency_hints(query: str) -> str:
+    """``query`` without its currency hints, which are not part of what is searched for."""
+    stripped = query
+    for pattern, _ in _CURRENCY_HINTS:
+        stripped = pattern.sub(" ", stripped)
+    stripped = " ".join(stripped.split())
+    return stripped or query
+
+
+@dataclass
+class SourceSelection:
+    """Per-query source filter; unset fields don't filter."""
+
+    currency: str | None = None
+    region: str | None = None
+    platforms: Sequence[str] | None = None
+    max_sources: int | None = None
+    max_cost: float | None = None
+    infer_from_query: bool = True
+
+
+class IntervalThrottle:
+    """Spaces requests from one adapter instance at least ``1 / requests_per_second`` apart."""
+
+    def __init__(self, requests_per_second: float) -> None:
+        self.interval = 1.0 / requests_per_second
+        self._next_at = 0.0
+        self._lock = threading.Lock()
+
+    def __call__(self, url: str) -> None:
+        with self._lock:
+            now = time.monotonic()
+            slot = max(now, self._next_at)
+            self._next_at = slot + self.interval
+        if slot > now:
+            time.sleep(slot - now)
+
+
+class AdapterRegistry:
+    """Adapter specs keyed by source, optionally overlaid with a JSON config file.
+
+    Config format::
+
+        {"sources": {
+            "ebay": {"priority": 5, "settings": {"max_pages": 2}},
+            "toysonfire": {"enabled": false},
+            "shopify_stores": {"enabled": true, "region": "US", "currency": "USD", "settings": {"stores": [
+                {"source": "storea", "base_url": "https://storea.example", "requests_per_second": 2}
+            ]}},
+            "mystore": {"target": "collector_scraper.core.shopify_scraper:ShopifyPredictiveScraper",
+                        "platform": "shopify", "region": "US", "currency": "USD",
+                        "settings": {"base_url": "https://mystore.example"}}
+        }}
+    """
+
+    def __init__(self, specs: Iterable[AdapterSpec] = DEFAULT_SPECS) -> None:
+        self.specs: Dict[str, AdapterSpec] = {
+            spec.source: replace(spec, settings=dict(spec.settings)) for spec in specs
+        }
+
+    @classmethod
+    def from_config(cls, path: str | None = None) -> "AdapterRegistry":
+        """Defaults overlaid with ``path`` (or ``$COLLECTOR_SCRAPER_CONFIG`` when set)."""
+        registry = cls()
+        path = path or os.environ.get(CONFIG_ENV_VAR)
+        if path:
+            with open(path, "r", encoding="utf-8") as handle:
+                registry.apply_config(json.load(handle))
+        return registry
+
+    def apply_config(self, config: Dict[str, Any]) -> None:
+        known = {f.name for f in fields(AdapterSpec)} - {"source"}
+        for source, overrides in config.get("sources", {}).items():
+            unknown = set(overrides) - known
+            if unknown:
+                raise ValueError(f"Unknown keys for source {source!r}: {', '.join(sorted(unknown))}")
+            current = self.specs.get(source)
+            if current is None:
+                if "target" not in overrides:
+                    raise ValueError(f"New source {source!r} needs a 'target' (module:Class)")
+                self.specs[source] = AdapterSpec(source=source, **overrides)
+                continue
+            settings = {**current.settings, **overrides.get("settings", {})}
+            self.specs[source] = replace(current, **{**overrides, "settings": settings})
+
+    def available_sources(self) -> List[str]:
+        return [source for source, spec in self.specs.items() if spec.enabled]
+
+    def spec(self, source: str) -> AdapterSpec:
+        try:
+            return self.specs[source]
+        except KeyError:
+            raise ValueError(f"Unknown source {source!r}; choose from: {', '.join(self.specs)}") from None
+
+    def load_adapter(self, source: str) -> type[BaseScraper]:
+        module_name, class_name = self.spec(source).target.split(":")
+        return getattr(import_module(module_name), class_name)
+
+    def build(self, source: str) -> BaseScraper:
+        spec = self.spec(source)
+        adapter_class = self.load_adapter(source)
+        scraper = adapter_class()
+        scraper.source = spec.source
+        for name, value in spec.settings.items():
+            if not hasattr(adapter_class, name):
+                raise ValueError(f"{adapter_class.__name__} has no setting {name!r} (source {source!r})")
+            setattr(scraper, name, tuple(value) if isinstance(value, list) else value)
+        if spec.requests_per_second:
+            scraper.request_throttle = IntervalThrottle(spec.requests_per_second)
+        return scraper
+
+    def build_many(self, sources: Iterable[str] | None = None) -> List[BaseScraper]:
+        selected = list(sources) if sources is not None else self.available_sources()
+        return [self.build(source) for source in selected]
+
+    def select(self, query: str, selection: SourceSelection | None = None) -> List[AdapterSpec]:
+        """Enabled specs that fit ``selection`` for ``query``, cheapest and highest priority first.
+
+        With ``infer_from_query``, a query naming a currency ("... inr")
+        keeps only stores pricing in that currency, unless none do.
+        """
+        selection = selection or SourceSelection()
+        currency = selection.currency or (infer_currency(query) if selection.infer_from_query else None)
+
+        candidates = [spec for spec in self.specs.values() if spec.enabled]
+        if selection.region:
+            candidates = [spec for spec in candidates if spec.region == selection.region]
+        if selection.platforms:
+            candidates = [spec for spec in candidates if spec.platform in selection.platforms]
+        if currency:
+            matching = [spec for spec in candidates if spec.currency == currency]
+            if matching or selection.currency:
+                candidates = matching
+
+        candidates.sort(key=lambda spec: (spec.cost, spec.priority))
+        if selection.max_cost is not None:
+            within_budget, spent = [], 0.0
+            for spec in candidates:
+                if spent + spec.cost > selection.max_cost:
+                    continue
+                within_budget.append(spec)
+                spent += spec.cost
+            candidates = within_budget
+        if selection.max_sources is not None:
+            candidates = candidates[: selection.max_sources]
+        return candidates
+
+    def build_for_query(self, query: str, selection: SourceSelection | None = None) -> List[BaseScraper]:
+        return [self.build(spec.source) for spec in self.select(query, selection)]
+
+
+_default_registry: AdapterRegistry | None = None
+
+
+def default_registry() -> AdapterRegistry:
+    """Process-wide registry from the defaults and ``$COLLECTOR_SCRAPER_CONFIG``."""
+    global _default_registry
+    if _default_registry is None:
+        _default_registry = AdapterRegistry.from_config()
+    return _default_registry
+
+
+def set_default_registry(registry: AdapterRegistry | None) -> None:
+    global _default_registry
+    _default_registry = registry
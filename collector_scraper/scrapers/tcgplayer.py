@@ -1,22 +1,27 @@
 from __future__ import annotations
 
-import json
+import math
 import re
 from typing import Any, Dict, List
-
-from bs4 import BeautifulSoup
+from urllib.parse import quote_plus
 
 from collector_scraper.core.generic_html_scraper import GenericListScraper
-from collector_scraper.utils.price_parser import parse_price
+from collector_scraper.core.json_api import JsonSearchApiMixin
+from collector_scraper.core.pagination import PageResult, Paginator
+from collector_scraper.utils.structured_data import extract_listing
+
 
+class TCGPlayerScraper(JsonSearchApiMixin, GenericListScraper):
+    """Searches the marketplace search API the tcgplayer.com front-end uses, then the HTML grid."""
 
-class TCGPlayerScraper(GenericListScraper):
     source = "tcgplayer"
     base_url = "https://www.tcgplayer.com"
     search_url_template = "https://www.tcgplayer.com/search/all/product?q={query}&view=grid"
     fallback_search_url_templates = (
         "https://www.tcgplayer.com/search/pokemon/product?q={query}&view=grid",
     )
+    page_url_template = "https://www.tcgplayer.com/search/all/product?q={query}&view=grid&page={page}"
+    max_pages = 3
     item_selector = ".search-result, .product-card, .search-layout__content .product"
     title_selectors = (
         ".search-result__title",
@@ -33,6 +38,92 @@ class TCGPlayerScraper(GenericListScraper):
         "[data-testid='listingPrice']",
     )
     link_selectors = ("a[href*='/product/']",)
+    api_url_template = "https://mp-search-api.tcgplayer.com/v1/search/request?q={query}&isList=false"
+    api_page_size = 24
+    api_algorithm = "sales_synonym_v2"
+    api_shipping_country = "US"
+
+    def build_api_url(self, query: str) -> str:
+        return self.api_url_template.format(query=quote_plus(query.strip()))
+
+    def build_api_body(self, page: int) -> Dict[str, Any]:
+        return {
+            "algorithm": self.api_algorithm,
+            "from": (page - 1) * self.api_page_size,
+            "size": self.api_page_size,
+            "filters": {"term": {}, "range": {}, "match": {}},
+            "listingSearch": {
+                "context": {"cart": {}},
+                "filters": {
+                    "term": {"sellerStatus": "Live", "channelId": 0},
+                    "range": {"quantity": {"gte": 1}},
+                    "exclude": {"channelExclusion": 0},
+                },
+            },
+            "context": {"cart": {}, "shippingCountry": self.api_shipping_country, "userProfile": {}},
+            "settings": {"useFuzzySearch": True, "didYouMean": {}},
+            "sort": {},
+        }
+
+    def search_api(self, query: str) -> List[Dict[str, Any]] | None:
+        url = self.build_api_url(query)
+        headers = {"Accept": "application/json", "Origin": self.base_url, "Referer": f"{self.base_url}/"}
+
+        def fetch_page(page: int) -> PageResult:
+            response = self._request(url, extra_headers=headers, json_body=self.build_api_body(page))
+            return self.parse_api_page(response.json())
+
+        first = fetch_page(1)
+        paginator = Paginator(
+            fetch_page,
+            max_pages=self.max_pages,
+            workers=self.page_workers,
+            max_results=self.result_cap(),
+            relevance_filter=lambda items: self._filter_by_query(items, query),
+            total_pages=first.total_pages,
+        )
+        return paginator.collect(self._filter_by_query(first.items, query), start_page=2)
+
+    def parse_api_page(self, payload: Any) -> PageResult:
+        """Items and page count from a search API response; raises if the shape is not the expected one."""
+        blocks = payload.get("results") if isinstance(payload, dict) else None
+        if not isinstance(blocks, list):
+            raise ValueError(f"unexpected TCGPlayer search API response: {str(payload)[:200]}")
+        block = blocks[0] if blocks and isinstance(blocks[0], dict) else {}
+        items = [item for item in map(self._api_item, block.get("results") or ()) if item is not None]
+        total = block.get("totalResults")
+        total_pages = math.ceil(total / self.api_page_size) if isinstance(total, int) else None
+        return PageResult(items, total_pages)
+
+    def parse_api_listing(self, payload: Any) -> List[Dict[str, Any]]:
+        return self.parse_api_page(payload).items
+
+    def _api_item(self, product: Any) -> Dict[str, Any] | None:
+        if not isinstance(product, dict) or not product.get("productName"):
+            return None
+        market_price = self.api_price(product.get("marketPrice"))
+        # Same preference as the HTML grid: cheapest listing with shipping, then market price.
+        price = self.api_price(
+            product.get("lowestPriceWithShipping"), product.get("lowestPrice"), market_price
+        )
+        if price is None:
+            return None
+        number = (product.get("customAttributes") or {}).get("number")
+        title = " - ".join(part for part in (product["productName"], product.get("setName")) if part)
+        if number and number not in title:
+            title = f"{title} {number}"
+        url = None
+        if product.get("productId") is not None:
+            slug = "-".join(
+                _slug(product.get(key)) for key in ("productLineUrlName", "setUrlName", "productUrlName")
+                if product.get(key)
+            )
+            url = f"{self.base_url}/product/{int(product['productId'])}/{slug}".rstrip("/")
+        item = self.normalize(
+            {"title": title, "price": price, "source": self.source, "url": url, "currency": "USD"}
+        )
+        item["market_price"] = market_price
+        return item
 
     def parse_listing(self, html: str) -> List[Dict[str, Any]]:
         parsed = super().parse_listing(html)
@@ -42,74 +133,20 @@ class TCGPlayerScraper(GenericListScraper):
         if self._page_requires_js(html):
             raise RuntimeError(
                 "TCGPlayer returned a JavaScript-only page. "
-                "Use browser automation for this source."
+                'Set render_mode to "auto" for this source to render it in a headless browser.'
             )
 
-        # Some variants expose JSON-LD product metadata.
+        # Some variants expose JSON-LD or embedded product data.
         json_ld_results = self._parse_json_ld(html)
         if json_ld_results:
             return json_ld_results
 
         return self._parse_anchor_fallback(html)
 
-    @staticmethod
-    def _page_requires_js(html: str) -> bool:
-        lowered = html.lower()
-        return (
-            "doesn't work properly without javascript" in lowered
-            or "enable javascript to continue" in lowered
-        )
-
     def _parse_json_ld(self, html: str) -> List[Dict[str, Any]]:
-        soup = BeautifulSoup(html, "html.parser")
-        results: List[Dict[str, Any]] = []
-        seen = set()
-
-        for script in soup.select("script[type='application/ld+json']"):
-            payload = script.get_text(strip=True)
-            if not payload:
-                continue
-            try:
-                data = json.loads(payload)
-            except json.JSONDecodeError:
-                continue
-
-            items = data if isinstance(data, list) else [data]
-            for item in items:
-                if not isinstance(item, dict):
-                    continue
-
-                item_type = str(item.get("@type", "")).lower()
-                if item_type not in {"product", "offer"}:
-                    continue
-
-                title = item.get("name") or item.get("title")
-                offer = item.get("offers", item)
-                if isinstance(offer, dict):
-                    raw_price = offer.get("price")
-                    url = offer.get("url") or item.get("url")
-                else:
-                    raw_price = None
-                    url = item.get("url")
-
-                price = parse_price(str(raw_price))
-                if not title or price is None:
-                    continue
-
-                dedupe_key = (str(title).lower(), price, str(url or ""))
-                if dedupe_key in seen:
-                    continue
-                seen.add(dedupe_key)
-
-                results.append(
-                    self.normalize(
-                        {
-                            "title": re.sub(r"\s+", " ", str(title)).strip(),
-                            "price": price,
-                            "source": self.source,
-                            "url": str(url) if url else None,
-                        }
-                    )
-                )
-
-        return results
+        # Unlike parse_structured, a single JSON-LD product is kept here: selectors already found nothing.
+        return [self.normalize({**product, "source": self.source}) for product in extract_listing(html, self.base_url)]
+
+
+def _slug(value: Any) -> str:
+    return re.sub(r"[^a-z0-9]+", "-", str(value).lower()).strip("-")
@@ -1,9 +1,11 @@
 from collector_scraper.core.generic_html_scraper import GenericListScraper
+from collector_scraper.core.sitemap_crawler import SitemapCatalogMixin
 
 
-class ToysOnFireScraper(GenericListScraper):
+class ToysOnFireScraper(SitemapCatalogMixin, GenericListScraper):
     source = "toysonfire"
     base_url = "https://www.toysonfire.ca"
+    product_url_patterns = ("/shop/product/", "/product/")
     search_url_template = "https://www.toysonfire.ca/shop/search?search={query}"
     fallback_search_url_templates = (
         "https://www.toysonfire.ca/search?search={query}",
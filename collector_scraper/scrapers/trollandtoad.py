@@ -5,6 +5,7 @@ class TrollAndToadScraper(ShopifyPredictiveScraper):
     source = "trollandtoad"
     base_url = "https://www.trollandtoad.com"
     max_items = 60
+    max_pages = 3
     fallback_html_templates = (
         "https://www.trollandtoad.com/search?q={query}&type=product",
         "https://www.trollandtoad.com/search?q={query}",
@@ -0,0 +1,266 @@
+from __future__ import annotations
+
+import math
+import re
+from collections import defaultdict
+from dataclasses import dataclass, field
+from typing import Any, Dict, FrozenSet, Iterable, List, Mapping, Sequence, Set, Tuple
+
+_TOKEN = re.compile(r"[a-z0-9]+")
+_CARD_NUMBER = re.compile(r"\b#?([a-z]{0,4}\d{1,4}[a-z]?)\s*/\s*([a-z]{0,4}\d{1,4})\b")
+_HASH_NUMBER = re.compile(r"#\s*([a-z]{0,4}\d{1,4}[a-z]?)\b")
+
+_NAME_WEIGHT = 0.7
+_SET_WEIGHT = 0.2
+_NUMBER_WEIGHT = 0.1
+
+
+def tokenize(text: str | None) -> List[str]:
+    if not text:
+        return []
+    return _TOKEN.findall(text.lower())
+
+
+def extract_card_numbers(text: str | None) -> Set[str]:
+    """Return card numbers written as ``4/102`` or ``#4`` in ``text``."""
+    if not text:
+        return set()
+    lowered = text.lower()
+    numbers = {_strip_number(match.group(1)) for match in _CARD_NUMBER.finditer(lowered)}
+    numbers.update(_strip_number(match.group(1)) for match in _HASH_NUMBER.finditer(lowered))
+    return numbers
+
+
+def _strip_number(raw: str) -> str:
+    return raw.lstrip("0") or "0"
+
+
+@dataclass(frozen=True)
+class CatalogCard:
+    id: str
+    name: str
+    set_id: str | None
+    set_name: str | None
+    number: str | None
+    name_tokens: FrozenSet[str]
+    set_tokens: FrozenSet[str]
+
+
+@dataclass
+class CatalogMatch:
+    """Candidate cards a query resolved to, ready to score listing titles."""
+
+    query: str
+    cards: List[CatalogCard] = field(default_factory=list)
+    scores: List[float] = field(default_factory=list)
+    query_numbers: Set[str] = field(default_factory=set)
+
+    @property
+    def card_ids(self) -> List[str]:
+        return [card.id for card in self.cards]
+
+    def __bool__(self) -> bool:
+        return bool(self.cards)
+
+    def score_title(self, title: str | None) -> float:
+        """Best 0..1 match of ``title`` against any candidate card."""
+        if not title or not self.cards:
+            return 0.0
+
+        title_tokens = set(tokenize(title))
+        title_numbers = extract_card_numbers(title)
+        best = 0.0
+        for card in self.cards:
+            if not card.name_tokens:
+                continue
+            name_hit = len(card.name_tokens & title_tokens) / len(card.name_tokens)
+            if name_hit == 0:
+                continue
+
+            set_hit = (
+                len(card.set_tokens & title_tokens) / len(card.set_tokens)
+                if card.set_tokens
+                else 0.0
+            )
+            number_hit = 0.0
+            if card.number and title_numbers:
+                # A listing that names a different card number is a different card.
+                if card.number not in title_numbers:
+                    continue
+                number_hit = 1.0
+
+            score = _NAME_WEIGHT * name_hit + _SET_WEIGHT * set_hit + _NUMBER_WEIGHT * number_hit
+            if score > best:
+                best = score
+        return round(best, 4)
+
+
+class CatalogIndex:
+    """In-memory index over the Pokemon TCG catalog loaded by ``pokemon.py``.
+
+    Holds an inverted token index over card and set names plus exact lookups
+    by set code and card number, so one warm index can resolve many queries.
+    """
+
+    def __init__(self) -> None:
+        self.cards: List[CatalogCard] = []
+        self._postings: Dict[str, Set[int]] = defaultdict(set)
+        self._by_set: Dict[str, List[int]] = defaultdict(list)
+        self._by_number: Dict[str, List[int]] = defaultdict(list)
+        self._idf: Dict[str, float] = {}
+
+    def __len__(self) -> int:
+        return len(self.cards)
+
+    @classmethod
+    def from_api(
+        cls,
+        sets: Iterable[Mapping[str, Any]],
+        cards: Iterable[Mapping[str, Any]],
+    ) -> "CatalogIndex":
+        """Build from Pokemon TCG API ``/sets`` and ``/cards`` payload items."""
+        set_names = {str(s.get("id")): s.get("name") for s in sets if s.get("id")}
+        index = cls()
+        for card in cards:
+            set_id = (card.get("set") or {}).get("id")
+            index.add(
+                card_id=str(card["id"]),
+                name=str(card.get("name") or ""),
+                set_id=set_id,
+                set_name=set_names.get(str(set_id)) or (card.get("set") or {}).get("name"),
+                number=card.get("number"),
+            )
+        index.finalize()
+        return index
+
+    @classmethod
+    def from_rows(
+        cls,
+        set_rows: Iterable[Sequence[Any]],
+        card_rows: Iterable[Sequence[Any]],
+    ) -> "CatalogIndex":
+        """Build from ``(id, name)`` set rows and ``(id, name, set_id, number)`` card rows."""
+        set_names = {str(row[0]): row[1] for row in set_rows}
+        index = cls()
+        for card_id, name, set_id, number in card_rows:
+            index.add(
+                card_id=str(card_id),
+                name=str(name or ""),
+                set_id=set_id,
+                set_name=set_names.get(str(set_id)),
+                number=number,
+            )
+        index.finalize()
+        return index
+
+    @classmethod
+    def from_connection(cls, conn: Any) -> "CatalogIndex":
+        """Build from the ``pokemon_sets``/``pokemon_cards`` tables over a DB-API connection."""
+        cur = conn.cursor()
+        try:
+            cur.execute("SELECT id, name FROM pokemon_sets")
+            set_rows = cur.fetchall()
+            cur.execute("SELECT id, name, set_id, number FROM pokemon_cards")
+            card_rows = cur.fetchall()
+        finally:
+            cur.close()
+        return cls.from_rows(set_rows, card_rows)
+
+    def add(
+        self,
+        card_id: str,
+        name: str,
+        set_id: str | None = None,
+        set_name: str | None = None,
+        number: str | None = None,
+    ) -> None:
+        position = len(self.cards)
+        card = CatalogCard(
+            id=card_id,
+            name=name,
+            set_id=set_id,
+            set_name=set_name,
+            number=_strip_number(str(number).lower()) if number else None,
+            name_tokens=frozenset(tokenize(name)),
+            set_tokens=frozenset(tokenize(set_name)),
+        )
+        self.cards.append(card)
+
+        for token in card.name_tokens | card.set_tokens:
+            self._postings[token].add(position)
+        if set_id:
+            self._by_set[str(set_id).lower()].append(position)
+            # Set codes like "base1" are also valid query tokens.
+            self._postings[str(set_id).lower()].add(position)
+        if card.number:
+            self._by_number[card.number].append(position)
+
+    def finalize(self) -> None:
+        total = max(len(self.cards), 1)
+        self._idf = {
+            token: math.log(1 + total / len(positions))
+            for token, positions in self._postings.items()
+        }
+
+    def cards_in_set(self, set_id: str) -> List[CatalogCard]:
+        return [self.cards[pos] for pos in self._by_set.get(set_id.lower(), ())]
+
+    def cards_with_number(self, number: str) -> List[CatalogCard]:
+        return [self.cards[pos] for pos in self._by_number.get(_strip_number(number.lower()), ())]
+
+    def resolve(self, query: str, limit: int = 25) -> CatalogMatch:
+        """Resolve a free-text query to the best candidate cards."""
+        if not self._idf and self.cards:
+            self.finalize()
+
+        tokens = [token for token in set(tokenize(query)) if token in self._postings]
+        numbers = extract_card_numbers(query)
+        match = CatalogMatch(query=query, query_numbers=numbers)
+        if not tokens:
+            return match
+
+        scores: Dict[int, float] = defaultdict(float)
+        for token in tokens:
+            weight = self._idf.get(token, 0.0)
+            for position in self._postings[token]:
+                scores[position] += weight
+
+        if numbers:
+            for number in numbers:
+                for position in self._by_number.get(number, ()):
+                    if position in scores:
+                        scores[position] *= 1.5
+
+        # Candidates must match at least one token of the card name itself.
+        ranked: List[Tuple[int, float]] = sorted(
+            (
+                (position, score)
+                for position, score in scores.items()
+                if self.cards[position].name_tokens.intersection(tokens)
+            ),
+            key=lambda pair: pair[1],
+            reverse=True,
+        )[:limit]
+
+        match.cards = [self.cards[position] for position, _ in ranked]
+        match.scores = [round(score, 4) for _, score in ranked]
+        return match
+
+    def filter_items(
+        self,
+        items: List[Dict[str, Any]],
+        query: str | CatalogMatch,
+        min_score: float = 0.5,
+    ) -> List[Dict[str, Any]]:
+        """Drop listings whose titles match none of the query's candidate cards.
+
+        Queries that resolve to no catalog cards leave ``items`` untouched.
+        """
+        match = query if isinstance(query, CatalogMatch) else self.resolve(query)
+        if not match:
+            return items
+        return [
+            item
+            for item in items
+            if match.score_title(item.get("product_name") or item.get("title")) >= min_score
+        ]
@@ -0,0 +1,150 @@
+from __future__ import annotations
+
+import hashlib
+import re
+from collections import defaultdict
+from typing import Any, Dict, List, Sequence, Tuple
+
+_NON_ALNUM = re.compile(r"[^a-z0-9]+")
+
+
+def normalize_title(title: str | None) -> str:
+    if not title:
+        return ""
+    return _NON_ALNUM.sub(" ", title.lower()).strip()
+
+
+def _hash64(text: str, seed: bytes) -> int:
+    return int.from_bytes(
+        hashlib.blake2b(text.encode("utf-8"), digest_size=8, salt=seed).digest(),
+        "big",
+    )
+
+
+def shingles(text: str, size: int = 4, seed: bytes = b"") -> set[int]:
+    """64-bit hashed character shingles of a normalized title."""
+    compact = text.replace(" ", "_")
+    if len(compact) <= size:
+        return {_hash64(compact, seed)} if compact else set()
+    return {_hash64(compact[pos : pos + size], seed) for pos in range(len(compact) - size + 1)}
+
+
+class MinHashDeduplicator:
+    """Collapse near-duplicate listings across sources with MinHash + LSH.
+
+    Titles are normalized and shingled, signatures are split into bands and
+    bucketed, and only listings that share a bucket are compared. Each
+    newcomer is checked against the cluster representatives in its buckets,
+    so the pass stays roughly linear in the number of listings. Listings from
+    the same source are never merged; adapters already dedupe their own pages.
+    """
+
+    def __init__(
+        self,
+        num_perm: int = 64,
+        bands: int = 8,
+        threshold: float = 0.8,
+        price_tolerance: float | None = 0.05,
+        seed: bytes = b"listing-dedup",
+    ) -> None:
+        if num_perm % bands:
+            raise ValueError("num_perm must be divisible by bands")
+        self.num_perm = num_perm
+        self.bands = bands
+        self.rows = num_perm // bands
+        self.threshold = threshold
+        self.price_tolerance = price_tolerance
+        self.seed = seed[:16]
+        self._masks = [
+            _hash64(str(position), self.seed) for position in range(num_perm)
+        ]
+
+    def signature(self, title: str | None) -> Tuple[int, ...]:
+        hashed = shingles(normalize_title(title), seed=self.seed)
+        if not hashed:
+            return ()
+        # Each permutation is approximated by XOR with a fixed random mask,
+        # which keeps signature construction to one pass per mask.
+        return tuple(min(map(mask.__xor__, hashed)) for mask in self._masks)
+
+    @staticmethod
+    def similarity(left: Sequence[int], right: Sequence[int]) -> float:
+        if not left or not right:
+            return 0.0
+        return sum(1 for a, b in zip(left, right) if a == b) / len(left)
+
+    def _prices_match(
+        self, left: Any, right: Any, left_currency: Any = None, right_currency: Any = None
+    ) -> bool:
+        if self.price_tolerance is None:
+            return True
+        # Prices in different currencies aren't comparable; a missing currency matches any.
+        currencies = {str(code).upper() for code in (left_currency, right_currency) if code and code != "UNKNOWN"}
+        if len(currencies) > 1:
+            return False
+        try:
+            low, high = sorted((float(left), float(right)))
+        except (TypeError, ValueError):
+            return left == right
+        if high <= 0:
+            return low == high
+        return (high - low) / high <= self.price_tolerance
+
+    def dedupe(self, items: List[Dict[str, Any]]) -> Tuple[List[Dict[str, Any]], int]:
+        """Return ``(kept_items, merged_count)``; the first listing of each cluster is kept."""
+        buckets: Dict[Tuple[int, Tuple[int, ...]], List[int]] = defaultdict(list)
+        signatures: List[Tuple[int, ...]] = []
+        kept: List[Dict[str, Any]] = []
+        merged = 0
+
+        for item in items:
+            sig = self.signature(item.get("product_name") or item.get("title"))
+            if not sig:
+                kept.append(item)
+                signatures.append(sig)
+                continue
+
+            band_keys = [
+                (band, sig[band * self.rows : (band + 1) * self.rows])
+                for band in range(self.bands)
+            ]
+            duplicate = False
+            checked: set[int] = set()
+            for key in band_keys:
+                for rep in buckets.get(key, ()):
+                    if rep in checked:
+                        continue
+                    checked.add(rep)
+                    if (
+                        item.get("source") != kept[rep].get("source")
+                        and self.similarity(sig, signatures[rep]) >= self.threshold
+                        and self._prices_match(
+                            item.get("price"),
+                            kept[rep].get("price"),
+                            item.get("currency"),
+                            kept[rep].get("currency"),
+                        )
+                    ):
+                        duplicate = True
+                        break
+                if duplicate:
+                    break
+
+            if duplicate:
+                merged += 1
+                continue
+
+            position = len(kept)
+            kept.append(item)
+            signatures.append(sig)
+            for key in band_keys:
+                buckets[key].append(position)
+
+        return kept, merged
+
+
+default_deduplicator = MinHashDeduplicator()
+
+
+def dedupe_listings(items: List[Dict[str, Any]]) -> Tuple[List[Dict[str, Any]], int]:
+    return default_deduplicator.dedupe(items)
@@ -0,0 +1,70 @@
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterable, List
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+_TRACKING_PARAMS = {"hash", "amdata", "itmmeta", "srsltid"}
+
+
+def _canonical_url(url: str) -> str:
+    parts = urlsplit(url)
+    query = [
+        (name, value)
+        for name, value in parse_qsl(parts.query, keep_blank_values=True)
+        if not name.startswith(("_", "utm_")) and name not in _TRACKING_PARAMS
+    ]
+    return urlunsplit((parts.scheme, parts.netloc.lower(), parts.path, urlencode(query), ""))
+
+
+def listing_key(item: Dict[str, Any]) -> str:
+    """Stable identity of a listing: its URL without tracking parameters."""
+    url = item.get("url")
+    if url:
+        return _canonical_url(str(url))
+    return f"{item.get('source')}|{str(item.get('product_name') or item.get('title') or '').lower()}"
+
+
+@dataclass
+class ListingDiff:
+    """New, removed and re-priced listings between two snapshots."""
+
+    new: List[Dict[str, Any]] = field(default_factory=list)
+    removed: List[Dict[str, Any]] = field(default_factory=list)
+    repriced: List[Dict[str, Any]] = field(default_factory=list)
+
+    def __bool__(self) -> bool:
+        return bool(self.new or self.removed or self.repriced)
+
+    def summary(self) -> Dict[str, int]:
+        return {"new": len(self.new), "removed": len(self.removed), "repriced": len(self.repriced)}
+
+
+def diff_listings(
+    previous: Iterable[Dict[str, Any]],
+    current: Iterable[Dict[str, Any]],
+) -> ListingDiff:
+    """Diff two listing snapshots keyed by URL in one pass over each side.
+
+    Re-priced entries carry the current listing plus ``old_price``/``new_price``.
+    """
+    before = {listing_key(item): item for item in previous}
+    diff = ListingDiff()
+    seen = set()
+
+    for item in current:
+        key = listing_key(item)
+        if key in seen:
+            continue
+        seen.add(key)
+
+        old = before.get(key)
+        if old is None:
+            diff.new.append(item)
+        elif old.get("price") != item.get("price"):
+            diff.repriced.append(
+                {"item": item, "old_price": old.get("price"), "new_price": item.get("price")}
+            )
+
+    diff.removed = [item for key, item in before.items() if key not in seen]
+    return diff
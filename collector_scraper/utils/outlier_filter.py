@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 from statistics import median
-from typing import Dict, Iterable, List
+from typing import Any, Dict, Iterable, List, Mapping
 
 
 def _clean_prices(prices: Iterable[float | int | None]) -> List[float]:
@@ -90,3 +90,18 @@ def calculate_market_stats(
         "average": round(sum(filtered) / len(filtered), 2),
         "median": round(float(median(filtered)), 2),
     }
+
+
+def calculate_stats_by_price_type(
+    items: Iterable[Mapping[str, Any]],
+    trim_ratio: float = 0.1,
+    iqr_multiplier: float = 1.5,
+) -> Dict[str, Dict[str, float | int | None]]:
+    """Market stats computed separately for asking ("listing") and "sold" prices."""
+    grouped: Dict[str, List[Any]] = {"listing": [], "sold": []}
+    for item in items:
+        grouped.setdefault(str(item.get("price_type") or "listing"), []).append(item.get("price"))
+    return {
+        price_type: calculate_market_stats(prices, trim_ratio, iqr_multiplier)
+        for price_type, prices in grouped.items()
+    }
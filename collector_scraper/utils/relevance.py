@@ -0,0 +1,176 @@
+from __future__ import annotations
+
+import math
+import re
+from collections import Counter
+from typing import Any, Dict, Iterable, List, Sequence, Tuple
+
+_TOKEN = re.compile(r"\d+\s*/\s*\d+|[a-z0-9]+")
+
+DEFAULT_STOPWORDS = frozenset(
+    {
+        "pokemon",
+        "cards",
+        "card",
+        "booster",
+        "set",
+        "tcg",
+        "the",
+        "and",
+    }
+)
+
+
+def _normalize_number(token: str) -> str:
+    if "/" in token:
+        left, right = (part.strip().lstrip("0") or "0" for part in token.split("/", 1))
+        return f"{left}/{right}"
+    if token.isdigit():
+        return token.lstrip("0") or "0"
+    return token
+
+
+def tokenize(text: str | None) -> List[str]:
+    """Lowercase word tokens; card numbers like ``004/102`` become ``4/102``."""
+    if not text:
+        return []
+    tokens: List[str] = []
+    for raw in _TOKEN.findall(text.lower()):
+        token = _normalize_number(raw)
+        tokens.append(token)
+        if "/" in token:
+            # Also index the bare number so "#4" and "4/102" can meet.
+            tokens.append(token.split("/", 1)[0])
+    return tokens
+
+
+def _is_numeric(token: str) -> bool:
+    return any(char.isdigit() for char in token)
+
+
+def _item_title(item: Dict[str, Any]) -> str:
+    return str(item.get("product_name") or item.get("title") or "")
+
+
+class RelevanceEngine:
+    """Batch scorer for listing titles against a search query.
+
+    All titles from a run are tokenized once into a sparse term matrix (only
+    the query's columns are materialized). A title scores the share of the
+    query's weight it matches, 0..1: each term is weighted by kind (card
+    numbers count more) and a smoothed IDF, with BM25-style length
+    saturation. Query terms that no title contains are left out, so they
+    can't sink the whole batch. Titles that contain any content word of the
+    query are always kept; the others are cut at ``min_score``.
+    """
+
+    def __init__(
+        self,
+        k1: float = 1.2,
+        b: float = 0.75,
+        numeric_weight: float = 2.0,
+        min_score: float = 0.1,
+        stopwords: Iterable[str] = DEFAULT_STOPWORDS,
+    ) -> None:
+        self.k1 = k1
+        self.b = b
+        self.numeric_weight = numeric_weight
+        self.min_score = min_score
+        self.stopwords = frozenset(stopwords)
+
+    def query_terms(self, query: str) -> Dict[str, float]:
+        tokens = tokenize(query)
+        content = [
+            tok
+            for tok in tokens
+            if tok not in self.stopwords and (len(tok) >= 3 or _is_numeric(tok))
+        ]
+        if not content:
+            content = [tok for tok in tokens if len(tok) >= 3 or _is_numeric(tok)]
+        return {
+            tok: (self.numeric_weight if _is_numeric(tok) else 1.0)
+            for tok in dict.fromkeys(content)
+        }
+
+    def match_words(self, query: str) -> List[str]:
+        """Query words of three or more characters, for the substring floor in ``rank``."""
+        words = [word for word in re.split(r"[^a-z0-9]+", query.lower()) if len(word) >= 3]
+        content = [word for word in words if word not in self.stopwords]
+        return content or words
+
+    def score_titles(self, titles: Sequence[str], query: str) -> List[float]:
+        terms = self.query_terms(query)
+        if not titles:
+            return []
+        if not terms:
+            return [1.0] * len(titles)
+
+        # Sparse term matrix restricted to the query's columns.
+        lengths: List[int] = []
+        columns: Dict[str, List[Tuple[int, int]]] = {term: [] for term in terms}
+        for row, title in enumerate(titles):
+            counts = Counter(tokenize(title))
+            lengths.append(sum(counts.values()))
+            for term in terms:
+                tf = counts.get(term)
+                if tf:
+                    columns[term].append((row, tf))
+
+        total = len(titles)
+        avg_length = (sum(lengths) / total) or 1.0
+        k1, b = self.k1, self.b
+        scores = [0.0] * total
+        matched_weight = 0.0
+        for term, weight in terms.items():
+            postings = columns[term]
+            if not postings:
+                continue
+            # Never below 1: a term every title shares still counts in full.
+            term_weight = weight * (1.0 + math.log((total + 1.0) / (len(postings) + 1.0)))
+            matched_weight += term_weight
+            for row, tf in postings:
+                norm = k1 * (1.0 - b + b * lengths[row] / avg_length)
+                # 1.0 for a single occurrence in an average-length title.
+                saturation = min(tf * (k1 + 1.0) / (tf + norm), 1.0)
+                scores[row] += term_weight * saturation
+
+        if matched_weight <= 0:
+            return scores
+        return [min(score / matched_weight, 1.0) for score in scores]
+
+    def rank(
+        self,
+        items: List[Dict[str, Any]],
+        query: str,
+        min_score: float | None = None,
+    ) -> List[Dict[str, Any]]:
+        """Return ``items`` ordered by relevance, dropping those under the threshold."""
+        if not items:
+            return []
+        threshold = self.min_score if min_score is None else min_score
+        titles = [_item_title(item) for item in items]
+        scores = self.score_titles(titles, query)
+        words = self.match_words(query)
+
+        def keep(score: float, title: str) -> bool:
+            if score >= threshold and score > 0:
+                return True
+            lowered = title.lower()
+            return any(word in lowered for word in words)
+
+        ranked = sorted(
+            (pair for pair in zip(scores, range(len(items))) if keep(pair[0], titles[pair[1]])),
+            key=lambda pair: (-pair[0], pair[1]),
+        )
+        return [items[position] for _, position in ranked]
+
+
+default_engine = RelevanceEngine()
+
+
+def rank_by_relevance(
+    items: List[Dict[str, Any]],
+    query: str,
+    min_score: float | None = None,
+) -> List[Dict[str, Any]]:
+    return default_engine.rank(items, query, min_score)
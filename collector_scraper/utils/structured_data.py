@@ -0,0 +1,317 @@
+from __future__ import annotations
+
+import html as html_lib
+import json
+import re
+from typing import Any, Dict, Iterator, List, Tuple
+from urllib.parse import urljoin
+
+from collector_scraper.utils.price_parser import parse_price
+
+_LD_JSON = re.compile(
+    r"<script[^>]*\btype\s*=\s*[\"']application/ld\+json[\"'][^>]*>(.*?)</script>",
+    re.IGNORECASE | re.DOTALL,
+)
+_META_TAG = re.compile(r"<meta\b[^>]*>", re.IGNORECASE)
+_ITEMPROP_TAG = re.compile(
+    r"<(\w+)\b[^>]*\bitemprop\s*=\s*[\"'](name|price|priceCurrency|url)[\"'][^>]*>", re.IGNORECASE
+)
+_MICRODATA_PRODUCT = re.compile(r"itemtype\s*=\s*[\"']https?://schema\.org/Product[\"']", re.IGNORECASE)
+_ATTRIBUTE = re.compile(r"([\w:-]+)\s*=\s*(?:\"([^\"]*)\"|'([^']*)')")
+_TEXT_AFTER_TAG = re.compile(r"([^<]*)")
+_JSON_DECODER = json.JSONDecoder()
+
+# Embedded app state: (marker to find, offset of the JSON after it: "tag" = after the tag's ">",
+# "assign" = after the next "=").
+_STATE_MARKERS: Tuple[Tuple[str, str], ...] = (
+    ('id="__NEXT_DATA__"', "tag"),
+    ('id="wix-warmup-data"', "tag"),
+    ("ShopifyAnalytics.meta =", "assign"),
+    ("var meta =", "assign"),
+)
+_STATE_TITLE_KEYS = ("name", "title", "productName")
+_STATE_PRICE_KEYS = ("price", "formattedPrice", "minPrice", "lowPrice", "priceAmount")
+# key -> path prefix for bare slugs (Shopify handles, Wix url parts).
+_STATE_URL_KEYS = (
+    ("url", ""),
+    ("productPageUrl", ""),
+    ("permalink", ""),
+    ("href", ""),
+    ("handle", "/products/"),
+    ("urlPart", "/product-page/"),
+    ("slug", ""),
+)
+_STATE_MAX_NODES = 200_000
+
+
+def _attributes(tag: str) -> Dict[str, str]:
+    return {
+        name.lower(): html_lib.unescape(double if double is not None else single)
+        for name, double, single in _ATTRIBUTE.findall(tag)
+    }
+
+
+def _clean(text: Any) -> str:
+    return re.sub(r"\s+", " ", html_lib.unescape(str(text))).strip()
+
+
+def _types(node: Dict[str, Any]) -> List[str]:
+    raw = node.get("@type", "")
+    return [str(value).lower() for value in (raw if isinstance(raw, list) else [raw])]
+
+
+def iter_json_ld(html: str) -> Iterator[Dict[str, Any]]:
+    """Every JSON-LD object on the page, with ``@graph`` and list wrappers flattened."""
+    for match in _LD_JSON.finditer(html):
+        try:
+            data = json.loads(match.group(1).strip())
+        except ValueError:
+            continue
+        stack = [data]
+        while stack:
+            node = stack.pop()
+            if isinstance(node, list):
+                stack.extend(reversed(node))
+            elif isinstance(node, dict):
+                if "@graph" in node:
+                    stack.append(node["@graph"])
+                yield node
+
+
+def offer_price(offers: Any) -> tuple[float | None, str | None]:
+    """Lowest price from a schema.org ``offers`` value (Offer, AggregateOffer or a list)."""
+    candidates = offers if isinstance(offers, list) else [offers]
+    best: tuple[float | None, str | None] = (None, None)
+    for offer in candidates:
+        if not isinstance(offer, dict):
+            continue
+        specification = offer.get("priceSpecification")
+        raw = offer.get("price", offer.get("lowPrice"))
+        if raw is None and isinstance(specification, dict):
+            raw = specification.get("price")
+        price, detected = parse_price(str(raw)) if raw is not None else (None, "UNKNOWN")
+        if price is None:
+            continue
+        currency = offer.get("priceCurrency") or (detected if detected != "UNKNOWN" else None)
+        if best[0] is None or price < best[0]:
+            best = (price, currency)
+    return best
+
+
+def json_ld_products(html: str) -> List[Dict[str, Any]]:
+    """``{"title", "price", "currency", "url"}`` for every priced schema.org Product or Offer."""
+    products: List[Dict[str, Any]] = []
+    for node in iter_json_ld(html):
+        types = _types(node)
+        if "itemlist" in types:
+            for element in node.get("itemListElement") or ():
+                if isinstance(element, dict) and isinstance(element.get("item"), dict):
+                    products.extend(_json_ld_product(element["item"]))
+            continue
+        if "product" in types or "offer" in types:
+            products.extend(_json_ld_product(node))
+    return products
+
+
+def _json_ld_product(node: Dict[str, Any]) -> List[Dict[str, Any]]:
+    title = node.get("name") or node.get("title")
+    if not title:
+        return []
+    offers = node.get("offers", node)
+    price, currency = offer_price(offers)
+    if price is None:
+        return []
+    first_offer = offers[0] if isinstance(offers, list) and offers else offers
+    url = node.get("url") or (first_offer.get("url") if isinstance(first_offer, dict) else None)
+    return [{"title": _clean(title), "price": price, "currency": currency, "url": str(url) if url else None}]
+
+
+def microdata_product(html: str) -> Dict[str, Any] | None:
+    """First ``itemprop`` name and price on the page (value from ``content`` or the tag's text)."""
+    values: Dict[str, str] = {}
+    for match in _ITEMPROP_TAG.finditer(html):
+        prop = match.group(2)
+        if prop in values:
+            continue
+        attributes = _attributes(match.group(0))
+        value = attributes.get("content") or (attributes.get("href") if prop == "url" else None)
+        if value is None:
+            text = _TEXT_AFTER_TAG.match(html, match.end())
+            value = text.group(1) if text else ""
+        value = _clean(value)
+        if value:
+            values[prop] = value
+    price, detected = parse_price(values.get("price"))
+    if not values.get("name") or price is None:
+        return None
+    currency = values.get("priceCurrency") or (detected if detected != "UNKNOWN" else None)
+    return {"title": values["name"], "price": price, "currency": currency, "url": values.get("url")}
+
+
+def microdata_products(html: str) -> List[Dict[str, Any]]:
+    """One product per ``itemtype=".../Product"`` scope, read up to the next scope."""
+    starts = [match.start() for match in _MICRODATA_PRODUCT.finditer(html)]
+    products = []
+    for index, start in enumerate(starts):
+        end = starts[index + 1] if index + 1 < len(starts) else len(html)
+        product = microdata_product(html[start:end])
+        if product is not None:
+            products.append(product)
+    return products
+
+
+def meta_product(html: str) -> Dict[str, Any] | None:
+    """Open Graph / product meta tags (``og:title`` with ``product:price:amount``)."""
+    meta: Dict[str, str] = {}
+    for tag in _META_TAG.findall(html):
+        attributes = _attributes(tag)
+        key = (attributes.get("property") or attributes.get("name") or "").lower()
+        if key and "content" in attributes:
+            meta.setdefault(key, attributes["content"])
+    title = meta.get("og:title")
+    raw_price = meta.get("product:price:amount") or meta.get("og:price:amount")
+    price, detected = parse_price(raw_price)
+    if not title or price is None:
+        return None
+    currency = meta.get("product:price:currency") or meta.get("og:price:currency")
+    return {
+        "title": _clean(title),
+        "price": price,
+        "currency": currency or (detected if detected != "UNKNOWN" else None),
+        "url": meta.get("og:url"),
+    }
+
+
+def _state_json(html: str, marker: str, mode: str) -> Any:
+    position = html.find(marker)
+    if position < 0:
+        return None
+    if mode == "tag":
+        start = html.find(">", position) + 1
+        if start == 0:
+            return None
+    else:
+        start = position + len(marker)
+    while start < len(html) and html[start] in " \t\r\n":
+        start += 1
+    try:
+        return _JSON_DECODER.raw_decode(html, start)[0]
+    except ValueError:
+        return None
+
+
+def _state_price(value: Any) -> float | None:
+    if isinstance(value, dict):
+        value = value.get("amount", value.get("value", value.get("formatted")))
+    if isinstance(value, bool) or value is None:
+        return None
+    if isinstance(value, (int, float)):
+        return float(value) if value > 0 else None
+    return parse_price(str(value))[0]
+
+
+def _state_product(node: Dict[str, Any]) -> Dict[str, Any] | None:
+    title = next((node[key] for key in _STATE_TITLE_KEYS if isinstance(node.get(key), str)), None)
+    if not title or len(title.strip()) < 3:
+        return None
+    price = next((p for p in (_state_price(node.get(key)) for key in _STATE_PRICE_KEYS) if p is not None), None)
+    if price is None:
+        return None
+    # A link is required; dicts with only a name and a number are too often not products.
+    for key, prefix in _STATE_URL_KEYS:
+        value = node.get(key)
+        if isinstance(value, str) and value:
+            url = value if value.startswith(("http", "/")) or not prefix else f"{prefix}{value}"
+            currency = node.get("currency") or node.get("currencyCode")
+            if not isinstance(currency, str):
+                detected = parse_price(str(node.get("formattedPrice", "")))[1]
+                currency = detected if detected != "UNKNOWN" else None
+            return {"title": _clean(title), "price": price, "currency": currency, "url": url}
+    return None
+
+
+def state_products(data: Any) -> List[Dict[str, Any]]:
+    """Product-like objects (title, price and a link) anywhere in a decoded app-state blob."""
+    products: List[Dict[str, Any]] = []
+    stack = [data]
+    visited = 0
+    while stack and visited < _STATE_MAX_NODES:
+        node = stack.pop()
+        visited += 1
+        if isinstance(node, dict):
+            product = _state_product(node)
+            if product is not None:
+                products.append(product)
+                continue
+            stack.extend(reversed(list(node.values())))
+        elif isinstance(node, list):
+            stack.extend(reversed(node))
+    return products
+
+
+def shopify_meta_products(meta: Any) -> List[Dict[str, Any]]:
+    """``ShopifyAnalytics.meta.products``: variant prices in cents, no product URLs."""
+    products: List[Dict[str, Any]] = []
+    for product in (meta.get("products") or ()) if isinstance(meta, dict) else ():
+        variants = [variant for variant in product.get("variants") or () if isinstance(variant, dict)]
+        prices = [variant["price"] / 100 for variant in variants if isinstance(variant.get("price"), (int, float))]
+        title = variants[0].get("name") if variants else None
+        if title and prices:
+            handle = product.get("handle")
+            products.append(
+                {
+                    "title": _clean(title),
+                    "price": round(min(prices), 2),
+                    "currency": meta.get("currency"),
+                    "url": f"/products/{handle}" if handle else None,
+                }
+            )
+    return products
+
+
+def embedded_state_products(html: str) -> List[Dict[str, Any]]:
+    for marker, mode in _STATE_MARKERS:
+        data = _state_json(html, marker, mode)
+        if data is None:
+            continue
+        products = shopify_meta_products(data) if mode == "assign" else state_products(data)
+        if products:
+            return products
+    return []
+
+
+def extract_listing(html: str, base_url: str = "") -> List[Dict[str, Any]]:
+    """Products from the first structured source on a listing page that has any.
+
+    Tries JSON-LD, then microdata, then embedded app state (``__NEXT_DATA__``,
+    Wix warmup data, ``ShopifyAnalytics.meta``). Each is gated on a plain
+    substring search, so pages without structured data cost a few scans of
+    the raw text and no parsing. Returns ``{"title", "price", "currency",
+    "url"}`` dicts with URLs made absolute against ``base_url``, deduplicated.
+    """
+    products: List[Dict[str, Any]] = []
+    if "application/ld+json" in html:
+        products = json_ld_products(html)
+    if not products and "itemprop" in html and _MICRODATA_PRODUCT.search(html):
+        products = microdata_products(html)
+    if not products:
+        products = embedded_state_products(html)
+
+    results: List[Dict[str, Any]] = []
+    seen = set()
+    for product in products:
+        url = urljoin(base_url, product["url"]) if product["url"] else None
+        key = (product["title"].lower(), product["price"], url)
+        if key in seen:
+            continue
+        seen.add(key)
+        results.append(dict(product, url=url))
+    return results
+
+
+def extract_product(html: str) -> Dict[str, Any] | None:
+    """Title and price of a single product page from JSON-LD, microdata or meta tags, in that order."""
+    products = json_ld_products(html)
+    if products:
+        return products[0]
+    return microdata_product(html) or meta_product(html)
@@ -0,0 +1,46 @@
+from __future__ import annotations
+
+import argparse
+from dataclasses import asdict
+
+from collector_scraper.core.sitemap_crawler import SitemapCatalogMixin
+from collector_scraper.scrapers import AdapterRegistry
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Crawl store sitemaps into local product catalogs")
+    parser.add_argument("--catalog", required=True, help="SQLite file holding the crawled catalogs")
+    parser.add_argument(
+        "--sources",
+        default="toysonfire,pokevolt,coolstuffinc",
+        help="Comma-separated sitemap-capable sources (default: toysonfire,pokevolt,coolstuffinc)",
+    )
+    parser.add_argument("--config", help="JSON adapter config overlaid on the built-in registry")
+    parser.add_argument("--max-pages", type=int, help="Product pages to fetch per source in this run")
+    parser.add_argument("--rps", type=float, help="Requests per second per source (default: adapter setting)")
+    return parser.parse_args()
+
+
+def main() -> None:
+    args = parse_args()
+    try:
+        registry = AdapterRegistry.from_config(args.config)
+        scrapers = registry.build_many(args.sources.split(","))
+    except ValueError as exc:
+        raise SystemExit(str(exc)) from None
+
+    for scraper in scrapers:
+        if not isinstance(scraper, SitemapCatalogMixin):
+            print(f"{scraper.source}: no sitemap crawling support, skipped")
+            continue
+        scraper.catalog_path = args.catalog
+        if args.max_pages is not None:
+            scraper.crawl_max_pages = args.max_pages
+        if args.rps is not None:
+            scraper.crawl_requests_per_second = args.rps
+        report = scraper.refresh_catalog()
+        print(f"{scraper.source}: " + ", ".join(f"{key} {value}" for key, value in asdict(report).items()))
+
+
+if __name__ == "__main__":
+    main()
@@ -1,8 +1,17 @@
+import argparse
+import hashlib
+import io
+import json
+import math
 import os
+import queue
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
 import requests
 import psycopg2
-from psycopg2.extras import execute_batch
+from psycopg2.pool import ThreadedConnectionPool
 from dotenv import load_dotenv
 
 
@@ -22,6 +31,15 @@ if not API_KEY:
 
 API_BASE_URL = "https://api.pokemontcg.io/v2"
 PAGE_SIZE = 250
+COPY_CHUNK_SIZE = 5000
+POOL_MIN_CONNECTIONS = 1
+POOL_MAX_CONNECTIONS = 4
+
+FETCH_WORKERS = 4
+REQUESTS_PER_SECOND = 4
+QUEUE_DEPTH = 8
+CHECKPOINT_PATH = os.getenv("POKEMON_IMPORT_CHECKPOINT", ".pokemon_import_checkpoint.json")
+CHECKPOINT_EVERY_PAGES = max(1, COPY_CHUNK_SIZE // PAGE_SIZE)
 
 DB_CONFIG = {
     "host": "localhost",
@@ -35,165 +53,682 @@ DB_CONFIG = {
 # DATABASE CONNECTION
 # ---------------------------------------
 
+_pool = None
+
+
+def get_pool():
+    global _pool
+    if _pool is None:
+        _pool = ThreadedConnectionPool(
+            POOL_MIN_CONNECTIONS,
+            POOL_MAX_CONNECTIONS,
+            **DB_CONFIG
+        )
+    return _pool
+
+
 def get_connection():
     return psycopg2.connect(**DB_CONFIG)
 
 
 # ---------------------------------------
-# INSERT SETS
+# ROW BUILDERS
 # ---------------------------------------
 
-def insert_sets(sets_data):
-    conn = get_connection()
-    cur = conn.cursor()
-
-    sql = """
-        INSERT INTO pokemon_sets (
-            id, name, series, release_date,
-            printed_total, total
-        )
-        VALUES (%s,%s,%s,%s,%s,%s)
-        ON CONFLICT (id) DO NOTHING
-    """
-
-    values = []
+SET_COLUMNS = (
+    "id", "name", "series", "release_date",
+    "printed_total", "total"
+)
+
+CARD_COLUMNS = (
+    "id", "name", "supertype", "rarity",
+    "hp", "set_id", "number",
+    "image_small", "image_large"
+)
+
+
+def set_row(s):
+    return (
+        s["id"],
+        s["name"],
+        s.get("series"),
+        s.get("releaseDate"),
+        s.get("printedTotal"),
+        s.get("total")
+    )
 
-    for s in sets_data:
-        values.append((
-            s["id"],
-            s["name"],
-            s.get("series"),
-            s.get("releaseDate"),
-            s.get("printedTotal"),
-            s.get("total")
-        ))
 
-    execute_batch(cur, sql, values)
-    conn.commit()
-    cur.close()
-    conn.close()
+def card_row(card):
+    hp_value = None
+    try:
+        if card.get("hp"):
+            hp_value = int(card.get("hp"))
+    except (TypeError, ValueError):
+        hp_value = None
 
-    print(f"Inserted {len(values)} sets.")
+    return (
+        card["id"],
+        card["name"],
+        card.get("supertype"),
+        card.get("rarity"),
+        hp_value,
+        card.get("set", {}).get("id"),
+        card.get("number"),
+        card.get("images", {}).get("small"),
+        card.get("images", {}).get("large")
+    )
 
 
 # ---------------------------------------
-# INSERT CARDS
+# BULK LOADER (COPY -> staging -> merge)
 # ---------------------------------------
 
-def insert_cards(cards_data):
-    conn = get_connection()
-    cur = conn.cursor()
+def _copy_value(value):
+    if value is None:
+        return "\\N"
+    text = str(value)
+    return (
+        text.replace("\\", "\\\\")
+        .replace("\t", "\\t")
+        .replace("\n", "\\n")
+        .replace("\r", "\\r")
+    )
 
-    sql = """
-        INSERT INTO pokemon_cards (
-            id, name, supertype, rarity,
-            hp, set_id, number,
-            image_small, image_large
-        )
-        VALUES (%s,%s,%s,%s,%s,%s,%s,%s,%s)
-        ON CONFLICT (id) DO NOTHING
+
+class CatalogBulkLoader:
     """
+    Holds one pooled connection for a whole import and buffers rows into
+    chunks. Each chunk is streamed with COPY FROM STDIN into a temp staging
+    table and merged into the target table with a single
+    INSERT ... ON CONFLICT, then committed.
 
-    values = []
+    Pass `conn` to run against a specific connection (or a stand-in
+    exposing cursor()/commit()/rollback() and copy_expert() on cursors).
+    """
 
-    for card in cards_data:
-        hp_value = None
+    def __init__(self, conn=None, chunk_size=COPY_CHUNK_SIZE, report=print):
+        self._owns_conn = conn is None
+        self.conn = conn if conn is not None else get_pool().getconn()
+        self.chunk_size = chunk_size
+        self.report = report
+        self.started = time.perf_counter()
+        self.rows_loaded = {}
+        self._pending = {}
+        self._staging_ready = set()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        if exc_type is not None and self.conn is not None:
+            self._rollback()
+        self.close(flush=exc_type is None)
+        return False
+
+    def close(self, flush=True):
+        if self.conn is None:
+            return
+        try:
+            if flush:
+                self.flush()
+        finally:
+            if self._owns_conn:
+                get_pool().putconn(self.conn)
+            self.conn = None
+        self.report_summary()
+
+    def load(self, table, columns, rows, conflict_sql="ON CONFLICT (id) DO NOTHING"):
+        pending = self._pending.setdefault(table, (columns, conflict_sql, []))[2]
+        for row in rows:
+            pending.append(row)
+            if len(pending) >= self.chunk_size:
+                self._load_chunk(table, columns, pending, conflict_sql)
+                pending.clear()
+
+    def flush(self):
+        for table, (columns, conflict_sql, pending) in self._pending.items():
+            if pending:
+                self._load_chunk(table, columns, pending, conflict_sql)
+                pending.clear()
+
+    def _rollback(self):
+        self.conn.rollback()
+        # A staging table created in the rolled-back transaction is gone with it.
+        self._staging_ready.clear()
+
+    def _staging_table(self, cur, table):
+        staging = f"{table}_staging"
+        if staging not in self._staging_ready:
+            cur.execute(
+                f"CREATE TEMP TABLE IF NOT EXISTS {staging} "
+                f"(LIKE {table} INCLUDING DEFAULTS) ON COMMIT DELETE ROWS"
+            )
+            self._staging_ready.add(staging)
+        return staging
+
+    def _load_chunk(self, table, columns, chunk, conflict_sql):
+        chunk_started = time.perf_counter()
+        column_list = ", ".join(columns)
+
+        buffer = io.StringIO()
+        for row in chunk:
+            buffer.write("\t".join(_copy_value(value) for value in row))
+            buffer.write("\n")
+        buffer.seek(0)
+
+        cur = self.conn.cursor()
         try:
-            if card.get("hp"):
-                hp_value = int(card.get("hp"))
-        except:
-            hp_value = None
+            staging = self._staging_table(cur, table)
+            cur.copy_expert(
+                f"COPY {staging} ({column_list}) FROM STDIN",
+                buffer
+            )
+            cur.execute(
+                f"INSERT INTO {table} ({column_list}) "
+                f"SELECT DISTINCT ON (id) {column_list} FROM {staging} "
+                f"{conflict_sql}"
+            )
+            self.conn.commit()
+        except Exception:
+            self._rollback()
+            raise
+        finally:
+            cur.close()
+
+        self.rows_loaded[table] = self.rows_loaded.get(table, 0) + len(chunk)
+        chunk_elapsed = max(time.perf_counter() - chunk_started, 1e-9)
+        self.report(
+            f"[{table}] +{len(chunk)} rows "
+            f"({len(chunk) / chunk_elapsed:,.0f} rows/s), "
+            f"total {self.rows_loaded[table]}"
+        )
+
+    def report_summary(self):
+        elapsed = max(time.perf_counter() - self.started, 1e-9)
+        for table, count in sorted(self.rows_loaded.items()):
+            self.report(
+                f"[{table}] loaded {count} rows in {elapsed:.1f}s "
+                f"({count / elapsed:,.0f} rows/s)"
+            )
 
-        values.append((
-            card["id"],
-            card["name"],
-            card.get("supertype"),
-            card.get("rarity"),
-            hp_value,
-            card.get("set", {}).get("id"),
-            card.get("number"),
-            card.get("images", {}).get("small"),
-            card.get("images", {}).get("large")
-        ))
 
-    execute_batch(cur, sql, values)
-    conn.commit()
-    cur.close()
-    conn.close()
+# ---------------------------------------
+# INSERT SETS
+# ---------------------------------------
 
-    print(f"Inserted {len(values)} cards.")
+def insert_sets(sets_data, loader):
+    loader.load("pokemon_sets", SET_COLUMNS, (set_row(s) for s in sets_data))
+    print(f"Queued {len(sets_data)} sets.")
 
 
 # ---------------------------------------
-# FETCH ALL SETS
+# INSERT CARDS
 # ---------------------------------------
 
-def fetch_sets():
-    print("Fetching sets...")
+def insert_cards(cards_data, loader):
+    loader.load("pokemon_cards", CARD_COLUMNS, (card_row(c) for c in cards_data))
+    print(f"Queued {len(cards_data)} cards.")
 
-    headers = {"X-Api-Key": API_KEY}
 
-    response = requests.get(
+# ---------------------------------------
+# FETCH ALL SETS
+# ---------------------------------------
+
+def fetch_sets_data(session=None):
+    http = session or requests
+    response = http.get(
         f"{API_BASE_URL}/sets",
-        headers=headers,
+        headers={"X-Api-Key": API_KEY},
         timeout=20
     )
     response.raise_for_status()
+    return response.json()["data"]
+
+
+def fetch_sets(loader):
+    print("Fetching sets...")
 
-    sets_data = response.json()["data"]
-    insert_sets(sets_data)
+    sets_data = fetch_sets_data()
+    insert_sets(sets_data, loader)
+    # Cards reference sets, so land them before any card chunk is merged.
+    loader.flush()
 
 
 # ---------------------------------------
-# FETCH ALL CARDS (Paginated)
+# RATE LIMITING / CHECKPOINTS
 # ---------------------------------------
 
-def fetch_all_cards():
-    print("Fetching all cards...")
+class RateLimiter:
+    """Thread-safe limiter that spaces request starts evenly."""
 
-    headers = {"X-Api-Key": API_KEY}
-    page = 1
-    total_imported = 0
+    def __init__(self, per_second):
+        self.interval = 1.0 / per_second if per_second > 0 else 0.0
+        self._lock = threading.Lock()
+        self._next_slot = time.monotonic()
 
-    while True:
-        print(f"Fetching page {page}...")
-
-        response = requests.get(
-            f"{API_BASE_URL}/cards",
-            headers=headers,
-            params={
-                "page": page,
-                "pageSize": PAGE_SIZE
+    def wait(self):
+        with self._lock:
+            now = time.monotonic()
+            slot = max(now, self._next_slot)
+            self._next_slot = slot + self.interval
+        delay = slot - now
+        if delay > 0:
+            time.sleep(delay)
+
+
+def load_checkpoint(path):
+    try:
+        with open(path, "r", encoding="utf-8") as handle:
+            data = json.load(handle)
+    except (OSError, ValueError):
+        return {}
+    if data.get("page_size") != PAGE_SIZE:
+        return {}
+    return data
+
+
+def save_checkpoint(path, total_pages, done_pages):
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "w", encoding="utf-8") as handle:
+        json.dump(
+            {
+                "page_size": PAGE_SIZE,
+                "total_pages": total_pages,
+                "done": sorted(done_pages)
             },
-            timeout=30
+            handle
         )
+    os.replace(tmp_path, path)
 
-        response.raise_for_status()
-        data = response.json()
 
-        cards = data.get("data", [])
-        if not cards:
+# ---------------------------------------
+# FETCH ALL CARDS (Concurrent, pipelined)
+# ---------------------------------------
+
+_DONE = object()
+
+
+def _put(q, item, stop):
+    while not stop.is_set():
+        try:
+            q.put(item, timeout=0.5)
+            return True
+        except queue.Full:
+            continue
+    return False
+
+
+def fetch_cards_page(session, limiter, page, query=None):
+    params = {
+        "page": page,
+        "pageSize": PAGE_SIZE
+    }
+    if query:
+        params["q"] = query
+
+    limiter.wait()
+    response = session.get(
+        f"{API_BASE_URL}/cards",
+        params=params,
+        timeout=30
+    )
+    response.raise_for_status()
+    return response.content
+
+
+def _fetch_worker(session, limiter, pages, raw_queue, stop):
+    while not stop.is_set():
+        try:
+            page = pages.get_nowait()
+        except queue.Empty:
             break
+        try:
+            body = fetch_cards_page(session, limiter, page)
+        except Exception as exc:
+            _put(raw_queue, (page, exc), stop)
+            break
+        if not _put(raw_queue, (page, body), stop):
+            break
+    _put(raw_queue, _DONE, stop)
 
-        insert_cards(cards)
 
+def _decode_worker(raw_queue, card_queue, fetch_workers, stop):
+    finished = 0
+    while finished < fetch_workers and not stop.is_set():
+        try:
+            item = raw_queue.get(timeout=0.5)
+        except queue.Empty:
+            continue
+        if item is _DONE:
+            finished += 1
+            continue
+        page, body = item
+        if not isinstance(body, Exception):
+            try:
+                body = json.loads(body).get("data", [])
+            except ValueError as exc:
+                body = exc
+        if not _put(card_queue, (page, body), stop):
+            break
+    _put(card_queue, _DONE, stop)
+
+
+def fetch_all_cards(loader, workers=FETCH_WORKERS, checkpoint_path=CHECKPOINT_PATH):
+    print("Fetching all cards...")
+
+    session = requests.Session()
+    session.headers["X-Api-Key"] = API_KEY
+    limiter = RateLimiter(REQUESTS_PER_SECOND)
+
+    checkpoint = load_checkpoint(checkpoint_path)
+    done_pages = set(checkpoint.get("done", []))
+    total_pages = checkpoint.get("total_pages")
+    uncommitted = []
+    total_imported = 0
+    started = time.perf_counter()
+
+    def commit_checkpoint():
+        loader.flush()
+        done_pages.update(uncommitted)
+        uncommitted.clear()
+        save_checkpoint(checkpoint_path, total_pages, done_pages)
+
+    def handle_page(page, cards):
+        nonlocal total_imported
+        insert_cards(cards, loader)
+        uncommitted.append(page)
         total_imported += len(cards)
-        print(f"Total imported so far: {total_imported}")
+        if len(uncommitted) >= CHECKPOINT_EVERY_PAGES:
+            commit_checkpoint()
+
+    if done_pages:
+        print(f"Resuming from checkpoint: {len(done_pages)}/{total_pages} pages done.")
+
+    if total_pages is None:
+        # The first page tells us how many pages exist.
+        first = json.loads(fetch_cards_page(session, limiter, 1))
+        total_pages = max(1, math.ceil(first.get("totalCount", 0) / PAGE_SIZE))
+        print(f"Catalog has {first.get('totalCount', 0)} cards across {total_pages} pages.")
+        handle_page(1, first.get("data", []))
+
+    pages = queue.Queue()
+    for page in range(1, total_pages + 1):
+        if page not in done_pages and page not in uncommitted:
+            pages.put(page)
+
+    raw_queue = queue.Queue(maxsize=QUEUE_DEPTH)
+    card_queue = queue.Queue(maxsize=QUEUE_DEPTH)
+    stop = threading.Event()
+    fetch_workers = max(1, min(workers, pages.qsize()))
+
+    threads = [
+        threading.Thread(
+            target=_fetch_worker,
+            args=(session, limiter, pages, raw_queue, stop),
+            daemon=True
+        )
+        for _ in range(fetch_workers)
+    ]
+    threads.append(
+        threading.Thread(
+            target=_decode_worker,
+            args=(raw_queue, card_queue, fetch_workers, stop),
+            daemon=True
+        )
+    )
+    for thread in threads:
+        thread.start()
+
+    try:
+        while True:
+            item = card_queue.get()
+            if item is _DONE:
+                break
+            page, cards = item
+            if isinstance(cards, Exception):
+                raise RuntimeError(f"Page {page} failed: {cards}") from cards
+            handle_page(page, cards)
+            elapsed = max(time.perf_counter() - started, 1e-9)
+            print(
+                f"Page {page} done ({len(done_pages) + len(uncommitted)}/{total_pages}), "
+                f"{total_imported / elapsed:,.0f} cards/s"
+            )
+        commit_checkpoint()
+    except BaseException:
+        stop.set()
+        raise
+    finally:
+        for thread in threads:
+            thread.join(timeout=1)
+
+    missing = total_pages - len(done_pages)
+    if missing:
+        raise RuntimeError(f"{missing} pages were not imported; re-run to resume.")
+
+    os.remove(checkpoint_path)
+    print(f"All cards imported successfully ({total_imported} this run).")
+
+
+# ---------------------------------------
+# INCREMENTAL SYNC
+# ---------------------------------------
+
+SYNC_SCHEMA_SQL = (
+    "ALTER TABLE pokemon_sets ADD COLUMN IF NOT EXISTS row_hash TEXT",
+    "ALTER TABLE pokemon_cards ADD COLUMN IF NOT EXISTS row_hash TEXT",
+    """
+    CREATE TABLE IF NOT EXISTS pokemon_sync_sets (
+        set_id TEXT PRIMARY KEY,
+        total INTEGER,
+        updated_at TEXT,
+        synced_at TIMESTAMPTZ NOT NULL DEFAULT now()
+    )
+    """,
+    """
+    CREATE TABLE IF NOT EXISTS pokemon_sync_runs (
+        id SERIAL PRIMARY KEY,
+        started_at TIMESTAMPTZ NOT NULL,
+        finished_at TIMESTAMPTZ NOT NULL DEFAULT now(),
+        watermark TEXT,
+        sets_synced INTEGER NOT NULL,
+        cards_upserted INTEGER NOT NULL
+    )
+    """,
+)
+
+
+def _upsert_sql(table, columns):
+    updates = ", ".join(f"{col} = EXCLUDED.{col}" for col in columns if col != "id")
+    return (
+        f"ON CONFLICT (id) DO UPDATE SET {updates} "
+        f"WHERE {table}.row_hash IS DISTINCT FROM EXCLUDED.row_hash"
+    )
+
+
+def row_hash(row):
+    payload = json.dumps(row, separators=(",", ":"), default=str)
+    return hashlib.sha1(payload.encode("utf-8")).hexdigest()
+
+
+def with_hash(row):
+    return row + (row_hash(row),)
+
+
+SYNC_SET_COLUMNS = SET_COLUMNS + ("row_hash",)
+SYNC_CARD_COLUMNS = CARD_COLUMNS + ("row_hash",)
+SET_UPSERT_SQL = _upsert_sql("pokemon_sets", SYNC_SET_COLUMNS)
+CARD_UPSERT_SQL = _upsert_sql("pokemon_cards", SYNC_CARD_COLUMNS)
+
 
+def ensure_sync_schema(conn):
+    cur = conn.cursor()
+    try:
+        for statement in SYNC_SCHEMA_SQL:
+            cur.execute(statement)
+        conn.commit()
+    finally:
+        cur.close()
+
+
+def load_sync_state(conn):
+    cur = conn.cursor()
+    try:
+        cur.execute("SELECT set_id, total, updated_at FROM pokemon_sync_sets")
+        state = {set_id: (total, updated_at) for set_id, total, updated_at in cur.fetchall()}
+        cur.execute("SELECT watermark FROM pokemon_sync_runs ORDER BY id DESC LIMIT 1")
+        last_run = cur.fetchone()
+    finally:
+        cur.close()
+    return state, last_run[0] if last_run else None
+
+
+def mark_sets_synced(conn, sets_data):
+    cur = conn.cursor()
+    try:
+        for s in sets_data:
+            cur.execute(
+                """
+                INSERT INTO pokemon_sync_sets (set_id, total, updated_at, synced_at)
+                VALUES (%s, %s, %s, now())
+                ON CONFLICT (set_id) DO UPDATE SET
+                    total = EXCLUDED.total,
+                    updated_at = EXCLUDED.updated_at,
+                    synced_at = EXCLUDED.synced_at
+                """,
+                (s["id"], s.get("total"), s.get("updatedAt"))
+            )
+        conn.commit()
+    finally:
+        cur.close()
+
+
+def record_sync_run(conn, started_at, watermark, sets_synced, cards_upserted):
+    cur = conn.cursor()
+    try:
+        cur.execute(
+            """
+            INSERT INTO pokemon_sync_runs (
+                started_at, watermark, sets_synced, cards_upserted
+            )
+            VALUES (to_timestamp(%s), %s, %s, %s)
+            """,
+            (started_at, watermark, sets_synced, cards_upserted)
+        )
+        conn.commit()
+    finally:
+        cur.close()
+
+
+def changed_sets(sets_data, state, watermark=None):
+    """
+    Sets to re-fetch: ones never synced, and known ones whose total or
+    updatedAt changed. With a watermark (the newest updatedAt of the last
+    finished run; the API's "YYYY/MM/DD HH:MM:SS" sorts as text), known
+    sets not updated after it are skipped without comparing.
+    """
+    changed = []
+    for s in sets_data:
+        known = state.get(s["id"])
+        if known is None:
+            changed.append(s)
+        elif watermark and (s.get("updatedAt") or "") <= watermark:
+            continue
+        elif known != (s.get("total"), s.get("updatedAt")):
+            changed.append(s)
+    return changed
+
+
+def fetch_set_cards(session, limiter, set_id):
+    cards = []
+    page = 1
+    while True:
+        data = json.loads(
+            fetch_cards_page(session, limiter, page, query=f"set.id:{set_id}")
+        )
+        batch = data.get("data", [])
+        cards.extend(batch)
+        if not batch or len(cards) >= data.get("totalCount", 0):
+            return cards
         page += 1
-        time.sleep(0.2)  # Respect API rate limits
 
-    print("All cards imported successfully.")
+
+def sync_catalog(loader, workers=FETCH_WORKERS):
+    print("Running incremental sync...")
+    started_at = time.time()
+
+    ensure_sync_schema(loader.conn)
+    state, watermark = load_sync_state(loader.conn)
+
+    session = requests.Session()
+    session.headers["X-Api-Key"] = API_KEY
+    limiter = RateLimiter(REQUESTS_PER_SECOND)
+
+    sets_data = fetch_sets_data(session)
+    pending = changed_sets(sets_data, state, watermark)
+    print(
+        f"{len(pending)} of {len(sets_data)} sets are new or changed "
+        f"(watermark: {watermark or 'none'})."
+    )
+
+    loader.load(
+        "pokemon_sets",
+        SYNC_SET_COLUMNS,
+        (with_hash(set_row(s)) for s in pending),
+        conflict_sql=SET_UPSERT_SQL
+    )
+    loader.flush()
+
+    cards_upserted = 0
+    with ThreadPoolExecutor(max_workers=max(1, workers)) as executor:
+        futures = {
+            executor.submit(fetch_set_cards, session, limiter, s["id"]): s
+            for s in pending
+        }
+        for future in as_completed(futures):
+            set_data = futures[future]
+            cards = future.result()
+            loader.load(
+                "pokemon_cards",
+                SYNC_CARD_COLUMNS,
+                (with_hash(card_row(card)) for card in cards),
+                conflict_sql=CARD_UPSERT_SQL
+            )
+            # A set only counts as complete once its cards are committed.
+            loader.flush()
+            mark_sets_synced(loader.conn, [set_data])
+            cards_upserted += len(cards)
+            print(f"Synced set {set_data['id']} ({len(cards)} cards).")
+
+    new_watermark = max(
+        [s.get("updatedAt") or "" for s in sets_data] + [watermark or ""]
+    ) or None
+    record_sync_run(loader.conn, started_at, new_watermark, len(pending), cards_upserted)
+    print(f"Incremental sync finished: {len(pending)} sets, {cards_upserted} cards checked.")
 
 
 # ---------------------------------------
 # MAIN
 # ---------------------------------------
 
+def parse_args():
+    parser = argparse.ArgumentParser(description="Import the Pokemon TCG catalog")
+    parser.add_argument(
+        "--incremental",
+        action="store_true",
+        help="Only fetch new or changed sets and upsert changed rows",
+    )
+    return parser.parse_args()
+
+
 if __name__ == "__main__":
+    args = parse_args()
     try:
-        fetch_sets()
-        fetch_all_cards()
+        with CatalogBulkLoader() as loader:
+            if args.incremental:
+                sync_catalog(loader)
+            else:
+                fetch_sets(loader)
+                fetch_all_cards(loader)
         print("Import completed successfully.")
     except Exception as e:
         print("Error occurred:", e)
@@ -4,7 +4,16 @@ import argparse
 from collections import Counter
 
 from collector_scraper.core.orchestrator import run_all_scrapers
-from collector_scraper.utils.outlier_filter import calculate_market_stats
+from collector_scraper.core.profiler import SamplingProfiler
+from collector_scraper.core.tracing import (
+    InMemoryCollector,
+    JsonlCollector,
+    PrometheusCollector,
+    Tracer,
+    set_tracer,
+)
+from collector_scraper.core.watch import JsonlSink, SnapshotStore, Watcher
+from collector_scraper.scrapers import AdapterRegistry, SourceSelection, set_default_registry
 
 
 def parse_args() -> argparse.Namespace:
@@ -22,23 +31,98 @@ def parse_args() -> argparse.Namespace:
         default=5,
         help="Number of site scrapers to run in parallel (default: 5)",
     )
-    return parser.parse_args()
+    parser.add_argument(
+        "--sources",
+        help="Comma-separated sources to run (default: picked per query from the registry)",
+    )
+    parser.add_argument("--config", help="JSON adapter config overlaid on the built-in registry")
+    parser.add_argument("--currency", help="Only run stores pricing in this currency (e.g. INR, USD)")
+    parser.add_argument("--region", help="Only run stores in this region (e.g. US, IN, EU)")
+    parser.add_argument(
+        "--max-sources",
+        type=int,
+        help="Run at most this many sources, cheapest (fewest requests) first",
+    )
+    parser.add_argument(
+        "--sold",
+        action="store_true",
+        help="Also collect sold/completed listings and report sold-price stats",
+    )
+    parser.add_argument(
+        "--watch-dir",
+        help="Keep the last result per query here and print what changed since then",
+    )
+    parser.add_argument(
+        "--events-jsonl",
+        help="Append price-change events to this JSON Lines file (needs --watch-dir)",
+    )
+    parser.add_argument(
+        "--trace",
+        action="store_true",
+        help="Print time spent per phase (request, parse, filter, rank, dedup, stats)",
+    )
+    parser.add_argument("--trace-jsonl", help="Append every traced span to this JSON Lines file")
+    parser.add_argument("--metrics-file", help="Write Prometheus text metrics for this run to this file")
+    parser.add_argument(
+        "--profile",
+        metavar="PATH",
+        help="Sample all threads during the run; write collapsed stacks (flamegraph format) to PATH",
+    )
+    parser.add_argument(
+        "--profile-interval-ms",
+        type=float,
+        default=5.0,
+        help="Sampling interval for --profile (default: 5)",
+    )
+    args = parser.parse_args()
+    if args.events_jsonl and not args.watch_dir:
+        parser.error("--events-jsonl needs --watch-dir")
+    return args
 
 
 def main() -> None:
     args = parse_args()
+    in_memory = InMemoryCollector() if args.trace else None
+    jsonl = JsonlCollector(args.trace_jsonl) if args.trace_jsonl else None
+    prometheus = PrometheusCollector() if args.metrics_file else None
+    collectors = [collector for collector in (in_memory, jsonl, prometheus) if collector is not None]
+    if collectors:
+        set_tracer(Tracer(collectors))
+
+    profiler = SamplingProfiler(args.profile_interval_ms / 1000) if args.profile else None
+
+    try:
+        registry = AdapterRegistry.from_config(args.config)
+        scrapers = registry.build_many(args.sources.split(",")) if args.sources else None
+    except ValueError as exc:
+        raise SystemExit(str(exc)) from None
+    set_default_registry(registry)
+    # An explicit --sources list is only narrowed by explicit flags, not by query hints.
+    selection = SourceSelection(
+        currency=args.currency,
+        region=args.region,
+        max_sources=args.max_sources,
+        infer_from_query=scrapers is None,
+    )
+
     orchestration = run_all_scrapers(
         query=args.query,
+        scrapers=scrapers,
         max_results_per_site=args.max_results_per_site,
         max_workers=args.max_workers,
+        include_sold=args.sold,
+        profiler=profiler,
+        selection=selection,
+        registry=registry,
     )
 
     items = orchestration.items
-    prices = [item.get("price") for item in items]
-    stats = calculate_market_stats(prices)
+    stats_by_type = orchestration.market_stats()
 
     print(f"Query: {args.query}")
     print(f"Listings collected: {len(items)}")
+    print(f"Irrelevant listings dropped: {orchestration.dropped_irrelevant}")
+    print(f"Cross-source duplicates merged: {orchestration.duplicates_merged}")
 
     source_counts = Counter(item.get("source") for item in items)
     if source_counts:
@@ -51,19 +135,52 @@ def main() -> None:
         for source, elapsed in sorted(orchestration.durations_ms.items()):
             print(f"  - {source}: {elapsed}")
 
-    print("Market stats:")
-    print(f"  - raw_count: {stats['raw_count']}")
-    print(f"  - count: {stats['count']}")
-    print(f"  - high: {stats['high']}")
-    print(f"  - low: {stats['low']}")
-    print(f"  - average: {stats['average']}")
-    print(f"  - median: {stats['median']}")
+    stat_sections = [("Market stats (asking prices):", stats_by_type["listing"])]
+    if args.sold:
+        print(f"Sold listings collected: {len(orchestration.sold_items)}")
+        stat_sections.append(("Market stats (sold prices):", stats_by_type["sold"]))
+
+    for heading, stats in stat_sections:
+        print(heading)
+        print(f"  - raw_count: {stats['raw_count']}")
+        print(f"  - count: {stats['count']}")
+        print(f"  - high: {stats['high']}")
+        print(f"  - low: {stats['low']}")
+        print(f"  - average: {stats['average']}")
+        print(f"  - median: {stats['median']}")
+
+    if args.watch_dir:
+        sinks = [JsonlSink(args.events_jsonl)] if args.events_jsonl else []
+        events = Watcher(SnapshotStore(args.watch_dir), sinks).observe(orchestration)
+        print(f"Changes since last run: {len(events)}")
+        for event in events:
+            print(
+                f"  - {event.kind} [{event.source}] {event.product_name}: "
+                f"{event.old_price} -> {event.new_price}"
+            )
 
     if orchestration.errors:
         print("Errors:")
         for error in orchestration.errors:
             print(f"  - {error['source']}: {error['error']}")
 
+    if in_memory is not None:
+        print("Phase timings (ms):")
+        for name, entry in sorted(in_memory.summary().items(), key=lambda pair: -pair[1]["total_ms"]):
+            print(
+                f"  - {name}: total={entry['total_ms']:.1f} count={entry['count']} "
+                f"max={entry['max_ms']:.1f}"
+            )
+    if profiler is not None:
+        profiler.write_collapsed(args.profile)
+        print(f"Profile ({profiler.sample_count} samples over {profiler.elapsed_seconds:.1f}s, idle excluded):")
+        print(profiler.format_summary())
+        print(f"Collapsed stacks written to {args.profile}")
+    if jsonl is not None:
+        jsonl.flush()
+    if prometheus is not None:
+        prometheus.write(args.metrics_file)
+
 
 if __name__ == "__main__":
     main()
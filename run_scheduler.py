@@ -0,0 +1,91 @@
+from __future__ import annotations
+
+import argparse
+import json
+import signal
+import threading
+from dataclasses import asdict
+
+from collector_scraper.core.scheduler import Scheduler, load_jobs
+from collector_scraper.core.watch import JsonlSink, SnapshotStore, Watcher
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Run recurring scrape jobs on warm adapters")
+    parser.add_argument("jobs", help="JSON file with a list of jobs (query, sources, interval_seconds, priority)")
+    parser.add_argument(
+        "--max-concurrent-jobs",
+        type=int,
+        default=2,
+        help="Jobs allowed to run at the same time (default: 2)",
+    )
+    parser.add_argument(
+        "--site-concurrency",
+        type=int,
+        default=2,
+        help="Concurrent searches allowed per site across all jobs (default: 2)",
+    )
+    parser.add_argument(
+        "--status-interval",
+        type=float,
+        default=30.0,
+        help="Seconds between queue depth/lag reports (default: 30)",
+    )
+    parser.add_argument(
+        "--status-file",
+        help="Also write the latest queue depth/lag report to this JSON file",
+    )
+    parser.add_argument("--watch-dir", help="Diff each run against the previous one for its query")
+    parser.add_argument("--events-jsonl", help="Append change events to this JSON Lines file (needs --watch-dir)")
+    args = parser.parse_args()
+    if args.events_jsonl and not args.watch_dir:
+        parser.error("--events-jsonl needs --watch-dir")
+    return args
+
+
+def main() -> None:
+    args = parse_args()
+    jobs = load_jobs(args.jobs)
+
+    watcher = None
+    if args.watch_dir:
+        sinks = [JsonlSink(args.events_jsonl)] if args.events_jsonl else []
+        watcher = Watcher(SnapshotStore(args.watch_dir), sinks)
+
+    def on_result(job, result) -> None:
+        changes = len(watcher.observe(result)) if watcher else 0
+        print(
+            f"[{job.name}] {len(result.items)} listings, {len(result.errors)} errors, "
+            f"{changes} changes"
+        )
+
+    scheduler = Scheduler(
+        jobs,
+        max_concurrent_jobs=args.max_concurrent_jobs,
+        site_concurrency=args.site_concurrency,
+        on_result=on_result,
+    )
+
+    stopping = threading.Event()
+    signal.signal(signal.SIGTERM, lambda *_: stopping.set())
+    signal.signal(signal.SIGINT, lambda *_: stopping.set())
+
+    print(f"Scheduler started with {len(jobs)} jobs.")
+    scheduler.start()
+    while not stopping.wait(args.status_interval):
+        stats = scheduler.stats()
+        print(
+            f"queue={stats.queued} due={stats.due} running={stats.running} "
+            f"runs={stats.runs} failures={stats.failures} "
+            f"lag={stats.last_lag_seconds:.1f}s max_lag={stats.max_lag_seconds:.1f}s"
+        )
+        if args.status_file:
+            with open(args.status_file, "w", encoding="utf-8") as handle:
+                json.dump(asdict(stats), handle)
+
+    print("Stopping scheduler...")
+    scheduler.stop(timeout=30)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,143 @@
+from __future__ import annotations
+
+import argparse
+import os
+import signal
+import threading
+
+from collector_scraper.core.work_queue import (
+    Broker,
+    QueueWorker,
+    SQLiteBroker,
+    build_broker_server,
+    open_broker,
+    wait_for_result,
+)
+from collector_scraper.scrapers import build_tier1_scrapers
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Queue-backed scraping across worker processes and hosts")
+    parser.add_argument(
+        "--broker",
+        default="scrape_queue.sqlite3",
+        help="SQLite queue file on a local disk, or the http:// URL of a 'serve' process on another host",
+    )
+    parser.add_argument(
+        "--token",
+        default=os.environ.get("SCRAPE_BROKER_TOKEN"),
+        help="Shared secret for the broker's HTTP endpoint (default: $SCRAPE_BROKER_TOKEN)",
+    )
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    enqueue = commands.add_parser("enqueue", help="Queue one task per source for a query")
+    enqueue.add_argument("query", help="Product search query")
+    enqueue.add_argument("--sources", help="Comma-separated sources (default: all Tier-1 sources)")
+    enqueue.add_argument("--sold", action="store_true", help="Also queue sold-listing tasks where supported")
+    enqueue.add_argument("--max-results-per-site", type=int, default=30)
+    enqueue.add_argument("--max-attempts", type=int, default=3)
+    enqueue.add_argument(
+        "--wait",
+        type=float,
+        help="Wait up to this many seconds for the batch and print a summary",
+    )
+
+    work = commands.add_parser("work", help="Claim and run tasks until interrupted")
+    work.add_argument("--threads", type=int, default=2, help="Worker threads in this process (default: 2)")
+    work.add_argument("--lease-seconds", type=float, default=120.0)
+    work.add_argument(
+        "--host-interval",
+        type=float,
+        default=1.0,
+        help="Minimum seconds between requests to one host across all workers (default: 1.0)",
+    )
+
+    serve = commands.add_parser("serve", help="Expose the SQLite queue file to workers on other hosts")
+    serve.add_argument("--host", default="127.0.0.1", help="Bind address (default: 127.0.0.1)")
+    serve.add_argument("--port", type=int, default=8765, help="Port (default: 8765)")
+    return parser.parse_args()
+
+
+def enqueue(broker: Broker, args: argparse.Namespace) -> None:
+    scrapers = build_tier1_scrapers()
+    sources = args.sources.split(",") if args.sources else [scraper.source for scraper in scrapers]
+    sold_sources = (
+        [scraper.source for scraper in scrapers if scraper.supports_sold and scraper.source in sources]
+        if args.sold
+        else []
+    )
+    batch_id = broker.enqueue(
+        args.query,
+        sources,
+        include_sold=sold_sources,
+        max_results_per_site=args.max_results_per_site,
+        max_attempts=args.max_attempts,
+    )
+    print(f"Queued batch {batch_id}: {len(sources) + len(sold_sources)} tasks")
+    if args.wait is None:
+        return
+
+    result = wait_for_result(broker, batch_id, args.query, timeout_seconds=args.wait)
+    if result is None:
+        print(f"Batch not finished after {args.wait:.0f}s; queue: {broker.queue_depth()}")
+        return
+    print(f"Listings collected: {len(result.items)}")
+    print(f"Sold listings collected: {len(result.sold_items)}")
+    for error in result.errors:
+        print(f"  ! {error['source']}: {error['error']}")
+
+
+def work(broker: Broker, args: argparse.Namespace) -> None:
+    stopping = threading.Event()
+    signal.signal(signal.SIGTERM, lambda *_: stopping.set())
+    signal.signal(signal.SIGINT, lambda *_: stopping.set())
+
+    # Adapters are shared by this process's threads, like the scheduler does.
+    scrapers = build_tier1_scrapers()
+    workers = [
+        QueueWorker(
+            broker,
+            scrapers=scrapers,
+            lease_seconds=args.lease_seconds,
+            default_host_interval=args.host_interval,
+        )
+        for _ in range(max(1, args.threads))
+    ]
+    threads = [threading.Thread(target=worker.run_forever, args=(stopping,)) for worker in workers]
+    for thread in threads:
+        thread.start()
+    print(f"{len(workers)} workers polling {args.broker}")
+    while not stopping.wait(1.0):
+        pass
+    print("Stopping workers...")
+    for thread in threads:
+        thread.join()
+
+
+def serve(args: argparse.Namespace) -> None:
+    if args.broker.startswith(("http://", "https://")):
+        raise SystemExit("serve needs a local SQLite file as --broker")
+    server = build_broker_server(SQLiteBroker(args.broker), args.host, args.port, token=args.token)
+    print(f"Serving {args.broker} on http://{args.host}:{server.server_address[1]}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+
+def main() -> None:
+    args = parse_args()
+    if args.command == "serve":
+        serve(args)
+        return
+    broker = open_broker(args.broker, token=args.token)
+    if args.command == "enqueue":
+        enqueue(broker, args)
+    else:
+        work(broker, args)
+
+
+if __name__ == "__main__":
+    main()
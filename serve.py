@@ -0,0 +1,58 @@
+from __future__ import annotations
+
+import argparse
+
+from collector_scraper.core.service import QueryService, build_server
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Serve scraper queries over HTTP")
+    parser.add_argument("--host", default="127.0.0.1", help="Bind address (default: 127.0.0.1)")
+    parser.add_argument("--port", type=int, default=8080, help="Port (default: 8080)")
+    parser.add_argument(
+        "--ttl",
+        type=float,
+        default=300.0,
+        help="Seconds a finished result is served from cache (default: 300)",
+    )
+    parser.add_argument(
+        "--max-cached",
+        type=int,
+        default=1024,
+        help="Finished results kept in cache at most; oldest dropped first (default: 1024)",
+    )
+    parser.add_argument(
+        "--max-inflight",
+        type=int,
+        default=8,
+        help="Distinct scrapes allowed at once; more get HTTP 503 (default: 8)",
+    )
+    parser.add_argument(
+        "--max-workers",
+        type=int,
+        default=5,
+        help="Site scrapers run in parallel per query (default: 5)",
+    )
+    return parser.parse_args()
+
+
+def main() -> None:
+    args = parse_args()
+    service = QueryService(
+        ttl_seconds=args.ttl,
+        max_cached=args.max_cached,
+        max_inflight=args.max_inflight,
+        max_workers=args.max_workers,
+    )
+    server = build_server(service, args.host, args.port)
+    print(f"Serving on http://{args.host}:{args.port} (GET /search?q=..., /search/stream?q=...)")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,82 @@
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+
+from benchmarks.mock_server import MockSiteServer, route_browser_to_mock, route_to_mock
+from collector_scraper.core.browser_pool import BrowserPool
+from collector_scraper.scrapers.tcgplayer import TCGPlayerScraper
+
+JS_SEARCH_URL = "https://www.tcgplayer.com/search/all/product?q={query}&view=js"
+
+
+@pytest.fixture
+def server():
+    with MockSiteServer() as server:
+        yield server
+
+
+@pytest.fixture
+def pool(server):
+    pytest.importorskip("playwright.async_api")
+    pool = BrowserPool(max_pages=1, max_uses_per_context=2, max_memory_mb=0)
+    route_browser_to_mock(pool, server.url)
+    try:
+        pool.start()
+    except Exception as exc:  # Playwright is installed but its browser is not.
+        pytest.skip(f"cannot launch {pool.browser_type}: {exc}")
+    yield pool
+    pool.close()
+
+
+def render_shell(pool: BrowserPool):
+    return pool.render(JS_SEARCH_URL.format(query="charizard"), wait_selector=TCGPlayerScraper.item_selector)
+
+
+def test_auto_render_mode_parses_javascript_shell(pool, server):
+    scraper = TCGPlayerScraper()
+    scraper.api_enabled = False
+    scraper.search_url_template = JS_SEARCH_URL
+    scraper.fallback_search_url_templates = ()
+    scraper.max_pages = 1
+    scraper.render_mode = "auto"
+    scraper.browser_pool = pool
+    route_to_mock(scraper, server.url)
+
+    items = scraper.search("charizard")
+
+    assert items
+    assert all("charizard" in item["product_name"].lower() for item in items)
+    assert pool.pages_rendered == 1
+    assert pool.requests_blocked >= 1  # The shell's analytics tag.
+
+
+def test_without_render_mode_javascript_shell_is_an_error(server):
+    scraper = TCGPlayerScraper()
+    scraper.api_enabled = False
+    scraper.search_url_template = JS_SEARCH_URL
+    scraper.fallback_search_url_templates = ()
+    route_to_mock(scraper, server.url)
+
+    with pytest.raises(RuntimeError, match="render_mode"):
+        scraper.search("charizard")
+
+
+def test_context_is_recycled_after_max_uses(pool):
+    for _ in range(3):
+        page = render_shell(pool)
+        assert page.status == 200
+        assert "product-card" in page.html or "search-result" in page.html
+
+    assert pool.pages_rendered == 3
+    assert pool.contexts_recycled == 1
+
+
+def test_browser_is_relaunched_after_it_dies(pool):
+    asyncio.run_coroutine_threadsafe(pool._browser.close(), pool._loop).result()
+
+    page = render_shell(pool)
+
+    assert pool.browsers_relaunched == 1
+    assert "Charizard" in page.html
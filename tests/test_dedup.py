@@ -0,0 +1,95 @@
+from __future__ import annotations
+
+import pytest
+
+from collector_scraper.utils.dedup import MinHashDeduplicator, normalize_title
+
+TITLE = "Charizard 4/102 Holo Rare Base Set Unlimited"
+
+
+def listing(source: str, price=100.0, currency="USD", title: str = TITLE):
+    return {"source": source, "product_name": title, "price": price, "currency": currency}
+
+
+def test_normalize_title():
+    assert normalize_title("  Charizard-EX (Holo)!! ") == "charizard ex holo"
+    assert normalize_title(None) == ""
+
+
+def test_signature_is_deterministic_and_similarity_tracks_titles():
+    dedup = MinHashDeduplicator()
+
+    same = dedup.signature(TITLE)
+    reworded = dedup.signature(TITLE.upper() + "!")
+    other = dedup.signature("Blastoise 2/102 Holo Rare Base Set Unlimited")
+
+    assert same == MinHashDeduplicator().signature(TITLE)
+    assert dedup.similarity(same, reworded) == 1.0
+    assert dedup.similarity(same, other) < dedup.threshold
+    assert dedup.signature("") == ()
+
+
+def test_merges_near_duplicates_across_sources():
+    dedup = MinHashDeduplicator()
+    items = [
+        listing("ebay"),
+        listing("tcgplayer", price=102.0, title="Charizard 4/102 Holo Rare - Base Set Unlimited"),
+        listing("cardmarket", title="Blastoise 2/102 Holo Rare Base Set Unlimited"),
+    ]
+
+    kept, merged = dedup.dedupe(items)
+
+    assert merged == 1
+    assert kept == [items[0], items[2]]
+
+
+def test_never_merges_listings_from_the_same_source():
+    kept, merged = MinHashDeduplicator().dedupe([listing("ebay"), listing("ebay")])
+
+    assert merged == 0
+    assert len(kept) == 2
+
+
+def test_never_merges_different_currencies():
+    kept, merged = MinHashDeduplicator().dedupe(
+        [listing("ebay", currency="USD"), listing("toysonfire", currency="inr")]
+    )
+
+    assert merged == 0
+    assert len(kept) == 2
+
+
+@pytest.mark.parametrize("currency", [None, "", "UNKNOWN", "usd"])
+def test_missing_or_matching_currency_still_merges(currency):
+    kept, merged = MinHashDeduplicator().dedupe(
+        [listing("ebay", currency="USD"), listing("tcgplayer", currency=currency)]
+    )
+
+    assert merged == 1
+    assert len(kept) == 1
+
+
+def test_respects_price_tolerance():
+    items = [listing("ebay", price=100.0), listing("tcgplayer", price=120.0)]
+
+    assert MinHashDeduplicator().dedupe(items)[1] == 0
+    assert MinHashDeduplicator(price_tolerance=0.25).dedupe(items)[1] == 1
+    assert MinHashDeduplicator(price_tolerance=None).dedupe(items)[1] == 1
+
+
+def test_unparseable_prices_only_match_when_equal():
+    dedup = MinHashDeduplicator()
+
+    assert dedup.dedupe([listing("ebay", price="n/a"), listing("tcgplayer", price="n/a")])[1] == 1
+    assert dedup.dedupe([listing("ebay", price="n/a"), listing("tcgplayer", price=100.0)])[1] == 0
+
+
+def test_untitled_listings_are_kept():
+    items = [{"source": "ebay", "price": 1.0}, {"source": "tcgplayer", "price": 1.0}]
+
+    assert MinHashDeduplicator().dedupe(items) == (items, 0)
+
+
+def test_bands_must_divide_permutations():
+    with pytest.raises(ValueError):
+        MinHashDeduplicator(num_perm=64, bands=7)
@@ -0,0 +1,74 @@
+from __future__ import annotations
+
+import json
+
+import pytest
+
+from benchmarks.mock_server import MockSiteServer, route_to_mock
+from collector_scraper.core.base_scraper import FetchedResponse, ResponseTooLarge
+from collector_scraper.core.fingerprint_cache import FingerprintStore
+from collector_scraper.core.woocommerce_scraper import WooCommerceStoreScraper
+from collector_scraper.scrapers.toysonfire import ToysOnFireScraper
+
+WOO_URL = "https://beyondgaming.in/wp-json/wc/store/v1/products?search=charizard"
+
+
+@pytest.fixture
+def server():
+    with MockSiteServer() as server:
+        yield server
+
+
+def test_request_returns_capped_bytes_and_decodes_explicitly(server):
+    scraper = ToysOnFireScraper()
+    route_to_mock(scraper, server.url)
+
+    response = scraper._request(scraper.build_search_url("charizard"))
+
+    assert isinstance(response, FetchedResponse)
+    assert isinstance(response.content, bytes) and response.content
+    assert response.encoding == "utf-8"
+    assert response.text == response.content.decode("utf-8")
+
+
+def test_body_over_the_limit_is_refused(server):
+    scraper = ToysOnFireScraper()
+    scraper.max_body_bytes = 1024
+    route_to_mock(scraper, server.url)
+
+    with pytest.raises(ResponseTooLarge):
+        scraper._request(scraper.build_search_url("charizard"))
+
+
+def test_json_bodies_are_parsed_and_fingerprinted_as_bytes(server):
+    scraper = WooCommerceStoreScraper()
+    scraper.source = "beyondgaming"
+    scraper.fingerprint_store = FingerprintStore()
+    route_to_mock(scraper, server.url)
+    parses = []
+
+    def parse(body):
+        parses.append(type(body))
+        return scraper.parse_listing(json.loads(body))
+
+    first = scraper._parse_with_fingerprint(WOO_URL, scraper._fetch_bytes(WOO_URL), parse)
+    again = scraper._parse_with_fingerprint(WOO_URL, scraper._fetch_bytes(WOO_URL), parse)
+
+    assert first and again == first
+    assert parses == [bytes]  # The unchanged second fetch reused the first parse.
+
+
+@pytest.mark.parametrize(
+    ("content_type", "body", "expected"),
+    [
+        ("text/html; charset=ISO-8859-1", b"<html></html>", "iso-8859-1"),
+        ('text/html; charset="windows-1252"', b"", "windows-1252"),
+        ("text/html", b'<html><head><meta charset="shift_jis"></head>', "shift_jis"),
+        ("text/html", b'<meta http-equiv="Content-Type" content="text/html; charset=latin-1">', "latin-1"),
+        ("text/html", b"<html></html>", "utf-8"),
+        ("application/json", b'{"charset=": "koi8-r"}', "utf-8"),
+        ("text/html; charset=no-such-codec", b"", "utf-8"),
+    ],
+)
+def test_body_encoding(content_type, body, expected):
+    assert ToysOnFireScraper()._body_encoding({"Content-Type": content_type}, body) == expected
@@ -0,0 +1,148 @@
+from __future__ import annotations
+
+import json
+import os
+import time
+
+import pytest
+
+from benchmarks.mock_server import FIXTURES_DIR, MockSiteServer, route_to_mock
+from collector_scraper.core.json_api import JsonSearchApiMixin
+from collector_scraper.scrapers.cardmarket import CardmarketScraper
+from collector_scraper.scrapers.tcgplayer import TCGPlayerScraper
+
+CARDMARKET_CREDENTIALS = ("app_token", "app_secret", "access_token", "access_token_secret")
+
+
+def load_fixture(name: str):
+    with open(os.path.join(FIXTURES_DIR, name), "r", encoding="utf-8") as handle:
+        return json.load(handle)
+
+
+@pytest.fixture
+def server():
+    with MockSiteServer() as server:
+        yield server
+
+
+@pytest.fixture
+def no_cardmarket_env(monkeypatch):
+    for name in CARDMARKET_CREDENTIALS:
+        monkeypatch.delenv(f"CARDMARKET_{name.upper()}", raising=False)
+
+
+def test_search_api_is_abstract():
+    class NoApiScraper(JsonSearchApiMixin):
+        def parse_listing(self, payload):
+            return []
+
+    with pytest.raises(TypeError):
+        NoApiScraper()
+
+
+def test_tcgplayer_parse_api_page():
+    payload = load_fixture("tcgplayer/api_search.json")
+    products = payload["results"][0]["results"]
+
+    page = TCGPlayerScraper().parse_api_page(payload)
+
+    assert len(page.items) == len(products)
+    assert page.total_pages == 1  # 24 results at 24 per page.
+    first, product = page.items[0], products[0]
+    assert first["product_name"].startswith(product["productName"])
+    assert first["price"] == product["lowestPriceWithShipping"]
+    assert first["market_price"] == product["marketPrice"]
+    assert first["currency"] == "USD"
+    assert first["url"] == f"https://www.tcgplayer.com/product/{int(product['productId'])}/pokemon-{product['productUrlName']}"
+
+
+def test_tcgplayer_parse_api_listing_skips_unpriced_products():
+    payload = load_fixture("tcgplayer/api_search.json")
+    products = payload["results"][0]["results"]
+    for key in ("marketPrice", "lowestPrice", "lowestPriceWithShipping"):
+        products[0][key] = None
+
+    items = TCGPlayerScraper().parse_api_listing(payload)
+
+    assert len(items) == len(products) - 1
+
+
+def test_cardmarket_parse_api_listing():
+    payload = load_fixture("cardmarket/api_find.json")
+    products = payload["product"]
+
+    items = CardmarketScraper().parse_api_listing(payload)
+
+    assert len(items) == len(products)
+    first, guide = items[0], products[0]["priceGuide"]
+    assert first["product_name"].startswith(products[0]["enName"])
+    assert first["price"] == guide["LOW"]
+    assert first["market_price"] == guide["TREND"]
+
+
+@pytest.mark.parametrize("scraper_class", [TCGPlayerScraper, CardmarketScraper])
+@pytest.mark.parametrize("payload", [None, [], {"errors": ["bad request"]}, {"results": "nope", "product": "nope"}])
+def test_parse_api_listing_rejects_unexpected_payloads(scraper_class, payload):
+    with pytest.raises(ValueError):
+        scraper_class().parse_api_listing(payload)
+
+
+def test_tcgplayer_search_uses_api(server):
+    scraper = TCGPlayerScraper()
+    route_to_mock(scraper, server.url)
+
+    items = scraper.search("charizard")
+
+    assert items
+    assert all("charizard" in item["product_name"].lower() for item in items)
+    assert all(item.get("market_price") for item in items)
+    assert scraper.last_api_error is None
+
+
+def test_tcgplayer_api_failure_falls_back_to_html(server):
+    scraper = TCGPlayerScraper()
+    scraper.api_url_template = "https://mp-search-api.tcgplayer.com/v1/missing?q={query}"
+    route_to_mock(scraper, server.url)
+
+    items = scraper.search("charizard")
+
+    assert items
+    assert all("market_price" not in item for item in items)  # Parsed from the HTML grid.
+    assert scraper.last_api_error
+    assert scraper._api_retry_at > time.monotonic()
+
+
+def test_tcgplayer_skips_api_until_retry_time(server):
+    scraper = TCGPlayerScraper()
+    route_to_mock(scraper, server.url)
+    scraper._api_retry_at = time.monotonic() + 60
+
+    items = scraper.search("charizard")
+
+    assert items
+    assert all("market_price" not in item for item in items)
+
+
+def test_cardmarket_without_credentials_uses_html(server, no_cardmarket_env):
+    scraper = CardmarketScraper()
+    route_to_mock(scraper, server.url)
+
+    items = scraper.search("charizard")
+
+    assert items
+    assert all("market_price" not in item for item in items)
+    assert scraper.last_api_error is None
+    assert scraper._api_retry_at == 0.0
+
+
+def test_cardmarket_with_credentials_uses_api(server, no_cardmarket_env):
+    scraper = CardmarketScraper()
+    for name in CARDMARKET_CREDENTIALS:
+        setattr(scraper, f"api_{name}", name)
+    route_to_mock(scraper, server.url)
+
+    items = scraper.search("charizard")
+
+    assert items
+    assert all("charizard" in item["product_name"].lower() for item in items)
+    assert all(item.get("market_price") for item in items)
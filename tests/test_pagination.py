@@ -0,0 +1,126 @@
+from __future__ import annotations
+
+import threading
+
+from collector_scraper.core.pagination import (
+    PageResult,
+    Paginator,
+    current_result_limit,
+    result_limit_scope,
+)
+
+
+def page_of(page: int, count: int = 10, prefix: str = "charizard"):
+    return [
+        {"product_name": f"{prefix} {page}-{index}", "url": f"https://shop.example/{prefix}/{page}/{index}", "price": 1.0}
+        for index in range(count)
+    ]
+
+
+class FakeSite:
+    """Serves ``pages`` (1-based) and records which ones were requested."""
+
+    def __init__(self, pages, total_pages=None, failing=()):
+        self.pages = pages
+        self.total_pages = total_pages
+        self.failing = set(failing)
+        self.requested = []
+        self._lock = threading.Lock()
+
+    def __call__(self, page: int) -> PageResult:
+        with self._lock:
+            self.requested.append(page)
+        if page in self.failing:
+            raise ConnectionError(f"page {page} failed")
+        items = self.pages[page - 1] if page <= len(self.pages) else []
+        return PageResult(items=list(items), total_pages=self.total_pages)
+
+
+def test_collects_every_page_up_to_max_pages():
+    site = FakeSite([page_of(page) for page in range(1, 6)])
+
+    items = Paginator(site, max_pages=4, workers=2).collect()
+
+    assert len(items) == 40
+    assert sorted(site.requested) == [1, 2, 3, 4]
+
+
+def test_stops_on_an_empty_page():
+    site = FakeSite([page_of(1), page_of(2)])
+    paginator = Paginator(site, max_pages=10, workers=1)
+
+    items = paginator.collect()
+
+    assert len(items) == 20
+    assert site.requested == [1, 2, 3]
+    assert paginator.pages_fetched == 3
+
+
+def test_stops_on_a_failed_page_and_keeps_earlier_results():
+    site = FakeSite([page_of(page) for page in range(1, 6)], failing={2})
+
+    items = Paginator(site, max_pages=5, workers=1).collect()
+
+    assert len(items) == 10
+    assert site.requested == [1, 2]
+
+
+def test_stops_when_the_site_repeats_itself():
+    site = FakeSite([page_of(1), page_of(1), page_of(3)])
+
+    items = Paginator(site, max_pages=3, workers=1).collect()
+
+    assert len(items) == 10
+    assert site.requested == [1, 2]
+
+
+def test_stops_when_too_few_results_are_relevant():
+    site = FakeSite([page_of(1), page_of(2, prefix="pikachu"), page_of(3)])
+
+    def only_charizard(items):
+        return [item for item in items if "charizard" in item["product_name"]]
+
+    items = Paginator(site, max_pages=3, workers=1, relevance_filter=only_charizard).collect()
+
+    assert len(items) == 10
+    assert site.requested == [1, 2]
+
+
+def test_caps_results_and_stops_requesting_pages():
+    site = FakeSite([page_of(page) for page in range(1, 11)])
+
+    items = Paginator(site, max_pages=10, workers=2, max_results=15).collect()
+
+    assert len(items) == 15
+    assert sorted(site.requested) == [1, 2]
+
+
+def test_reported_total_pages_bounds_paging():
+    site = FakeSite([page_of(page) for page in range(1, 11)], total_pages=2)
+
+    items = Paginator(site, max_pages=10, workers=1).collect()
+
+    assert len(items) == 20
+    assert site.requested == [1, 2]
+
+
+def test_seed_counts_towards_results_and_duplicates():
+    site = FakeSite([page_of(1), page_of(2), page_of(3)])
+
+    items = Paginator(site, max_pages=3, workers=1).collect(seed=page_of(1) * 2, start_page=2)
+
+    assert len(items) == 30
+    assert site.requested == [2, 3]
+
+
+def test_result_limit_scope():
+    assert current_result_limit() is None
+    assert current_result_limit(40) == 40
+    with result_limit_scope(10):
+        assert current_result_limit() == 10
+        assert current_result_limit(40) == 10
+        assert current_result_limit(5) == 5
+        with result_limit_scope(0):
+            assert current_result_limit(40) == 40
+        assert current_result_limit() == 10
+    assert current_result_limit() is None
@@ -0,0 +1,151 @@
+from __future__ import annotations
+
+import pytest
+
+from collector_scraper.scrapers.registry import (
+    AdapterRegistry,
+    AdapterSpec,
+    IntervalThrottle,
+    SourceSelection,
+    infer_currency,
+    strip_currency_hints,
+)
+
+TARGET = "collector_scraper.scrapers.toysonfire:ToysOnFireScraper"
+
+
+def make_registry() -> AdapterRegistry:
+    return AdapterRegistry(
+        [
+            AdapterSpec("us_big", TARGET, platform="html", region="US", currency="USD", priority=0, cost=3),
+            AdapterSpec("us_cheap", TARGET, platform="shopify", region="US", currency="USD", priority=10, cost=1),
+            AdapterSpec("eu", TARGET, platform="html", region="EU", currency="EUR", priority=10, cost=2),
+            AdapterSpec("in_a", TARGET, platform="shopify", region="IN", currency="INR", priority=30, cost=1),
+            AdapterSpec("in_b", TARGET, platform="woocommerce", region="IN", currency="INR", priority=20, cost=1),
+            AdapterSpec("off", TARGET, region="US", currency="USD", cost=0, enabled=False),
+        ]
+    )
+
+
+def sources(specs):
+    return [spec.source for spec in specs]
+
+
+@pytest.mark.parametrize(
+    "query, currency",
+    [
+        ("charizard inr", "INR"),
+        ("charizard ₹", "INR"),
+        ("Charizard EUR", "EUR"),
+        ("charizard €", "EUR"),
+        ("charizard cad", "CAD"),
+        ("charizard c$", "CAD"),
+        ("charizard usd", "USD"),
+        ("charizard us$", "USD"),
+        ("charizard us promo", None),
+        ("charizard india", None),
+        ("charizard rainbow", None),  # "inr" inside a word isn't a hint.
+    ],
+)
+def test_infer_currency(query, currency):
+    assert infer_currency(query) == currency
+
+
+def test_strip_currency_hints():
+    assert strip_currency_hints("charizard inr holo") == "charizard holo"
+    assert strip_currency_hints("₹ charizard") == "charizard"
+    assert strip_currency_hints("charizard us promo") == "charizard us promo"
+    assert strip_currency_hints("inr") == "inr"
+
+
+def test_select_orders_by_cost_then_priority_and_skips_disabled():
+    assert sources(make_registry().select("charizard")) == ["us_cheap", "in_b", "in_a", "eu", "us_big"]
+
+
+def test_select_infers_currency_from_the_query():
+    registry = make_registry()
+
+    assert sources(registry.select("charizard inr")) == ["in_b", "in_a"]
+    assert sources(registry.select("charizard inr", SourceSelection(infer_from_query=False))) == [
+        "us_cheap", "in_b", "in_a", "eu", "us_big",
+    ]
+
+
+def test_inferred_currency_without_stores_keeps_every_source():
+    assert sources(make_registry().select("charizard cad")) == ["us_cheap", "in_b", "in_a", "eu", "us_big"]
+
+
+def test_explicit_currency_without_stores_selects_nothing():
+    assert make_registry().select("charizard", SourceSelection(currency="CAD")) == []
+
+
+def test_explicit_currency_wins_over_the_query():
+    assert sources(make_registry().select("charizard inr", SourceSelection(currency="EUR"))) == ["eu"]
+
+
+def test_select_filters_region_and_platforms():
+    registry = make_registry()
+
+    assert sources(registry.select("charizard", SourceSelection(region="US"))) == ["us_cheap", "us_big"]
+    assert sources(registry.select("charizard", SourceSelection(platforms=["shopify"]))) == ["us_cheap", "in_a"]
+
+
+def test_select_budget_skips_sources_that_do_not_fit():
+    registry = make_registry()
+
+    # 1 + 1 + 1 = 3; eu (2) would overshoot, and so would us_big (3).
+    assert sources(registry.select("charizard", SourceSelection(max_cost=4))) == ["us_cheap", "in_b", "in_a"]
+    assert sources(registry.select("charizard", SourceSelection(max_cost=5))) == ["us_cheap", "in_b", "in_a", "eu"]
+    assert sources(registry.select("charizard", SourceSelection(max_sources=2))) == ["us_cheap", "in_b"]
+
+
+def test_apply_config_overrides_and_adds_sources():
+    registry = make_registry()
+    registry.apply_config(
+        {
+            "sources": {
+                "eu": {"priority": 0, "settings": {"max_pages": 2}},
+                "off": {"enabled": True},
+                "new": {"target": TARGET, "currency": "CAD"},
+            }
+        }
+    )
+
+    assert registry.spec("eu").priority == 0
+    assert registry.spec("eu").settings == {"max_pages": 2}
+    assert "off" in registry.available_sources()
+    assert registry.spec("new").currency == "CAD"
+
+
+@pytest.mark.parametrize(
+    "config, message",
+    [
+        ({"sources": {"eu": {"colour": "red"}}}, "Unknown keys"),
+        ({"sources": {"new": {"currency": "CAD"}}}, "needs a 'target'"),
+    ],
+)
+def test_apply_config_rejects_bad_entries(config, message):
+    with pytest.raises(ValueError, match=message):
+        make_registry().apply_config(config)
+
+
+def test_build_applies_settings_and_throttle():
+    registry = make_registry()
+    registry.apply_config({"sources": {"eu": {"requests_per_second": 4, "settings": {"catalog_path": ":memory:"}}}})
+
+    scraper = registry.build("eu")
+
+    assert scraper.source == "eu"
+    assert scraper.catalog_path == ":memory:"
+    assert isinstance(scraper.request_throttle, IntervalThrottle)
+    assert scraper.request_throttle.interval == 0.25
+
+
+def test_build_rejects_unknown_settings_and_sources():
+    registry = make_registry()
+    registry.apply_config({"sources": {"eu": {"settings": {"no_such_setting": 1}}}})
+
+    with pytest.raises(ValueError, match="no setting"):
+        registry.build("eu")
+    with pytest.raises(ValueError, match="Unknown source"):
+        registry.build("missing")
@@ -0,0 +1,92 @@
+from __future__ import annotations
+
+from collector_scraper.utils.relevance import RelevanceEngine, tokenize
+
+
+def items(*titles: str):
+    return [{"product_name": title} for title in titles]
+
+
+def names(ranked):
+    return [item["product_name"] for item in ranked]
+
+
+def test_tokenize_normalizes_card_numbers():
+    assert tokenize("Charizard 004/102 Holo") == ["charizard", "4/102", "4", "holo"]
+    assert tokenize("#007") == ["7"]
+    assert tokenize(None) == []
+
+
+def test_card_number_outweighs_a_name_match():
+    engine = RelevanceEngine()
+
+    scores = engine.score_titles(
+        ["Charizard 4/102 Base Set", "Charizard 11/108 Evolutions", "Blastoise 2/102 Base Set"],
+        "charizard 004/102",
+    )
+
+    assert scores[0] > 0.9
+    assert 0 < scores[1] < 0.5
+    assert scores[2] == 0  # 2/102 is neither 4/102 nor #4.
+
+
+def test_query_term_no_title_contains_does_not_sink_the_batch():
+    engine = RelevanceEngine()
+
+    scores = engine.score_titles(["Charizard Holo", "Charizard Reverse Holo"], "charizard 1999")
+
+    # Counted in, the card-weighted "1999" would cap both titles at a third.
+    assert min(scores) > 0.9
+
+
+def test_stopword_only_query_still_scores():
+    engine = RelevanceEngine()
+
+    scores = engine.score_titles(["Pokemon Cards Lot", "Magic Lot"], "pokemon cards")
+
+    assert scores[0] > 0
+    assert scores[1] == 0
+
+
+def test_query_without_terms_keeps_everything():
+    assert RelevanceEngine().score_titles(["Anything", "Else"], "a") == [1.0, 1.0]
+
+
+def test_rank_orders_by_score_and_drops_irrelevant_titles():
+    engine = RelevanceEngine()
+
+    ranked = engine.rank(
+        items("Pikachu Plush", "Charizard 11/108", "Charizard 4/102 Holo", "Booster Box"),
+        "charizard 4/102",
+    )
+
+    assert names(ranked) == ["Charizard 4/102 Holo", "Charizard 11/108"]
+
+
+def test_rank_keeps_ties_in_input_order():
+    engine = RelevanceEngine()
+
+    ranked = engine.rank(items("Charizard A", "Charizard B", "Charizard C"), "charizard")
+
+    assert names(ranked) == ["Charizard A", "Charizard B", "Charizard C"]
+
+
+def test_substring_floor_keeps_titles_under_the_threshold():
+    engine = RelevanceEngine(min_score=0.99)
+
+    ranked = engine.rank(
+        items("CharizardGX Promo", "Charizard 1999 Holo", "Pikachu 1999"),
+        "charizard 1999",
+    )
+
+    # "CharizardGX" isn't a token match and "Pikachu 1999" scores under 0.99,
+    # but every title containing a query word survives the cut.
+    assert names(ranked) == ["Charizard 1999 Holo", "Pikachu 1999", "CharizardGX Promo"]
+
+
+def test_substring_floor_ignores_short_and_stop_words():
+    engine = RelevanceEngine()
+
+    assert engine.match_words("pokemon ex charizard") == ["charizard"]
+    assert engine.match_words("pokemon cards") == ["pokemon", "cards"]
+    assert names(engine.rank(items("Exeggutor", "Pokemon Binder"), "pokemon ex charizard")) == []
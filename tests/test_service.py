@@ -0,0 +1,150 @@
+from __future__ import annotations
+
+import json
+import threading
+import time
+import urllib.error
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List
+
+import pytest
+
+from collector_scraper.core.base_scraper import BaseScraper
+from collector_scraper.core.service import QueryService, ServiceBusy, build_server
+
+
+class BlockingScraper(BaseScraper):
+    """Returns ``items`` once ``release`` is set, counting calls."""
+
+    def __init__(self, source: str, items: List[Dict[str, Any]]) -> None:
+        self.source = source
+        self.items = items
+        self.release = threading.Event()
+        self.release.set()
+        self.calls = 0
+        self._lock = threading.Lock()
+
+    def search(self, query: str) -> List[Dict[str, Any]]:
+        with self._lock:
+            self.calls += 1
+        self.release.wait(5)
+        return [dict(item, source=self.source) for item in self.items]
+
+    def parse_listing(self, payload: Any) -> List[Dict[str, Any]]:
+        return []
+
+
+CHARIZARD = {"product_name": "Charizard Base Set", "price": 350.0, "url": "a/1", "currency": "USD"}
+
+
+@pytest.fixture
+def scraper():
+    return BlockingScraper("shop", [CHARIZARD])
+
+
+def wait_until(condition, timeout: float = 5.0) -> None:
+    deadline = time.monotonic() + timeout
+    while not condition():
+        assert time.monotonic() < deadline, "timed out"
+        time.sleep(0.01)
+
+
+def test_identical_queries_share_one_scrape(scraper):
+    service = QueryService(scrapers=[scraper])
+    scraper.release.clear()
+
+    with ThreadPoolExecutor(max_workers=3) as executor:
+        futures = [executor.submit(service.search, query) for query in ("Charizard", "charizard ", " CHARIZARD")]
+        wait_until(lambda: scraper.calls == 1 and len(service._inflight) == 1)
+        time.sleep(0.05)  # Let the followers join the flight.
+        scraper.release.set()
+        outcomes = [future.result() for future in futures]
+
+    assert scraper.calls == 1
+    assert sorted(status for _, status in outcomes) == ["coalesced", "coalesced", "miss"]
+    assert service.search("charizard")[1] == "hit"
+    assert scraper.calls == 1
+
+
+def test_expired_results_are_scraped_again(scraper):
+    service = QueryService(scrapers=[scraper], ttl_seconds=0.0)
+
+    service.search("charizard")
+    time.sleep(0.01)
+
+    assert service.search("charizard")[1] == "miss"
+    assert scraper.calls == 2
+
+
+def test_cache_keeps_at_most_max_cached_results(scraper):
+    service = QueryService(scrapers=[scraper], max_cached=2)
+
+    for query in ("charizard", "blastoise", "venusaur"):
+        service.search(query)
+
+    assert len(service._cache) == 2
+    assert service.search("charizard")[1] == "miss"  # Oldest was dropped.
+
+
+def test_distinct_scrapes_over_the_cap_are_refused(scraper):
+    service = QueryService(scrapers=[scraper], max_inflight=1)
+    scraper.release.clear()
+    leader = threading.Thread(target=service.search, args=("charizard",))
+    leader.start()
+    wait_until(lambda: scraper.calls == 1)
+
+    with pytest.raises(ServiceBusy):
+        service.search("blastoise")
+    scraper.release.set()
+    leader.join()
+
+
+def test_unknown_source_is_rejected(scraper):
+    with pytest.raises(ValueError, match="Unknown sources"):
+        QueryService(scrapers=[scraper]).search("charizard", sources=["nowhere"])
+
+
+def get(server, path: str):
+    url = f"http://127.0.0.1:{server.server_address[1]}{path}"
+    try:
+        with urllib.request.urlopen(url, timeout=10) as response:
+            return response.status, json.loads(response.read())
+    except urllib.error.HTTPError as exc:
+        return exc.code, json.loads(exc.read())
+
+
+@pytest.fixture
+def http_server():
+    servers = []
+
+    def start(service: QueryService):
+        server = build_server(service, port=0)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        servers.append(server)
+        return server
+
+    yield start
+    for server in servers:
+        server.shutdown()
+        server.server_close()
+
+
+def test_http_search_returns_json(scraper, http_server):
+    server = http_server(QueryService(scrapers=[scraper]))
+
+    status, payload = get(server, "/search?q=charizard")
+
+    assert status == 200
+    assert [item["url"] for item in payload["items"]] == ["a/1"]
+    assert get(server, "/search")[0] == 400
+
+
+def test_http_unexpected_error_is_a_json_500(http_server):
+    unserializable = BlockingScraper("shop", [dict(CHARIZARD, seen_at={1})])
+    server = http_server(QueryService(scrapers=[unserializable]))
+
+    status, payload = get(server, "/search?q=charizard")
+
+    assert status == 500
+    assert payload["error"].startswith("TypeError")
@@ -0,0 +1,70 @@
+from __future__ import annotations
+
+import pytest
+
+from benchmarks.mock_server import MockSiteServer, route_to_mock
+from collector_scraper.core.orchestrator import run_all_scrapers
+from collector_scraper.core.shopify_scraper import ShopifyStore, ShopifyStoreEngine
+
+
+@pytest.fixture
+def server():
+    with MockSiteServer() as server:
+        yield server
+
+
+def make_engine(server, count: int, failing: tuple = ()) -> ShopifyStoreEngine:
+    engine = ShopifyStoreEngine(
+        [ShopifyStore(f"store{index}", f"https://store{index}.example") for index in range(count)]
+    )
+    route_to_mock(engine, server.url)
+    for scraper in engine.store_scrapers():
+        if scraper.source in failing:
+            scraper._request = _refuse
+    return engine
+
+
+def _refuse(url, *args, **kwargs):
+    raise ConnectionError(f"refused: {url}")
+
+
+def run(engine: ShopifyStoreEngine, max_results_per_site: int = 40):
+    return run_all_scrapers(
+        "charizard",
+        scrapers=[engine],
+        max_results_per_site=max_results_per_site,
+        relevance=None,
+        deduplicator=None,
+    )
+
+
+def test_each_store_is_capped_and_timed_separately(server):
+    result = run(make_engine(server, 5), max_results_per_site=4)
+
+    assert len(result.items) == 5 * 4
+    assert sorted(result.capped_sources) == [f"store{index}" for index in range(5)]
+    assert sorted(result.durations_ms) == [f"store{index}" for index in range(5)]
+    assert not result.errors
+
+
+def test_failed_store_is_reported_under_its_own_source(server):
+    result = run(make_engine(server, 3, failing=("store1",)))
+
+    assert [error["source"] for error in result.errors] == ["store1"]
+    assert {item["source"] for item in result.items} == {"store0", "store2"}
+
+
+def test_engine_search_raises_when_every_store_fails(server):
+    engine = make_engine(server, 2, failing=("store0", "store1"))
+
+    with pytest.raises(RuntimeError, match="every store failed"):
+        engine.search("charizard")
+
+
+def test_engine_search_keeps_results_of_stores_that_answered(server):
+    engine = make_engine(server, 2, failing=("store0",))
+
+    items = engine.search("charizard")
+
+    assert items
+    assert {item["source"] for item in items} == {"store1"}
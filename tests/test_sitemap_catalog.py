@@ -0,0 +1,69 @@
+from __future__ import annotations
+
+import time
+
+import pytest
+
+from benchmarks.mock_server import MockSiteServer, route_to_mock
+from collector_scraper.scrapers.toysonfire import ToysOnFireScraper
+
+CATALOG_ITEM = {
+    "source": "toysonfire",
+    "product_name": "Charizard Catalog Only Listing",
+    "price": 1.0,
+    "currency": "INR",
+    "url": "https://toysonfire.example/products/catalog-only",
+}
+
+
+@pytest.fixture
+def server():
+    with MockSiteServer() as server:
+        yield server
+
+
+def make_scraper(server, completed_ago: float | None) -> ToysOnFireScraper:
+    scraper = ToysOnFireScraper()
+    scraper.catalog_path = ":memory:"
+    route_to_mock(scraper, server.url)
+    catalog = scraper.get_catalog()
+    catalog.upsert(scraper.source, [("catalog-only", CATALOG_ITEM)], seen_at=time.time())
+    if completed_ago is not None:
+        catalog.mark_synced(scraper.source, time.time() - completed_ago, full=True, complete=True)
+    return scraper
+
+
+def test_fresh_complete_crawl_serves_the_catalog(server):
+    scraper = make_scraper(server, completed_ago=3600)
+
+    items = scraper.search("charizard")
+
+    assert scraper.catalog_ready()
+    assert [item["product_name"] for item in items] == [CATALOG_ITEM["product_name"]]
+
+
+def test_incomplete_crawl_searches_live(server):
+    scraper = make_scraper(server, completed_ago=None)
+
+    items = scraper.search("charizard")
+
+    assert not scraper.catalog_ready()
+    assert items
+    assert CATALOG_ITEM["product_name"] not in {item["product_name"] for item in items}
+
+
+def test_old_complete_crawl_searches_live(server):
+    scraper = make_scraper(server, completed_ago=ToysOnFireScraper.catalog_max_age_seconds + 60)
+
+    items = scraper.search("charizard")
+
+    assert not scraper.catalog_ready()
+    assert items
+    assert CATALOG_ITEM["product_name"] not in {item["product_name"] for item in items}
+
+
+def test_zero_max_age_trusts_any_complete_crawl(server):
+    scraper = make_scraper(server, completed_ago=30 * 86400)
+    scraper.catalog_max_age_seconds = 0
+
+    assert scraper.catalog_ready()
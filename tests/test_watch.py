@@ -0,0 +1,95 @@
+from __future__ import annotations
+
+import time
+from typing import Any, Dict, List
+
+from collector_scraper.core.base_scraper import BaseScraper
+from collector_scraper.core.orchestrator import OrchestrationResult, run_all_scrapers
+from collector_scraper.core.watch import MemorySink, SnapshotStore, Watcher, compute_events
+
+
+class FixedScraper(BaseScraper):
+    def __init__(self, source: str, items: List[Dict[str, Any]], delay: float = 0.0) -> None:
+        self.source = source
+        self.items = items
+        self.delay = delay
+
+    def search(self, query: str) -> List[Dict[str, Any]]:
+        time.sleep(self.delay)
+        return [dict(item, source=self.source) for item in self.items]
+
+    def parse_listing(self, payload: Any) -> List[Dict[str, Any]]:
+        return []
+
+
+def listing(name: str, price: float, url: str) -> Dict[str, Any]:
+    return {"product_name": name, "price": price, "url": url, "currency": "USD", "price_type": "listing"}
+
+
+def result_of(*items: Dict[str, Any], **fields: Any) -> OrchestrationResult:
+    return OrchestrationResult(query="charizard", items=list(items), **fields)
+
+
+SHARED = [
+    listing("Charizard Base Set 4/102 Holo", 350.0, "{source}/charizard-base"),
+    listing("Charizard Celebrations 4/102 Classic", 40.0, "{source}/charizard-celebrations"),
+]
+
+
+def scrapers(first: str, second: str) -> List[FixedScraper]:
+    def items(source: str) -> List[Dict[str, Any]]:
+        return [dict(item, url=item["url"].format(source=source)) for item in SHARED]
+
+    # ``first`` answers straight away, ``second`` a little later.
+    return [FixedScraper(second, items(second), delay=0.05), FixedScraper(first, items(first))]
+
+
+def test_same_listings_in_another_completion_order_give_no_events():
+    previous = run_all_scrapers("charizard", scrapers=scrapers("alpha", "beta"))
+    current = run_all_scrapers("charizard", scrapers=scrapers("beta", "alpha"))
+
+    assert previous.duplicates_merged == current.duplicates_merged == len(SHARED)
+    assert compute_events(previous, current) == []
+
+
+def test_new_removed_and_repriced_listings():
+    kept = listing("Charizard Base Set", 350.0, "a/1")
+    previous = result_of(dict(kept, source="a"), dict(listing("Blastoise", 90.0, "a/2"), source="a"))
+    current = result_of(
+        dict(kept, source="a", price=380.0), dict(listing("Venusaur", 60.0, "a/3"), source="a")
+    )
+
+    kinds = sorted(event.kind for event in compute_events(previous, current, observed_at=1.0))
+
+    assert kinds == ["new", "price_up", "removed"]
+
+
+def test_failed_source_reports_no_removals():
+    previous = result_of(dict(listing("Charizard", 350.0, "a/1"), source="a"))
+    current = result_of(errors=[{"source": "a", "error": "timed out"}])
+
+    assert compute_events(previous, current) == []
+
+
+def test_capped_source_reports_new_listings_but_no_removals():
+    previous = result_of(dict(listing("Charizard", 350.0, "a/1"), source="a"))
+    current = result_of(dict(listing("Charizard Promo", 20.0, "a/2"), source="a"), capped_sources=["a"])
+
+    events = compute_events(previous, current)
+
+    assert [(event.kind, event.url) for event in events] == [("new", "a/2")]
+
+
+def test_watcher_carries_failed_source_listings_forward():
+    sink = MemorySink()
+    watcher = Watcher(SnapshotStore(), [sink])
+    charizard = dict(listing("Charizard", 350.0, "a/1"), source="a")
+    pikachu = dict(listing("Pikachu", 5.0, "b/1"), source="b")
+    first = result_of(charizard, pikachu)
+    failed = result_of(pikachu, errors=[{"source": "a", "error": "timed out"}])
+    recovered = result_of(charizard, pikachu)
+
+    assert watcher.observe(first) == []
+    assert watcher.observe(failed) == []
+    assert watcher.observe(recovered) == []
+    assert sink.events == []
@@ -0,0 +1,67 @@
+from __future__ import annotations
+
+import threading
+
+import pytest
+
+from benchmarks.mock_server import MockSiteServer, route_to_mock
+from collector_scraper.scrapers.beyondgaming import BeyondGamingScraper
+
+
+@pytest.fixture
+def server():
+    with MockSiteServer() as server:
+        yield server
+
+
+@pytest.fixture
+def scraper(server):
+    scraper = BeyondGamingScraper()
+    scraper.mirror_path = ":memory:"
+    route_to_mock(scraper, server.url)
+    yield scraper
+    scraper.get_mirror().close()
+
+
+def _refuse(url, *args, **kwargs):
+    raise ConnectionError(f"refused: {url}")
+
+
+def wait_for_refresh(scraper) -> None:
+    for thread in threading.enumerate():
+        if thread.name == f"mirror-{scraper.source}":
+            thread.join()
+
+
+def test_first_search_goes_live_and_syncs_in_background(scraper):
+    assert scraper.search("charizard")  # Nothing mirrored yet: answered live.
+
+    wait_for_refresh(scraper)
+    last_sync, last_full_sync = scraper.get_mirror().sync_state(scraper.source)
+    assert last_sync == last_full_sync > 0
+    scraper._request = _refuse
+    assert scraper.search("charizard")
+
+
+def test_fresh_mirror_answers_without_requests(scraper):
+    scraper.refresh_mirror(force_full=True)
+    scraper._request = _refuse
+
+    assert scraper.search("charizard")
+    assert scraper.start_mirror_refresh() is not None
+    wait_for_refresh(scraper)
+    assert scraper.last_mirror_error is None  # Not due, so nothing was fetched.
+
+
+def test_failed_refresh_serves_stale_mirror_and_backs_off(scraper):
+    scraper.refresh_mirror(force_full=True)
+    expected = scraper.search("charizard")
+    scraper.mirror_refresh_seconds = 0.0
+    scraper._request = _refuse
+
+    refresher = scraper.start_mirror_refresh()
+    refresher.join()
+
+    assert scraper.last_mirror_error.startswith("ConnectionError")
+    assert scraper.start_mirror_refresh() is None  # Waits mirror_retry_seconds.
+    assert scraper.search("charizard") == expected
@@ -0,0 +1,139 @@
+from __future__ import annotations
+
+import threading
+from typing import Any, Dict, List
+
+import pytest
+
+from collector_scraper.core.base_scraper import BaseScraper
+from collector_scraper.core.work_queue import (
+    BrokerError,
+    HTTPBroker,
+    QueueWorker,
+    SQLiteBroker,
+    TaskResult,
+    build_broker_server,
+    gather_result,
+)
+
+
+class FixedScraper(BaseScraper):
+    def __init__(self, source: str, items: List[Dict[str, Any]] | None = None, error: str | None = None) -> None:
+        self.source = source
+        self.items = items or []
+        self.error = error
+
+    def search(self, query: str) -> List[Dict[str, Any]]:
+        if self.error:
+            raise RuntimeError(self.error)
+        return [dict(item, source=self.source) for item in self.items]
+
+    def parse_listing(self, payload: Any) -> List[Dict[str, Any]]:
+        return []
+
+
+@pytest.fixture
+def broker(tmp_path):
+    return SQLiteBroker(str(tmp_path / "queue.sqlite3"))
+
+
+@pytest.fixture
+def remote(broker):
+    server = build_broker_server(broker, port=0, token="secret")
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}"
+    server.shutdown()
+    server.server_close()
+
+
+def result(task, items=()) -> TaskResult:
+    return TaskResult(task.source, task.sold, list(items), None, 5)
+
+
+def test_expired_lease_goes_to_next_worker_and_stale_result_is_rejected(broker):
+    broker.enqueue("charizard", ["ebay"])
+    first = broker.claim("worker-1", lease_seconds=-1)  # Expires at once.
+    second = broker.claim("worker-2", lease_seconds=60)
+
+    assert second.id == first.id and second.attempts == 2
+    assert not broker.complete(first, result(first), "worker-1")
+    assert not broker.renew(first, 60)
+    assert broker.complete(second, result(second), "worker-2")
+    assert broker.claim("worker-3", lease_seconds=60) is None
+
+
+def test_lease_expiring_on_last_attempt_fails_the_task(broker):
+    batch_id = broker.enqueue("charizard", ["ebay"], max_attempts=1)
+    broker.claim("worker-1", lease_seconds=-1)
+
+    assert broker.claim("worker-2", lease_seconds=60) is None
+    finished, results = broker.batch_results(batch_id)
+    assert finished
+    assert "lease expired" in results[0].error
+
+
+def test_failed_task_is_retried_after_delay_then_fails(broker):
+    batch_id = broker.enqueue("charizard", ["ebay"], max_attempts=2)
+    task = broker.claim("worker-1", 60)
+    assert broker.fail(task, "boom", retry_delay=60)
+    assert broker.claim("worker-1", 60) is None  # Not due yet.
+
+    broker.fail(task, "boom", retry_delay=0)  # Stale token: ignored.
+    broker._connection().execute("UPDATE tasks SET available_at = 0")
+    retry = broker.claim("worker-1", 60)
+    assert retry.attempts == 2
+    assert broker.fail(retry, "boom again", retry_delay=0)
+
+    finished, results = broker.batch_results(batch_id)
+    assert finished
+    assert results[0].error == "boom again"
+
+
+def test_host_slots_are_spaced_by_interval(broker):
+    delays = [broker.reserve_slot("example.com", 10.0) for _ in range(3)]
+
+    assert delays[0] == pytest.approx(0.0, abs=0.5)
+    assert delays[1] == pytest.approx(10.0, abs=0.5)
+    assert delays[2] == pytest.approx(20.0, abs=0.5)
+    assert broker.reserve_slot("other.example", 10.0) == pytest.approx(0.0, abs=0.5)
+
+
+def test_workers_retry_errors_and_batch_is_merged(broker):
+    items = [{"product_name": "Charizard Base Set", "price": 350.0, "url": "a/1", "currency": "USD"}]
+    batch_id = broker.enqueue("charizard", ["good", "bad"], max_results_per_site=1, max_attempts=2)
+    worker = QueueWorker(
+        broker,
+        scrapers=[FixedScraper("good", items), FixedScraper("bad", error="timed out")],
+        retry_backoff_seconds=0.0,
+        default_host_interval=0.0,
+    )
+
+    while worker.run_once():
+        pass
+    merged = gather_result(broker, batch_id, "charizard")
+
+    assert [item["source"] for item in merged.items] == ["good"]
+    assert merged.capped_sources == ["good"]
+    assert merged.errors == [{"source": "bad", "error": "timed out"}]
+
+
+def test_http_broker_shares_queue_and_host_slots(broker, remote):
+    client = HTTPBroker(remote, token="secret")
+    batch_id = client.enqueue("charizard", ["ebay"])
+
+    task = client.claim("remote-1", 60)
+    assert task.source == "ebay"
+    assert broker.claim("local-1", 60) is None  # Leased through the server.
+    assert client.renew(task, 60)
+    assert client.complete(task, result(task, [{"product_name": "Charizard", "price": 1.0}]), "remote-1")
+    finished, results = client.batch_results(batch_id)
+    assert finished and results[0].items[0]["product_name"] == "Charizard"
+
+    assert client.reserve_slot("example.com", 10.0) == pytest.approx(0.0, abs=0.5)
+    assert broker.reserve_slot("example.com", 10.0) == pytest.approx(10.0, abs=0.5)
+
+
+def test_http_broker_rejects_wrong_token(remote):
+    with pytest.raises(BrokerError, match="401"):
+        HTTPBroker(remote, token="wrong").queue_depth()